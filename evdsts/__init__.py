@@ -1,3 +1,4 @@
+from evdsts.base.async_connecting import AsyncConnector
 from evdsts.base.connecting import Connector
 from evdsts.base.indexing import IndexBuilder
 from evdsts.base.transforming import Transformator
\ No newline at end of file
@@ -0,0 +1,926 @@
+"""evdsts AsyncConnector Class"""
+
+__author__ = "Burak CELIK"
+__copyright__ = "Copyright (c) 2022 Burak CELIK"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__internal__ = "0.0.1"
+
+
+import asyncio
+import ssl
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+import pandas as pd
+
+from evdsts.base.caching import ResponseCache
+from evdsts.base.cataloging import CatalogStore
+from evdsts.base.connecting import Connector
+from evdsts.base.limiting import RateLimiter
+from evdsts.base.retrying import RetryPolicy
+from evdsts.base.storing import SeriesStore
+from evdsts.configuration.exceptions import (
+    AmbiguousOutputTypeException,
+    APIServiceConnectionException,
+    OptionalPackageRequiredException,
+    UnknownTimeSeriesIdentifierException,
+)
+from evdsts.configuration.types import JSONType
+from evdsts.utils.general import load_json, load_series_frame
+from evdsts.utils.time_series import find_current_date
+
+try:
+    import httpx
+except ModuleNotFoundError:
+    httpx = None
+
+
+class AsyncConnector(Connector):
+    """TCMB (CBRT) EVDS (EDDS) API Service Asynchronous Connector Class.
+
+    Mirrors the public API of Connector with awaitable get_main_categories, get_sub_categories,
+    get_groups, get_series and get_series_batch methods. Requests are sent over a non-blocking
+    HTTP client (httpx) and the responses are processed exactly the same way as Connector does.
+    """
+
+    def __init__(
+        self,
+        key: str | None = None,
+        language: str = "TR",
+        show_links: bool = False,
+        proxy_servers: dict[str, str] | None = None,
+        verify_certificates: bool = True,
+        secure: bool = True,
+        jupyter_mode: bool = False,
+        precision: int | None = None,
+        cache: ResponseCache | None = None,
+        max_concurrent_requests: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        store: SeriesStore | None = None,
+        max_series_per_request: int | None = None,
+        max_observations_per_request: int | None = None,
+        parallel_chunks: bool = False,
+        timeout: tuple[float, float] | None = None,
+        catalog: CatalogStore | None = None,
+        pool_size: int | None = None,
+        pool_block: bool | None = None,
+        compression: bool = True,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        """EVDS (EDDS) API Service Asynchronous Connection Interface.
+
+        Takes the same parameters as Connector. Main categories are not retrieved while
+        instantiation but on the first awaited call that needs them.
+
+        Raises:
+            - OptionalPackageRequiredException: If 'httpx' package is not installed.
+        """
+
+        if httpx is None:
+            raise OptionalPackageRequiredException(
+                "\nAsyncConnector requires 'httpx' package to be installed.\n\n"
+                "for pip users: pip install httpx\n\n"
+                "for Anaconda or Miniconda users: conda install httpx\n\n"
+                "or install evdsts with async extras: pip install evdsts[async]"
+            )
+
+        self._client: httpx.AsyncClient | None = None
+        self._request_semaphore: asyncio.Semaphore | None = None
+        self._main_categories_lock: asyncio.Lock | None = None
+        self._first_request_async_lock: asyncio.Lock | None = None
+        self._requests_sent: int = 0
+        self._connections_opened: int = 0
+
+        super().__init__(
+            key=key,
+            language=language,
+            show_links=show_links,
+            proxy_servers=proxy_servers,
+            verify_certificates=verify_certificates,
+            secure=secure,
+            jupyter_mode=jupyter_mode,
+            precision=precision,
+            cache=cache,
+            max_concurrent_requests=max_concurrent_requests,
+            rate_limiter=rate_limiter,
+            store=store,
+            max_series_per_request=max_series_per_request,
+            max_observations_per_request=max_observations_per_request,
+            parallel_chunks=parallel_chunks,
+            timeout=timeout,
+            catalog=catalog,
+            pool_size=pool_size,
+            pool_block=pool_block,
+            compression=compression,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+        )
+
+    async def __aenter__(self) -> "AsyncConnector":
+
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+
+        await self.aclose()
+
+    def _language_changed(self, language: str) -> None:
+        """Variables that must be reloaded when the language is changed.
+
+        Args:
+            - language (str): selected language
+        """
+
+        # main categories are loaded on demand since it's not possible to await here.
+        self.main_categories = None
+        self.search_engine.language = language
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Returns the HTTP client creating it for the first call"""
+
+        if self._client is not None:
+            return self._client
+
+        verify: bool | ssl.SSLContext = self.verify_certificates
+        if self.secure:
+            context: ssl.SSLContext = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+            context.options |= 0x4
+            if not self.verify_certificates:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            verify = context
+
+        mounts: dict[str, httpx.AsyncHTTPTransport] = {
+            scheme.rstrip(":/") + "://": httpx.AsyncHTTPTransport(proxy=proxy, verify=verify)
+            for scheme, proxy in self.proxy_servers.items()
+        }
+        # httpx always waits for a pooled connection (pool_block).
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size if self.keep_alive else 0,
+        )
+
+        self._client = httpx.AsyncClient(
+            verify=verify,
+            timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+            limits=limits,
+            mounts=mounts or None,
+            headers=self._connection_headers(),
+        )
+
+        return self._client
+
+    async def _trace(self, event: str, info: dict[str, Any]) -> None:
+        """Counts the connections opened by the HTTP client (httpcore trace extension)"""
+
+        if event == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Returns the semaphore that limits the number of concurrent requests"""
+
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        return self._request_semaphore
+
+    async def _ensure_main_categories(self) -> None:
+        """Loads main categories if they're not loaded yet"""
+
+        # the main_categories property would retrieve them blocking the event loop.
+        if self._main_categories is not None:
+            return
+
+        if self._main_categories_lock is None:
+            self._main_categories_lock = asyncio.Lock()
+
+        async with self._main_categories_lock:
+            if self._main_categories is None:
+                self.main_categories = await self._aget_main_categories()
+
+    async def _aget_main_categories(self) -> pd.DataFrame:
+        """Returns main categories of EVDS Service Database.
+
+        Returns:
+           - DataFrame: Main categories of EVDS database.
+        """
+
+        # the response can be kept on the disk, keep the event loop free.
+        response: bytes | None = await asyncio.to_thread(self._load_main_categories_response)
+        if response is None:
+            extensions: dict[str, str] = dict(type="json")
+            response = await self._aget_metadata_response(
+                self.cfg.url_main_categories, extensions=extensions, type_="main_categories"
+            )
+            await asyncio.to_thread(self._save_main_categories_response, response)
+
+        return self._parse_main_categories(response)
+
+    async def _aget_response(
+        self,
+        url: str,
+        extensions: dict[str, str],
+        type_: str,
+        use_cache: bool = True,
+    ) -> bytes:
+        """Makes a non-blocking GET request towards the API server and returns the response given.
+
+        See Connector._get_response for the parameters.
+        """
+
+        url_extensions: str = self._generate_url_extensions(extensions)
+        api_url: str = url + url_extensions
+
+        if self.show_links:
+            print(f"request: {api_url}")
+
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            # caches can be disk based, keep the event loop free.
+            cached: bytes | None = await asyncio.to_thread(self.cache.get, url, extensions)
+            if cached is not None:
+                return cached
+
+        content: bytes | None = None
+        if self.first_request:
+            # see Connector._get_response
+            if self._first_request_async_lock is None:
+                self._first_request_async_lock = asyncio.Lock()
+            async with self._first_request_async_lock:
+                if self.first_request:
+                    content = await self._asend_request(api_url, type_)
+        if content is None:
+            content = await self._asend_request(api_url, type_)
+
+        if use_cache:
+            await asyncio.to_thread(self.cache.set, url, extensions, content)
+
+        return content
+
+    async def _asend_request(self, api_url: str, type_: str) -> bytes:
+        """Sends a non-blocking GET request to the API server, retrying it as the retry policy
+        decides.
+
+        See Connector._send_request for the parameters.
+        """
+
+        client: httpx.AsyncClient = self._get_client()
+
+        policy: RetryPolicy = self.retry_policy
+        deadline: float = policy.start()
+        attempt: int = 0
+        while True:
+            policy.check_circuit()
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+
+            last_exception: Exception | None = None
+            retry_after: float | None = None
+            try:
+                async with self._get_semaphore():
+                    self._requests_sent += 1
+                    response: httpx.Response = await client.get(
+                        api_url, headers={"key": self.api_key}, extensions={"trace": self._trace}
+                    )
+            except httpx.HTTPError as ex:
+                last_exception = ex
+                policy.record_failure()
+            else:
+                # only the retryable statuses mean the service is in trouble. EVDS answers a
+                # missing series or group and a wrong key with 500.
+                if response.status_code in policy.retry_statuses:
+                    policy.record_failure()
+                else:
+                    policy.record_success()
+                if response.status_code not in policy.retry_statuses:
+                    break
+                retry_after = await self._aretry_delay(response.status_code, response.headers)
+
+            delay: float | None = policy.next_delay(attempt, deadline, retry_after)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if last_exception is not None:
+            if isinstance(last_exception, httpx.TimeoutException):
+                reason: str = "timeout"
+            elif isinstance(last_exception, httpx.NetworkError):
+                reason = "network"
+            else:
+                reason = "unknown"
+            self._raise_connection_error(api_url, last_exception, reason)
+
+        if response.status_code == 429:
+            raise APIServiceConnectionException(
+                "EVDS API rate limit exceeded. Please wait and retry later."
+            )
+        if response.status_code in policy.retry_statuses:
+            raise APIServiceConnectionException(
+                f"EVDS API service is unavailable (status: {response.status_code}) after "
+                f"{attempt + 1} attempt(s). Please retry later."
+            )
+
+        if self.first_request and response.status_code == 500 and type_ != "main_categories":
+            await self._aconfirm_api_key()
+        self._check_response(response.status_code, api_url, type_)
+
+        return response.content
+
+    async def _aconfirm_api_key(self) -> None:
+        """Confirms the API key with a main categories request (see Connector._confirm_api_key)
+
+        Raises:
+            - WrongAPIKeyException: If the API key is wrong.
+        """
+
+        # sent directly, the first request lock is held by the request being checked.
+        api_url: str = self.cfg.url_main_categories + self._generate_url_extensions(
+            dict(type="json")
+        )
+        response: bytes = await self._asend_request(api_url, type_="main_categories")
+        await asyncio.to_thread(self._save_main_categories_response, response)
+
+    async def _aretry_delay(self, status_code: int, headers: Mapping[str, Any]) -> float | None:
+        """Returns the waiting time before a retryable response is requested again without
+        blocking the event loop.
+
+        See Connector._retry_delay for the parameters.
+        """
+
+        if status_code == 429 and self.rate_limiter is not None:
+            # hold back every request sharing the limiter, not just this one.
+            retry_after: float | None = self.retry_policy.retry_after(headers)
+            penalty: float = self.cfg.rate_limit_penalty if retry_after is None else retry_after
+            await self.rate_limiter.apenalize(penalty)
+            return penalty
+
+        return self._retry_delay(status_code, headers)
+
+    async def _aget_metadata_response(
+        self,
+        url: str,
+        extensions: dict[str, str],
+        type_: str,
+        use_cache: bool = True,
+    ) -> bytes:
+        """Returns a metadata response from the catalog store or retrieves it from the API server
+        without blocking the event loop.
+
+        See Connector._get_metadata_response for the parameters.
+        """
+
+        if self.catalog is None:
+            return await self._aget_response(
+                url, extensions=extensions, type_=type_, use_cache=use_cache
+            )
+
+        code: str = str(extensions.get("code", ""))
+        # the catalog store is disk based, keep the event loop free.
+        node: tuple[bytes, float] | None = await asyncio.to_thread(
+            self.catalog.lookup, type_, code
+        )
+        if use_cache and node is not None and self.catalog.is_fresh(node[1]):
+            return node[0]
+
+        try:
+            response: bytes = await self._aget_response(
+                url, extensions=extensions, type_=type_, use_cache=use_cache
+            )
+        except APIServiceConnectionException:
+            if node is None or not self.catalog.stale_if_error:
+                raise
+            return node[0]
+
+        await asyncio.to_thread(self.catalog.set, type_, code, response)
+
+        return response
+
+    async def _aget_child_sub_categories(
+        self,
+        parent_id: int | None,
+        use_cache: bool = True,
+        recursive: bool = False,
+        visited: set[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Returns the sub-categories of the child categories of a given category.
+
+        See Connector._get_child_sub_categories for the parameters.
+        """
+
+        visited = set() if visited is None else visited
+        child_ids: list[int] = [
+            child_id
+            for child_id in self._get_child_category_ids(parent_id)
+            if child_id not in visited
+        ]
+        visited.update(child_ids)
+
+        async def resolve(category_id: int) -> list[dict[str, Any]]:
+            response: bytes = await self._aget_metadata_response(
+                url=self.cfg.url_sub_categories,
+                extensions=dict(mode=2, code=category_id, type="json"),
+                type_="sub_categories",
+                use_cache=use_cache,
+            )
+            data: list[dict[str, Any]] = load_json(response) or []
+            if data or not recursive:
+                return data
+            return await self._aget_child_sub_categories(
+                category_id, use_cache=use_cache, recursive=True, visited=visited
+            )
+
+        # gather keeps the order of the category tree.
+        resolved: list[list[dict[str, Any]]] = await asyncio.gather(
+            *(resolve(child_id) for child_id in child_ids)
+        )
+
+        return [item for data in resolved for item in data]
+
+    async def _aget_series(
+        self,
+        series: str | Sequence[str],
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | pd.Timestamp | None = None,
+        period: str | None = None,
+        aggregations: str | list[str] | tuple[str] | None = None,
+        transformations: str | list[str] | tuple[str] | None = None,
+        keep_originals: bool = True,
+        frequency: str | int | None = None,
+        new_names: Sequence[str] | None = None,
+        keep_references: bool = False,
+        time_series: bool = True,
+        ascending: bool = True,
+        convert_to_bd: bool = True,
+        use_cache: bool = True,
+        incremental: bool = False,
+    ) -> pd.DataFrame:
+        """A dummy function for get_series"""
+
+        params, context = self._prepare_series_request(
+            series=series,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            aggregations=aggregations,
+            transformations=transformations,
+            keep_originals=keep_originals,
+            frequency=frequency,
+            new_names=new_names,
+            keep_references=keep_references,
+            time_series=time_series,
+            ascending=ascending,
+            convert_to_bd=convert_to_bd,
+        )
+
+        if incremental and time_series and not self._is_transformed(params):
+            # the store is file based, keep the event loop free.
+            plan: dict[str, Any] = await asyncio.to_thread(self._plan_incremental_request, params)
+            fresh: pd.DataFrame = pd.DataFrame()
+            if plan["params"] is not None:
+                frame, numeric = await self._afetch_series_data(plan["params"], use_cache)
+                fresh = self._parse_series_frame(
+                    frame, time_series, True, numeric=numeric, frequency=params["frequency"]
+                )
+            df: pd.DataFrame = await asyncio.to_thread(
+                self._merge_incremental_frame, plan, fresh, ascending
+            )
+
+            return self._finalize_series_frame(df, context)
+
+        frame, numeric = await self._afetch_series_data(params, use_cache)
+        df: pd.DataFrame = self._parse_series_frame(
+            frame, time_series, ascending, numeric=numeric, frequency=params["frequency"]
+        )
+
+        return self._finalize_series_frame(df, context)
+
+    async def _afetch_series_data(
+        self, params: dict[str, str], use_cache: bool = True
+    ) -> tuple[pd.DataFrame, bool]:
+        """Retrieves the observations of a series request splitting it into several requests
+        if it's too large (see Connector._plan_series_chunks).
+
+        Args:
+            - params (dict[str, str]): series request parameters.
+            - use_cache (bool): Uses the response cache (if any).
+
+        Returns:
+            - tuple[pd.DataFrame, bool]: (observations, numeric) see load_series_frame.
+        """
+
+        chunks: list[dict[str, str]] = self._plan_series_chunks(params)
+
+        async def fetch(chunk: dict[str, str]) -> tuple[pd.DataFrame, bool]:
+            data: bytes = await self._aget_response(
+                url=self.cfg.url_series, extensions=chunk, type_="series", use_cache=use_cache
+            )
+            return load_series_frame(data, field=self.cfg.raw_items)
+
+        if len(chunks) == 1:
+            return await fetch(chunks[0])
+
+        if self.parallel_chunks:
+            responses: list[tuple[pd.DataFrame, bool]] = await asyncio.gather(
+                *(fetch(chunk) for chunk in chunks)
+            )
+        else:
+            responses = [await fetch(chunk) for chunk in chunks]
+
+        return self._stitch_series_chunks(chunks, responses)
+
+    def connection_stats(self) -> dict[str, int | float]:
+        """Returns how well the connections to the EVDS API service are reused.
+
+        See Connector.connection_stats for the returned statistics.
+        """
+
+        return self._connection_reuse(self._requests_sent, self._connections_opened)
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client"""
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_main_categories(
+        self, as_dict: bool = False, raw: bool = False, serialize: bool = False
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns main data categories defined on EVDS in different formats.
+
+        See Connector.get_main_categories for the parameters.
+        """
+
+        if as_dict and raw:
+            raise AmbiguousOutputTypeException(
+                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
+            )
+
+        await self._ensure_main_categories()
+
+        return self._format_main_categories(as_dict=as_dict, raw=raw, serialize=serialize)
+
+    async def get_sub_categories(
+        self,
+        main_category: int | str,
+        as_dict: bool = False,
+        raw: bool = False,
+        verbose: bool = False,
+        serialize: bool = False,
+        use_cache: bool = True,
+        recursive: bool = False,
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns sub-categories of main categories as DataFrame (or other types supported).
+
+        See Connector.get_sub_categories for the parameters.
+        """
+
+        if as_dict and raw:
+            raise AmbiguousOutputTypeException(
+                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
+            )
+
+        await self._ensure_main_categories()
+
+        params: dict[str, str | int] = self._find_sub_category(main_category)
+        sub_categories: bytes = await self._aget_metadata_response(
+            url=self.cfg.url_sub_categories,
+            extensions=params,
+            type_="sub_categories",
+            use_cache=use_cache,
+        )
+        json_sub_categories: JSONType = load_json(sub_categories)
+
+        if not json_sub_categories:
+            child_sub_categories: list[dict[str, Any]] = await self._aget_child_sub_categories(
+                params.get("code"), use_cache=use_cache, recursive=recursive
+            )
+            if child_sub_categories:
+                json_sub_categories = child_sub_categories
+
+        return self._format_sub_categories(
+            json_sub_categories, as_dict=as_dict, raw=raw, verbose=verbose, serialize=serialize
+        )
+
+    async def get_groups(
+        self,
+        data_group_code: str,
+        as_dict: bool = False,
+        raw: bool = False,
+        verbose: bool = False,
+        parse_dt: bool = False,
+        serialize: bool = False,
+        use_cache: bool = True,
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns all series names, codes and observations start dates belong to given
+        sub-categories as DataFrame (or other supported formats).
+
+        See Connector.get_groups for the parameters.
+        """
+
+        if as_dict and raw:
+            raise AmbiguousOutputTypeException(
+                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
+            )
+
+        params: dict[str, str] = dict(code=data_group_code, type="json")
+        series: bytes = await self._aget_metadata_response(
+            url=self.cfg.url_groups, extensions=params, type_="groups", use_cache=use_cache
+        )
+        json_groups: JSONType = load_json(series)
+
+        return self._format_groups(
+            json_groups,
+            as_dict=as_dict,
+            raw=raw,
+            verbose=verbose,
+            parse_dt=parse_dt,
+            serialize=serialize,
+        )
+
+    async def get_series(
+        self,
+        series: str | Sequence[str],
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | pd.Timestamp | None = None,
+        period: str | None = None,
+        aggregations: str | list[str] | tuple[str] | None = None,
+        transformations: str | list[str] | tuple[str] | None = None,
+        keep_originals: bool = True,
+        frequency: str | int | None = None,
+        new_names: Sequence[str] | None = None,
+        keep_references: bool = False,
+        time_series: bool = True,
+        ascending: bool = True,
+        raw: bool = False,
+        as_dict: bool = False,
+        serialize: bool = False,
+        convert_to_bd: bool = True,
+        use_cache: bool = True,
+        incremental: bool = False,
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns requested time series from the EVDS API Service.
+
+        See Connector.get_series for the parameters.
+        """
+
+        result: pd.DataFrame
+        output: pd.DataFrame | JSONType | dict[str, Any]
+        result, output = await self._aseries_output(
+            series=series,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            aggregations=aggregations,
+            transformations=transformations,
+            keep_originals=keep_originals,
+            frequency=frequency,
+            new_names=new_names,
+            keep_references=keep_references,
+            time_series=time_series,
+            ascending=ascending,
+            raw=raw,
+            as_dict=as_dict,
+            serialize=serialize,
+            convert_to_bd=convert_to_bd,
+            use_cache=use_cache,
+            incremental=incremental,
+        )
+        self.data = result
+
+        return output
+
+    async def _aseries_output(
+        self,
+        series: str | Sequence[str],
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | pd.Timestamp | None = None,
+        period: str | None = None,
+        aggregations: str | list[str] | tuple[str] | None = None,
+        transformations: str | list[str] | tuple[str] | None = None,
+        keep_originals: bool = True,
+        frequency: str | int | None = None,
+        new_names: Sequence[str] | None = None,
+        keep_references: bool = False,
+        time_series: bool = True,
+        ascending: bool = True,
+        raw: bool = False,
+        as_dict: bool = False,
+        serialize: bool = False,
+        convert_to_bd: bool = True,
+        use_cache: bool = True,
+        incremental: bool = False,
+    ) -> tuple[pd.DataFrame, pd.DataFrame | JSONType | dict[str, Any]]:
+        """Returns requested time series both as retrieved and in requested format without
+        keeping them in `data` (see Connector.get_series).
+        """
+
+        if as_dict and raw:
+            raise AmbiguousOutputTypeException(
+                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
+            )
+
+        new_names_1: list[str] = []
+        new_names_2: list[str] = []
+        with_originals: bool = bool(aggregations and keep_originals and time_series)
+
+        if with_originals and new_names:
+            new_names, _ = self._parse_series_names(new_names, check_references=False)
+            new_names_1 = [name for idx, name in enumerate(new_names) if idx >= len(new_names) / 2]
+            new_names_2 = [name for idx, name in enumerate(new_names) if idx < len(new_names) / 2]
+
+        requests: list = [
+            self._aget_series(
+                series=series,
+                start_date=start_date,
+                end_date=end_date,
+                period=period,
+                aggregations=aggregations,
+                transformations=transformations,
+                keep_originals=keep_originals,
+                frequency=frequency,
+                new_names=new_names_1 if new_names_1 else new_names,
+                keep_references=keep_references,
+                time_series=time_series,
+                ascending=ascending,
+                convert_to_bd=convert_to_bd,
+                use_cache=use_cache,
+                incremental=incremental,
+            )
+        ]
+
+        if with_originals:
+            requests.append(
+                self._aget_series(
+                    series=series,
+                    start_date=start_date,
+                    end_date=end_date,
+                    period=period,
+                    frequency=frequency,
+                    new_names=new_names_2 if new_names_2 else new_names,
+                    time_series=time_series,
+                    ascending=ascending,
+                    convert_to_bd=convert_to_bd,
+                    use_cache=use_cache,
+                    incremental=incremental,
+                )
+            )
+
+        results: list[pd.DataFrame] = await asyncio.gather(*requests)
+        result: pd.DataFrame = results[0]
+
+        if with_originals:
+            result = pd.concat([results[1], result], axis=1)
+
+        return result, self._format_series_output(
+            result, raw=raw, as_dict=as_dict, serialize=serialize
+        )
+
+    async def get_series_batch(
+        self,
+        series_requests: Sequence[str | Sequence[str] | dict[str, Any]] | dict[str, Any],
+        join: bool = False,
+        raise_errors: bool = True,
+    ) -> dict[str, pd.DataFrame] | pd.DataFrame:
+        """Returns many time series requests at once retrieving them concurrently.
+
+        See Connector.get_series_batch for the parameters. The number of requests sent to the
+        EVDS API service at the same time never exceeds `max_concurrent_requests`.
+        """
+
+        kwargs_list: list[tuple[str, dict[str, Any]]] = self._label_batch_requests(
+            series_requests, join=join
+        )
+
+        # the first request of the connector is settled by _aget_response.
+        outcomes: list[Any] = await asyncio.gather(
+            *(self._aseries_output(**kwargs) for _, kwargs in kwargs_list),
+            return_exceptions=True,
+        )
+
+        results: dict[str, pd.DataFrame] = {}
+        frames: dict[str, pd.DataFrame] = {}
+        for (label, _), outcome in zip(kwargs_list, outcomes):
+            if isinstance(outcome, Exception):
+                if raise_errors:
+                    raise outcome
+                print(f"{label} could not be retrieved: {outcome}")
+                continue
+            frames[label], results[label] = outcome
+
+        if join:
+            if not results:
+                self.data = pd.DataFrame()
+                return self.data
+            joined: pd.DataFrame = pd.concat(results.values(), axis=1, join="outer")
+            self.data = joined.sort_index()
+            return self.data
+
+        if frames:
+            self.data = list(frames.values())[-1]
+
+        return results
+
+    async def prefetch_catalog(self, refresh: bool = False) -> dict[str, int]:
+        """Downloads the whole EVDS catalog into the catalog store at once.
+
+        See Connector.prefetch_catalog for the parameters. The number of requests sent to the
+        EVDS API service at the same time never exceeds `max_concurrent_requests`.
+        """
+
+        if self.catalog is None:
+            self.catalog = CatalogStore()
+
+        use_cache: bool = not refresh
+        response: bytes = await self._aget_metadata_response(
+            self.cfg.url_main_categories,
+            extensions=dict(type="json"),
+            type_="main_categories",
+            use_cache=use_cache,
+        )
+        await asyncio.to_thread(self._save_main_categories_response, response)
+        self.main_categories = self._parse_main_categories(response)
+
+        category_ids: list[int] = self._catalog_category_ids()
+        sub_categories: list[Any] = await asyncio.gather(
+            *(
+                self._aget_metadata_response(
+                    self.cfg.url_sub_categories,
+                    extensions=dict(mode=2, code=id_, type="json"),
+                    type_="sub_categories",
+                    use_cache=use_cache,
+                )
+                for id_ in category_ids
+            ),
+            return_exceptions=True,
+        )
+        datagroups: list[str] = self._catalog_datagroups(
+            [r for r in sub_categories if not isinstance(r, Exception)]
+        )
+        groups: list[Any] = await asyncio.gather(
+            *(
+                self._aget_metadata_response(
+                    self.cfg.url_groups,
+                    extensions=dict(code=code, type="json"),
+                    type_="groups",
+                    use_cache=use_cache,
+                )
+                for code in datagroups
+            ),
+            return_exceptions=True,
+        )
+
+        failed: int = 0
+        for type_, codes, outcomes in (
+            ("sub_categories", category_ids, sub_categories),
+            ("groups", datagroups, groups),
+        ):
+            for code, outcome in zip(codes, outcomes):
+                if isinstance(outcome, Exception):
+                    print(f"could not be retrieved: {type_} {code}: {outcome}")
+                    failed += 1
+
+        return dict(categories=len(category_ids), datagroups=len(datagroups), failed=failed)
+
+    async def save_name_references(
+        self,
+        series_names: str | Sequence[str],
+        reference_names: str | Sequence[str],
+        old_reference_names: list[str] | None = None,
+        verbose: bool = True,
+        check_names: bool = True,
+    ) -> None:
+        """Saves reference names for original series names in order them to be used as
+        series names when getting data from the EVDS API server.
+
+        See Connector.save_name_references for the parameters.
+        """
+
+        if check_names:
+            names, _ = self._parse_series_names(series_names, check_references=False)
+            try:
+                current_date: datetime = find_current_date(as_dt=True)
+                test_date: datetime = current_date - timedelta(days=31)
+                check: JSONType = await self.get_series(
+                    start_date=test_date, series=names, keep_references=False, raw=True
+                )
+                if not check:
+                    raise UnknownTimeSeriesIdentifierException
+            except Exception:
+                raise UnknownTimeSeriesIdentifierException(
+                    f"One or more {names} is not found on API server."
+                    f"Are you sure they are original series names or names currently in "
+                    f"references?"
+                ) from None
+
+        super().save_name_references(
+            series_names=series_names,
+            reference_names=reference_names,
+            old_reference_names=old_reference_names,
+            verbose=verbose,
+            check_names=False,
+        )
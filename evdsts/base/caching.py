@@ -0,0 +1,359 @@
+"""evdsts Response Cache Classes"""
+
+__author__ = "Burak CELIK"
+__copyright__ = "Copyright (c) 2022 Burak CELIK"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__internal__ = "0.0.1"
+
+
+import hashlib
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from time import time
+from typing import Any
+
+from evdsts.configuration.cfg import EVDSTSConfig
+from evdsts.utils.time_series import find_current_date
+
+
+class ResponseCache(ABC):
+    """Base class of the response caches used by Connector.
+
+    A response cache keeps the raw bytes returned from the EVDS API service keyed on the requested
+    url and its extension parameters. The API key never takes part in the cache key. Subclasses
+    only need to implement the storage part (_read, _write, _clear, _entries).
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        historical_ttl: float | None = None,
+        max_size: int | None = None,
+    ) -> None:
+        """Response cache interface.
+
+        Args:
+            - ttl (float | None, optional): Expiration time in seconds for the responses whose
+            date window reaches today (and for the metadata responses). Defaults to `None`
+            (1 hour).
+            - historical_ttl (float | None, optional): Expiration time in seconds for the responses
+            whose date window ends before today. Defaults to `None` (30 days).
+            - max_size (int | None, optional): Maximum total size of the cached responses in bytes.
+            The least recently used responses are evicted when the size is exceeded.
+            Defaults to `None` (256 MB).
+        """
+
+        self.cfg: EVDSTSConfig = EVDSTSConfig()
+        self.ttl: float = self.cfg.cache_ttl if ttl is None else ttl
+        self.historical_ttl: float = (
+            self.cfg.cache_historical_ttl if historical_ttl is None else historical_ttl
+        )
+        self.max_size: int = self.cfg.cache_max_size if max_size is None else max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, extensions: dict[str, Any]) -> str:
+        """Returns a cache key for given url and extension parameters.
+
+        Args:
+            - url (str): Base API URL.
+            - extensions (dict[str, Any]): url extensions of the request.
+
+        Returns:
+            - str: cache key
+        """
+
+        # never let the API key leak into the cache.
+        parameters: dict[str, str] = {
+            str(k): str(v) for k, v in extensions.items() if str(k).lower() != "key"
+        }
+        identifier: str = url + json.dumps(parameters, sort_keys=True, ensure_ascii=False)
+
+        return hashlib.sha256(identifier.encode("utf-8")).hexdigest()
+
+    def _time_to_live(self, extensions: dict[str, Any]) -> float:
+        """Returns the expiration time of a response in seconds.
+
+        Args:
+            - extensions (dict[str, Any]): url extensions of the request.
+
+        Returns:
+            - float: time to live in seconds.
+        """
+
+        end_date: Any = extensions.get("endDate", None)
+        if not end_date:
+            return self.ttl
+
+        try:
+            parsed_end_date = datetime.strptime(str(end_date), "%d-%m-%Y").date()
+        except ValueError:
+            return self.ttl
+
+        if parsed_end_date < find_current_date(as_dt=True):
+            return self.historical_ttl
+
+        return self.ttl
+
+    def get(self, url: str, extensions: dict[str, Any]) -> bytes | None:
+        """Returns a cached response if there is a fresh one.
+
+        Args:
+            - url (str): Base API URL.
+            - extensions (dict[str, Any]): url extensions of the request.
+
+        Returns:
+            - bytes | None: cached response or None if it's not cached or expired.
+        """
+
+        key: str = self.make_key(url, extensions)
+        with self._lock:
+            content: bytes | None = self._read(key, time())
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return content
+
+    def set(self, url: str, extensions: dict[str, Any], content: bytes) -> None:
+        """Stores a response.
+
+        Args:
+            - url (str): Base API URL.
+            - extensions (dict[str, Any]): url extensions of the request.
+            - content (bytes): response to be cached.
+        """
+
+        if len(content) > self.max_size:
+            return
+
+        key: str = self.make_key(url, extensions)
+        now: float = time()
+        with self._lock:
+            self._write(key, content, now, now + self._time_to_live(extensions))
+
+    def clear(self) -> None:
+        """Removes all cached responses and resets the counters"""
+
+        with self._lock:
+            self._clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Returns cache statistics.
+
+        Returns:
+            - dict[str, int | float]: hits, misses, hit ratio, number of entries and total size.
+        """
+
+        with self._lock:
+            entries, size = self._entries()
+
+        requests: int = self.hits + self.misses
+
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            hit_ratio=self.hits / requests if requests else 0.0,
+            entries=entries,
+            size=size,
+        )
+
+    @abstractmethod
+    def _read(self, key: str, now: float) -> bytes | None:
+        """Returns the content of a key unless it's missing or expired"""
+
+    @abstractmethod
+    def _write(self, key: str, content: bytes, now: float, expires: float) -> None:
+        """Stores the content of a key"""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Removes all stored contents"""
+
+    @abstractmethod
+    def _entries(self) -> tuple[int, int]:
+        """Returns the number and the total size of the stored contents"""
+
+    def __repr__(self) -> str:
+
+        return (
+            f"\n*{self.__class__.__name__}*:\n\n"
+            f"ttl: {self.ttl}\nhistorical ttl: {self.historical_ttl}\nmax size: {self.max_size}\n"
+            f"stats: {self.stats()}"
+        )
+
+
+class MemoryResponseCache(ResponseCache):
+    """An in-process LRU response cache"""
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        historical_ttl: float | None = None,
+        max_size: int | None = None,
+    ) -> None:
+
+        super().__init__(ttl=ttl, historical_ttl=historical_ttl, max_size=max_size)
+        self._store: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._size: int = 0
+
+    def _read(self, key: str, now: float) -> bytes | None:
+
+        entry: tuple[bytes, float] | None = self._store.get(key, None)
+        if entry is None:
+            return None
+
+        content, expires = entry
+        if expires < now:
+            self._size -= len(content)
+            del self._store[key]
+            return None
+
+        self._store.move_to_end(key)
+
+        return content
+
+    def _write(self, key: str, content: bytes, now: float, expires: float) -> None:
+
+        old: tuple[bytes, float] | None = self._store.pop(key, None)
+        if old is not None:
+            self._size -= len(old[0])
+
+        self._store[key] = (content, expires)
+        self._size += len(content)
+
+        # evict the least recently used responses.
+        while self._size > self.max_size and self._store:
+            _, (evicted, _) = self._store.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _clear(self) -> None:
+
+        self._store.clear()
+        self._size = 0
+
+    def _entries(self) -> tuple[int, int]:
+
+        return len(self._store), self._size
+
+
+class DiskResponseCache(ResponseCache):
+    """A persistent LRU response cache that is kept in an SQLite database on disk"""
+
+    def __init__(
+        self,
+        fname: str | Path | None = None,
+        ttl: float | None = None,
+        historical_ttl: float | None = None,
+        max_size: int | None = None,
+    ) -> None:
+        """Persistent on-disk response cache.
+
+        Args:
+            - fname (str | Path | None, optional): Cache database file. Defaults to `None`
+            (evds_response_cache.sqlite in the data folder of evdsts).
+            - ttl (float | None, optional): Expiration time in seconds for the responses whose
+            date window reaches today. Defaults to `None` (1 hour).
+            - historical_ttl (float | None, optional): Expiration time in seconds for the responses
+            whose date window ends before today. Defaults to `None` (30 days).
+            - max_size (int | None, optional): Maximum total size of the cached responses in bytes.
+            Defaults to `None` (256 MB).
+        """
+
+        super().__init__(ttl=ttl, historical_ttl=historical_ttl, max_size=max_size)
+        self.fname: str = str(fname) if fname else self.cfg.cache_file
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, content BLOB, size INTEGER, expires REAL, accessed REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yields a new connection to the cache database in a transaction"""
+
+        # a connection per operation keeps the cache usable from several threads and processes.
+        connection: sqlite3.Connection = sqlite3.connect(self.fname, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _read(self, key: str, now: float) -> bytes | None:
+
+        with self._connect() as connection:
+            row: tuple[bytes, float] | None = connection.execute(
+                "SELECT content, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            content, expires = row
+            if expires < now:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+
+        return bytes(content)
+
+    def _write(self, key: str, content: bytes, now: float, expires: float) -> None:
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, content, size, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(content), len(content), expires, now),
+            )
+            # drop expired responses and then the least recently used ones until the cache fits.
+            connection.execute("DELETE FROM responses WHERE expires < ?", (now,))
+            total: int = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+            if total <= self.max_size:
+                return
+
+            evict: list[str] = []
+            for evict_key, size in connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed ASC"
+            ).fetchall():
+                if total <= self.max_size:
+                    break
+                evict.append(evict_key)
+                total -= size
+
+            connection.executemany("DELETE FROM responses WHERE key = ?", ((k,) for k in evict))
+
+    def _clear(self) -> None:
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def _entries(self) -> tuple[int, int]:
+
+        with self._connect() as connection:
+            entries, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        return entries, size
@@ -0,0 +1,233 @@
+"""evdsts CatalogStore Class"""
+
+__author__ = "Burak CELIK"
+__copyright__ = "Copyright (c) 2022 Burak CELIK"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__internal__ = "0.0.1"
+
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from time import time
+
+from evdsts.configuration.cfg import EVDSTSConfig
+
+
+class CatalogStore:
+    """A persistent store of the EVDS catalog (categories, datagroups and series metadata).
+
+    Every node of the catalog is the raw response of a metadata request and it's kept with the
+    time it was retrieved:
+        - `main_categories`: the category tree (a single node with an empty code).
+        - `sub_categories`: datagroups of a category (code: category id).
+        - `groups`: series metadata of a datagroup (code: datagroup code).
+
+    Nodes are kept in an SQLite database on disk and in memory after their first lookup, so the
+    metadata browsing does not need the EVDS API service at all once the catalog is prefetched
+    (see `Connector.prefetch_catalog`). A node older than `max_age` seconds is retrieved again
+    on its next use.
+    """
+
+    KINDS: tuple[str, ...] = ("main_categories", "sub_categories", "groups")
+
+    def __init__(
+        self,
+        fname: str | Path | None = None,
+        max_age: float | None = None,
+        stale_if_error: bool = True,
+    ) -> None:
+        """Persistent catalog store.
+
+        Args:
+            - fname (str | Path | None, optional): Catalog database file. Defaults to `None`
+            (evds_catalog.sqlite in the data folder of evdsts).
+            - max_age (float | None, optional): Seconds after which a node is retrieved again.
+            Defaults to `None` (7 days).
+            - stale_if_error (bool, optional): Returns the kept node if it can't be refreshed
+            because of a connection problem. Defaults to `True`.
+        """
+
+        self.cfg: EVDSTSConfig = EVDSTSConfig()
+        self.fname: str = str(fname) if fname else self.cfg.catalog_file
+        self.max_age: float = self.cfg.catalog_max_age if max_age is None else max_age
+        self.stale_if_error: bool = stale_if_error
+        self._lock: threading.Lock = threading.Lock()
+        self._nodes: dict[tuple[str, str], tuple[bytes, float]] = {}
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS nodes ("
+                "kind TEXT, code TEXT, content BLOB, refreshed REAL, PRIMARY KEY (kind, code))"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yields a new connection to the catalog database in a transaction"""
+
+        connection: sqlite3.Connection = sqlite3.connect(self.fname, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def lookup(self, kind: str, code: str | int = "") -> tuple[bytes, float] | None:
+        """Returns a node with its refresh time regardless of its age.
+
+        Args:
+            - kind (str): node kind (`main_categories`, `sub_categories` or `groups`).
+            - code (str | int, optional): category id or datagroup code. Defaults to "".
+
+        Returns:
+            - tuple[bytes, float] | None: (content, refresh timestamp) or None if the node is
+            not in the catalog.
+        """
+
+        key: tuple[str, str] = (kind, str(code))
+        with self._lock:
+            node: tuple[bytes, float] | None = self._nodes.get(key, None)
+            if node is not None:
+                return node
+
+            with self._connect() as connection:
+                row: tuple[bytes, float] | None = connection.execute(
+                    "SELECT content, refreshed FROM nodes WHERE kind = ? AND code = ?", key
+                ).fetchone()
+
+            if row is None:
+                return None
+
+            node = (bytes(row[0]), row[1])
+            self._nodes[key] = node
+
+        return node
+
+    def is_fresh(self, refreshed: float) -> bool:
+        """Returns whether a node refreshed at given time can still be used.
+
+        Args:
+            - refreshed (float): refresh timestamp of the node.
+
+        Returns:
+            - bool: True if the node is younger than `max_age`.
+        """
+
+        return time() - refreshed <= self.max_age
+
+    def get(self, kind: str, code: str | int = "") -> bytes | None:
+        """Returns a node if there is a fresh one.
+
+        Args:
+            - kind (str): node kind.
+            - code (str | int, optional): category id or datagroup code. Defaults to "".
+
+        Returns:
+            - bytes | None: content of the node or None if it's not in the catalog or expired.
+        """
+
+        node: tuple[bytes, float] | None = self.lookup(kind, code)
+        if node is None or not self.is_fresh(node[1]):
+            return None
+
+        return node[0]
+
+    def set(self, kind: str, code: str | int, content: bytes) -> None:
+        """Stores a node with the current time as its refresh time.
+
+        Args:
+            - kind (str): node kind.
+            - code (str | int): category id or datagroup code.
+            - content (bytes): response of the EVDS API service.
+        """
+
+        key: tuple[str, str] = (kind, str(code))
+        node: tuple[bytes, float] = (content, time())
+        with self._lock:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO nodes (kind, code, content, refreshed) "
+                    "VALUES (?, ?, ?, ?)",
+                    (*key, sqlite3.Binary(content), node[1]),
+                )
+            self._nodes[key] = node
+
+    def refreshed(self, kind: str, code: str | int = "") -> float | None:
+        """Returns the refresh time of a node.
+
+        Args:
+            - kind (str): node kind.
+            - code (str | int, optional): category id or datagroup code. Defaults to "".
+
+        Returns:
+            - float | None: refresh timestamp or None if the node is not in the catalog.
+        """
+
+        node: tuple[bytes, float] | None = self.lookup(kind, code)
+
+        return None if node is None else node[1]
+
+    def remove(self, kind: str, code: str | int = "") -> None:
+        """Removes a node so that it's retrieved again on its next use.
+
+        Args:
+            - kind (str): node kind.
+            - code (str | int, optional): category id or datagroup code. Defaults to "".
+        """
+
+        key: tuple[str, str] = (kind, str(code))
+        with self._lock:
+            with self._connect() as connection:
+                connection.execute("DELETE FROM nodes WHERE kind = ? AND code = ?", key)
+            self._nodes.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all nodes"""
+
+        with self._lock:
+            with self._connect() as connection:
+                connection.execute("DELETE FROM nodes")
+            self._nodes.clear()
+
+    def stats(self) -> dict[str, int | float | None]:
+        """Returns catalog statistics.
+
+        Returns:
+            - dict[str, int | float | None]: number of nodes of every kind, number of expired
+            nodes and the refresh time of the oldest node.
+        """
+
+        with self._lock:
+            with self._connect() as connection:
+                rows: list[tuple[str, int, float]] = connection.execute(
+                    "SELECT kind, COUNT(*), MIN(refreshed) FROM nodes GROUP BY kind"
+                ).fetchall()
+                expired: int = connection.execute(
+                    "SELECT COUNT(*) FROM nodes WHERE refreshed < ?", (time() - self.max_age,)
+                ).fetchone()[0]
+
+        stats: dict[str, int | float | None] = {kind: 0 for kind in self.KINDS}
+        oldest: list[float] = []
+        for kind, count, refreshed in rows:
+            stats[kind] = count
+            oldest.append(refreshed)
+        stats["expired"] = expired
+        stats["oldest"] = min(oldest) if oldest else None
+
+        return stats
+
+    def __len__(self) -> int:
+
+        with self._lock:
+            with self._connect() as connection:
+                return connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def __repr__(self) -> str:
+
+        return (
+            f"\n*{self.__class__.__name__}*:\n\nfile: {self.fname}\nmax age: {self.max_age}\n"
+            f"stats: {self.stats()}"
+        )
@@ -8,23 +8,33 @@ __internal__ = "0.0.3"
 
 
 import json
+import os
 import ssl
+import threading
 import webbrowser
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from json import JSONDecodeError
 from pathlib import Path
 from string import ascii_letters, digits
-from time import sleep
+from time import sleep, time
 from typing import Any
 from urllib.error import HTTPError
 
 import pandas as pd
 import requests
 from requests import Timeout
+from requests.adapters import DEFAULT_POOLSIZE
 from requests.exceptions import RequestException
+from urllib3.util import make_headers
 
+from evdsts.base.caching import ResponseCache
+from evdsts.base.cataloging import CatalogStore
+from evdsts.base.limiting import RateLimiter
+from evdsts.base.retrying import RetryPolicy
 from evdsts.base.searching import SearchEngine
+from evdsts.base.storing import SeriesStore
 from evdsts.base.transforming import _set_precision
 from evdsts.configuration.cfg import EVDSTSConfig
 from evdsts.configuration.exceptions import (
@@ -42,7 +52,7 @@ from evdsts.configuration.exceptions import (
     UnmatchingParameterSizeException,
     WrongAPIKeyException,
 )
-from evdsts.configuration.types import EVDSHttpAdapter, JSONType
+from evdsts.configuration.types import DateLike, EVDSHttpAdapter, JSONType
 from evdsts.utils.general import (
     copy_file,
     delete_file,
@@ -50,6 +60,7 @@ from evdsts.utils.general import (
     drop_na_columns,
     join_sequentials,
     load_json,
+    load_series_frame,
     set_column_names,
     write_data,
     write_json,
@@ -58,6 +69,7 @@ from evdsts.utils.time_series import (
     as_real,
     convert_to_business_date,
     convert_to_time_series,
+    create_ts_index_from_unixtime,
     correct_date,
     find_current_date,
     get_period,
@@ -112,6 +124,20 @@ class Connector:
         secure: bool = True,
         jupyter_mode: bool = False,
         precision: int | None = None,
+        cache: ResponseCache | None = None,
+        max_concurrent_requests: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        store: SeriesStore | None = None,
+        max_series_per_request: int | None = None,
+        max_observations_per_request: int | None = None,
+        parallel_chunks: bool = False,
+        timeout: tuple[float, float] | None = None,
+        catalog: CatalogStore | None = None,
+        pool_size: int | None = None,
+        pool_block: bool | None = None,
+        compression: bool = True,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """EVDS (EDDS) API Service Connection Interface.
 
@@ -145,6 +171,53 @@ class Connector:
                 or, `72.1907` is truncated to `72` if the given precision is `0`
                 - None: precision is equal to original precision returned from the EVDS.
                 Defaults to `None`
+            - `cache` (ResponseCache | None, optional): A response cache (like `DiskResponseCache`
+            or `MemoryResponseCache` from `evdsts.base.caching`) that keeps the responses of the
+            EVDS API service in order not to request the same data again and again.
+                - None: every request goes to the EVDS API service.
+                Defaults to `None`
+            - `max_concurrent_requests` (int | None, optional): Maximum number of requests that
+            are sent to the EVDS API service at the same time (e.g. by `get_series_batch`).
+            Defaults to `None` (4).
+            - `rate_limiter` (RateLimiter | None, optional): A token bucket (like `RateLimiter` or
+            `FileRateLimiter` from `evdsts.base.limiting`) that is consulted before every request
+            sent to the EVDS API service. The same limiter can be shared by several connectors,
+            and a `FileRateLimiter` by several processes.
+                - None: requests are not paced.
+                Defaults to `None`
+            - `store` (SeriesStore | None, optional): A local series store (`SeriesStore` from
+            `evdsts.base.storing`) that keeps the retrieved series for incremental requests
+            (`get_series(..., incremental=True)`).
+                - None: a store in the default folder is created on the first incremental request.
+                Defaults to `None`
+            - `max_series_per_request` (int | None, optional): Series requests including more
+            series are split into several requests. Defaults to `None` (25).
+            - `max_observations_per_request` (int | None, optional): Series requests that are
+            estimated to return more observations (series count x observations per year x years)
+            are split into calendar year windows. Defaults to `None` (50000).
+            - `parallel_chunks` (bool, optional): Retrieves the parts of a split series request
+            concurrently (bounded by `max_concurrent_requests`). Defaults to `False`.
+            - `timeout` (tuple[float, float] | None, optional): (connect, read) timeouts of the
+            requests in seconds. Defaults to `None` ((10, 15)).
+            - `catalog` (CatalogStore | None, optional): A local catalog store (`CatalogStore` from
+            `evdsts.base.cataloging`) that keeps main categories, sub-categories and groups on the
+            disk. `get_main_categories`, `get_sub_categories` and `get_groups` read from it and
+            only nodes older than its `max_age` are retrieved again (see `prefetch_catalog`).
+                - None: metadata is retrieved from the EVDS API service.
+                Defaults to `None`
+            - `pool_size` (int | None, optional): Number of connections kept alive in the
+            connection pool. Defaults to `None` (`max_concurrent_requests`, at least 10).
+            - `pool_block` (bool | None, optional): Makes a request wait for a pooled connection
+            when all of them are in use instead of opening a connection that is thrown away
+            afterwards. Defaults to `None` (True).
+            - `compression` (bool, optional): Asks the EVDS API service for compressed responses
+            (gzip, deflate and br/zstd if the decoders are installed). Defaults to `True`.
+            - `keep_alive` (bool, optional): Keeps the connections open to be reused by the
+            following requests (see `connection_stats`). Defaults to `True`.
+            - `retry_policy` (RetryPolicy | None, optional): Decides how failed requests are
+            retried (`RetryPolicy` from `evdsts.base.retrying`: jittered exponential backoff,
+            `Retry-After`, retryable statuses, a deadline and a circuit breaker). The same policy
+            can be shared by several connectors. Defaults to `None` (a default `RetryPolicy`).
         """
 
         self.cfg: EVDSTSConfig = EVDSTSConfig()
@@ -152,11 +225,39 @@ class Connector:
         self.show_links: bool = show_links
         self.jupyter_mode: bool = jupyter_mode
         self.precision: None | int = precision
-        self.main_categories: pd.DataFrame = pd.DataFrame()
+        self.cache: ResponseCache | None = cache
+        self.max_concurrent_requests: int = max_concurrent_requests
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.store: SeriesStore | None = store
+        self.max_series_per_request: int = (
+            max_series_per_request if max_series_per_request else self.cfg.max_series_per_request
+        )
+        self.max_observations_per_request: int = (
+            max_observations_per_request
+            if max_observations_per_request
+            else self.cfg.max_observations_per_request
+        )
+        self.parallel_chunks: bool = parallel_chunks
+        self.timeout: tuple[float, float] = timeout if timeout else self.cfg.request_timeout
+        self.catalog: CatalogStore | None = catalog
+        self.pool_size: int = (
+            pool_size
+            if pool_size
+            else self.cfg.pool_maxsize or max(self.max_concurrent_requests, DEFAULT_POOLSIZE)
+        )
+        self.pool_block: bool = self.cfg.pool_block if pool_block is None else pool_block
+        self.compression: bool = compression
+        self.keep_alive: bool = keep_alive
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy else RetryPolicy()
+        # main categories are retrieved on their first use (see main_categories).
+        self._main_categories: pd.DataFrame | None = None
+        self._main_categories_response: bytes | None = None
+        self._categories_lock: threading.Lock = threading.Lock()
         self._all_categories: pd.DataFrame = pd.DataFrame()
         self.session: requests.Session = self._create_session(secure=secure)
         self.data: pd.DataFrame = pd.DataFrame()
         self.first_request: bool = True
+        self._first_request_lock: threading.Lock = threading.Lock()
         self.internal_references_file_call = True
         self.references_file = self.cfg.reference_file
 
@@ -196,6 +297,23 @@ class Connector:
         # change language dependent features.
         self._language_changed(self._language)
 
+    @property
+    def main_categories(self) -> pd.DataFrame:
+        """Returns main categories of EVDS (retrieved on the first access)"""
+
+        if self._main_categories is None:
+            with self._categories_lock:
+                if self._main_categories is None:
+                    self._main_categories = self._get_main_categories()
+
+        return self._main_categories
+
+    @main_categories.setter
+    def main_categories(self, val: pd.DataFrame | None) -> None:
+        """Sets main categories (None: reloaded on the next access)"""
+
+        self._main_categories = val
+
     @property
     def proxy_servers(self) -> dict[str, str]:
         """Returns proxy servers"""
@@ -286,6 +404,24 @@ class Connector:
 
         self._precision = val
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Returns maximum number of concurrent requests"""
+
+        return self._max_concurrent_requests
+
+    @max_concurrent_requests.setter
+    def max_concurrent_requests(self, val: int | None) -> None:
+        """Sets maximum number of concurrent requests"""
+
+        if val is None:
+            val = self.cfg.max_concurrent_requests
+        if not isinstance(val, int) or val < 1:
+            raise ValueError("Maximum number of concurrent requests must be a positive integer")
+
+        self._max_concurrent_requests = val
+        self._request_slots: threading.BoundedSemaphore = threading.BoundedSemaphore(val)
+
     @property
     def references_file(self) -> str:
         """Returns reference file location"""
@@ -314,24 +450,60 @@ class Connector:
         self._references_file = fname
 
     def _create_session(self, secure: bool) -> requests.Session:
-        """_summary_
+        """Returns the HTTP session that the requests are sent over.
 
         Args:
-            secure (bool): _description_
+            - secure (bool): Uses a tailored SSL context for the https connections.
 
         Returns:
-            requests.Session: _description_
+            - requests.Session: HTTP session with pooled connections.
         """
 
         session: requests.Session = requests.Session()
+        context: ssl.SSLContext | None = None
         if secure:
-            session.adapters.pop("https://", None)
-            context: ssl.SSLContext = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+            context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
             context.options |= 0x4
-            session.mount("https://", EVDSHttpAdapter(context))
+
+        for prefix, ssl_context in (("https://", context), ("http://", None)):
+            session.mount(
+                prefix,
+                EVDSHttpAdapter(
+                    ssl_context,
+                    pool_connections=self.cfg.pool_connections,
+                    pool_maxsize=self.pool_size,
+                    pool_block=self.pool_block,
+                ),
+            )
+        session.headers.update(self._connection_headers())
 
         return session
 
+    def _connection_headers(self) -> dict[str, str]:
+        """Returns the compression and keep-alive headers of the requests"""
+
+        return {
+            "Accept-Encoding": (
+                make_headers(accept_encoding=True)["accept-encoding"]
+                if self.compression
+                else "identity"
+            ),
+            "Connection": "keep-alive" if self.keep_alive else "close",
+        }
+
+    @staticmethod
+    def _connection_reuse(requests_sent: int, connections: int) -> dict[str, int | float]:
+        """Returns connection reuse statistics for given numbers of requests and connections"""
+
+        reused: int = max(requests_sent - connections, 0)
+
+        return dict(
+            requests=requests_sent,
+            connections=connections,
+            reused=reused,
+            reuse_ratio=reused / requests_sent if requests_sent else 0.0,
+        )
+
     def _language_changed(self, language: str) -> None:
         """Variables that must be reloaded when the language is changed.
 
@@ -339,8 +511,9 @@ class Connector:
             - language (str): selected language
         """
 
-        # reload when the language is changed
-        self.main_categories = self._get_main_categories()
+        # main categories are parsed again for the language on their next use, the response
+        # has the titles in all languages, so it's not retrieved again.
+        self.main_categories = None
         self.search_engine.language = language
 
     def _load_references(self) -> dict[str, str]:
@@ -406,17 +579,82 @@ class Connector:
 
         self.name_cache = {}
 
+    def _load_main_categories_response(self) -> bytes | None:
+        """Returns the main categories response kept in memory or on the disk.
+
+        Returns:
+           - bytes | None: main categories response or None if there isn't a fresh one.
+        """
+
+        if self._main_categories_response is not None:
+            return self._main_categories_response
+
+        if self.catalog is not None:
+            # the catalog store keeps them instead (see _get_metadata_response).
+            return None
+
+        fname: Path = Path(self.cfg.main_categories_file)
+        try:
+            if time() - fname.stat().st_mtime > self.cfg.main_categories_ttl:
+                return None
+            response: bytes = fname.read_bytes()
+            json.loads(response)
+        except (OSError, ValueError):
+            return None
+
+        self._main_categories_response = response
+
+        return response
+
+    def _save_main_categories_response(self, response: bytes) -> None:
+        """Keeps a main categories response in memory and on the disk.
+
+        Args:
+           - response (bytes): main categories response of the EVDS API service.
+        """
+
+        self._main_categories_response = response
+
+        if self.catalog is not None:
+            return
+
+        fname: Path = Path(self.cfg.main_categories_file)
+        temp_file: Path = fname.with_suffix(".tmp")
+        try:
+            temp_file.write_bytes(response)
+            os.replace(temp_file, fname)
+        except OSError:
+            # the disk copy is only an optimization.
+            pass
+
     def _get_main_categories(self) -> pd.DataFrame:
         """Returns main categories of EVDS Service Database.
 
+        The response is retrieved once and kept on the disk for `MAIN_CATEGORIES_TTL` seconds.
+
         Returns:
            - DataFrame: Main categories of EVDS database.
         """
 
-        extensions: dict[str, str] = dict(type="json")
-        response: bytes = self._get_response(
-            self.cfg.url_main_categories, extensions=extensions, type_="main_categories"
-        )
+        response: bytes | None = self._load_main_categories_response()
+        if response is None:
+            extensions: dict[str, str] = dict(type="json")
+            response = self._get_metadata_response(
+                self.cfg.url_main_categories, extensions=extensions, type_="main_categories"
+            )
+            self._save_main_categories_response(response)
+
+        return self._parse_main_categories(response)
+
+    def _parse_main_categories(self, response: bytes) -> pd.DataFrame:
+        """Returns main categories of EVDS Service Database from a given API response.
+
+        Args:
+           - response (bytes): main categories response of the EVDS API service.
+
+        Returns:
+           - DataFrame: Main categories of EVDS database.
+        """
 
         id_field: str = self.cfg.category_id
         title_field: str = self.cfg.topic_title + "_" + self.language
@@ -512,6 +750,69 @@ class Connector:
             return []
         return [int(cid) for cid in children[id_field].tolist()]
 
+    def _get_child_sub_categories(
+        self, parent_id: int | None, use_cache: bool = True, recursive: bool = False
+    ) -> list[dict[str, Any]]:
+        """Returns the sub-categories of the child categories of a given category.
+
+        Child categories are requested concurrently (bounded by `max_concurrent_requests`) and
+        the sub-categories are merged in the order of the category tree (depth first).
+
+        Args:
+            - parent_id (int | None): The parent category ID.
+            - use_cache (bool): Uses the response cache and the catalog store (if any).
+            - recursive (bool): Also expands the children of the child categories that have no
+            sub-categories of their own, as soon as their responses arrive.
+
+        Returns:
+            - list[dict[str, Any]]: sub-categories of the subtree, empty if there is none.
+        """
+
+        def fetch(category_id: int) -> bytes:
+            return self._get_metadata_response(
+                url=self.cfg.url_sub_categories,
+                extensions=dict(mode=2, code=category_id, type="json"),
+                type_="sub_categories",
+                use_cache=use_cache,
+            )
+
+        children: dict[int | None, list[int]] = {parent_id: self._get_child_category_ids(parent_id)}
+        if not children[parent_id]:
+            return []
+
+        results: dict[int, list[dict[str, Any]]] = {}
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self.max_concurrent_requests)
+        try:
+            pending: dict[Future, int] = {
+                executor.submit(fetch, child_id): child_id for child_id in children[parent_id]
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    category_id: int = pending.pop(future)
+                    results[category_id] = load_json(future.result()) or []
+                    if results[category_id] or not recursive or category_id in children:
+                        continue
+                    children[category_id] = self._get_child_category_ids(category_id)
+                    for child_id in children[category_id]:
+                        if child_id not in results and child_id not in pending.values():
+                            pending[executor.submit(fetch, child_id)] = child_id
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        sub_categories: list[dict[str, Any]] = []
+        stack: list[int] = list(reversed(children[parent_id]))
+        visited: set[int] = set()
+        while stack:
+            category_id = stack.pop()
+            if category_id in visited:
+                continue
+            visited.add(category_id)
+            sub_categories.extend(results.get(category_id, []))
+            stack.extend(reversed(children.get(category_id, [])))
+
+        return sub_categories
+
     def _create_trans_agg_param(
         self,
         functions: list[str | int],
@@ -825,21 +1126,24 @@ class Connector:
         url: str,
         extensions: dict[str, str],
         type_: str,
-        max_retries: int = 3,
+        use_cache: bool = True,
     ) -> bytes:
         """Makes a GET request towards the API server and returns the response given.
 
+        Failed requests are retried as the retry policy of the Connector decides.
+
         Args:
             - url (str): Base API URL to be connected.
             - extensions (dict[str, str]): url extensions which specifies the requested data and
             its frequency/transformations/aggregations/etc.
-            - max_retries (int): Maximum number of retry attempts on transient failures.
+            - use_cache (bool): Looks up and stores the response in the response cache (if any).
 
         Raises:
             - WrongAPIKeyException: for APIKEY related issues.
             - APIServiceConnectionException: for Connection Timeouts.
             - APIServiceConnectionException: for Network (Internet) related issues.
             - APIServiceConnectionException: for Unknown issues.
+            - CircuitOpenException: if the EVDS API service keeps failing.
 
         Returns:
             - bytes: The response gotten from the API Server.
@@ -851,60 +1155,268 @@ class Connector:
         if self.show_links:
             print(f"request: {api_url}")
 
-        last_exception: Exception = None
-        for attempt in range(max_retries):
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cached: bytes | None = self.cache.get(url, extensions)
+            if cached is not None:
+                return cached
+
+        content: bytes | None = None
+        if self.first_request:
+            # the first response tells a wrong API key from a missing series (see
+            # _check_response), the requests sent meanwhile wait for it.
+            with self._first_request_lock:
+                if self.first_request:
+                    content = self._send_request(api_url, type_)
+        if content is None:
+            content = self._send_request(api_url, type_)
+
+        if use_cache:
+            self.cache.set(url, extensions, content)
+
+        return content
+
+    def _send_request(self, api_url: str, type_: str) -> bytes:
+        """Sends a GET request to the API server, retrying it as the retry policy decides.
+
+        Args:
+            - api_url (str): requested url.
+            - type_ (str): type of the request.
+
+        Raises:
+            - see _get_response.
+
+        Returns:
+            - bytes: The response gotten from the API Server.
+        """
+
+        policy: RetryPolicy = self.retry_policy
+        deadline: float = policy.start()
+        attempt: int = 0
+        while True:
+            policy.check_circuit()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            last_exception: Exception | None = None
+            retry_after: float | None = None
             try:
-                request: requests.Response = self.session.get(
-                    api_url, timeout=(10, 15), headers={"key": self.api_key}
-                )
-                break
-            except Timeout as ex:
-                last_exception = ex
-            except RequestException as ex:
-                last_exception = ex
-            except HTTPError as ex:
+                with self._request_slots:
+                    request: requests.Response = self.session.get(
+                        api_url, timeout=self.timeout, headers={"key": self.api_key}
+                    )
+            except (Timeout, RequestException, HTTPError) as ex:
                 last_exception = ex
+                policy.record_failure()
+            else:
+                # only the retryable statuses mean the service is in trouble. EVDS answers a
+                # missing series or group and a wrong key with 500.
+                if request.status_code in policy.retry_statuses:
+                    policy.record_failure()
+                else:
+                    policy.record_success()
+                if request.status_code not in policy.retry_statuses:
+                    break
+                retry_after = self._retry_delay(request.status_code, request.headers)
+
+            delay: float | None = policy.next_delay(attempt, deadline, retry_after)
+            if delay is None:
+                break
+            sleep(delay)
+            attempt += 1
 
-            backoff: float = 2**attempt * 3
-            if attempt < max_retries - 1:
-                sleep(backoff)
-        else:
-            print("url: ", api_url)
+        if last_exception is not None:
             if isinstance(last_exception, Timeout):
-                raise APIServiceConnectionException(
-                    "A connection timeout has occured after multiple retries. "
-                    "Please check your network status and "
-                    "be sure the EVDS website is currently on-line"
-                ) from last_exception
+                reason: str = "timeout"
             elif isinstance(last_exception, HTTPError):
-                raise APIServiceConnectionException(
-                    "A network error is occured while your request is processed."
-                ) from last_exception
+                reason = "network"
             else:
-                raise APIServiceConnectionException(
-                    "An unknown connection error has occured while your request is processed. "
-                    "Please check your network status and "
-                    "be sure the EVDS website is currently on-line"
-                ) from last_exception
+                reason = "unknown"
+            self._raise_connection_error(api_url, last_exception, reason)
 
-        if request.status_code == 404:
+        if request.status_code == 429:
             raise APIServiceConnectionException(
-                "EVDS API Server is currently down. Please retry later."
+                "EVDS API rate limit exceeded. Please wait and retry later."
+            )
+        if request.status_code in policy.retry_statuses:
+            raise APIServiceConnectionException(
+                f"EVDS API service is unavailable (status: {request.status_code}) after "
+                f"{attempt + 1} attempt(s). Please retry later."
             )
 
-        if request.status_code == 429:
-            if max_retries > 0:
-                sleep(5)
-                return self._get_response(url, extensions, type_, max_retries=max_retries - 1)
+        if self.first_request and request.status_code == 500 and type_ != "main_categories":
+            self._confirm_api_key()
+        self._check_response(request.status_code, api_url, type_)
+
+        return request.content
+
+    def _retry_delay(self, status_code: int, headers: Mapping[str, Any]) -> float | None:
+        """Returns the waiting time before a retryable response is requested again.
+
+        Args:
+            - status_code (int): HTTP status code of the response.
+            - headers (Mapping[str, Any]): headers of the response.
+
+        Returns:
+            - float | None: seconds to wait, or None to let the retry policy back off.
+        """
+
+        retry_after: float | None = self.retry_policy.retry_after(headers)
+        if status_code != 429:
+            return retry_after
+
+        penalty: float = self.cfg.rate_limit_penalty if retry_after is None else retry_after
+        if self.rate_limiter is not None:
+            # hold back every request sharing the limiter, not just this one. The limiter is
+            # refilled by the time the penalty is waited out, the next attempt doesn't wait twice.
+            self.rate_limiter.penalize(penalty)
+
+        return penalty
+
+    def _confirm_api_key(self) -> None:
+        """Confirms the API key with a main categories request.
+
+        EVDS answers a wrong API key and a missing series or group with the same 500 status, so
+        a 500 response to the first request can't tell them apart on its own.
+
+        Raises:
+            - WrongAPIKeyException: If the API key is wrong.
+        """
+
+        # sent directly, the first request lock is held by the request being checked.
+        api_url: str = self.cfg.url_main_categories + self._generate_url_extensions(
+            dict(type="json")
+        )
+        response: bytes = self._send_request(api_url, type_="main_categories")
+        # the key is fine (first_request is settled), keep the response for main_categories.
+        self._save_main_categories_response(response)
+
+    def _raise_connection_error(
+        self, api_url: str, last_exception: Exception | None, reason: str
+    ) -> None:
+        """Raises a connection exception for a request that failed after all retries.
+
+        Args:
+            - api_url (str): requested url.
+            - last_exception (Exception | None): the last exception occured while requesting.
+            - reason (str): "timeout", "network" or "unknown"
+
+        Raises:
+            - APIServiceConnectionException: always.
+        """
+
+        print("url: ", api_url)
+        if reason == "timeout":
             raise APIServiceConnectionException(
-                "EVDS API rate limit exceeded. Please wait and retry later."
+                "A connection timeout has occured after multiple retries. "
+                "Please check your network status and "
+                "be sure the EVDS website is currently on-line"
+            ) from last_exception
+        elif reason == "network":
+            raise APIServiceConnectionException(
+                "A network error is occured while your request is processed."
+            ) from last_exception
+        else:
+            raise APIServiceConnectionException(
+                "An unknown connection error has occured while your request is processed. "
+                "Please check your network status and "
+                "be sure the EVDS website is currently on-line"
+            ) from last_exception
+
+    def _get_metadata_response(
+        self,
+        url: str,
+        extensions: dict[str, str],
+        type_: str,
+        use_cache: bool = True,
+    ) -> bytes:
+        """Returns a metadata response (main categories, sub-categories or groups) from the
+        catalog store or retrieves it from the API server and updates the store.
+
+        Args:
+            - url (str): Base API URL to be connected.
+            - extensions (dict[str, str]): url extensions which specifies the requested metadata.
+            - type_ (str): type of the request (the kind of the catalog node).
+            - use_cache (bool): Looks up the response in the catalog store and the response cache
+            (if any). A node is always retrieved again if False.
+
+        Raises:
+            - APIServiceConnectionException: for connection issues unless there is a stale node
+            in the catalog store that can be returned instead.
+
+        Returns:
+            - bytes: The response of the API Server.
+        """
+
+        if self.catalog is None:
+            return self._get_response(url, extensions=extensions, type_=type_, use_cache=use_cache)
+
+        code: str = str(extensions.get("code", ""))
+        node: tuple[bytes, float] | None = self.catalog.lookup(type_, code)
+        if use_cache and node is not None and self.catalog.is_fresh(node[1]):
+            return node[0]
+
+        try:
+            response: bytes = self._get_response(
+                url, extensions=extensions, type_=type_, use_cache=use_cache
+            )
+        except APIServiceConnectionException:
+            if node is None or not self.catalog.stale_if_error:
+                raise
+            return node[0]
+
+        self.catalog.set(type_, code, response)
+
+        return response
+
+    def _catalog_category_ids(self) -> list[int]:
+        """Returns the IDs of all available categories (main categories and their children)"""
+
+        id_field: str = self.cfg.category_id
+        categories: pd.DataFrame = (
+            self._all_categories if not self._all_categories.empty else self.main_categories
+        )
+        ids: pd.Series = categories[id_field].dropna().astype(int)
+
+        return list(dict.fromkeys(ids[~ids.isin(self.cfg.not_available_categories)].tolist()))
+
+    def _catalog_datagroups(self, responses: Sequence[bytes]) -> list[str]:
+        """Returns the datagroup codes listed in sub-category responses in order"""
+
+        datagroups: list[str] = []
+        for response in responses:
+            for item in load_json(response) or []:
+                if item.get(self.cfg.datagroup_code):
+                    datagroups.append(item[self.cfg.datagroup_code])
+
+        return list(dict.fromkeys(datagroups))
+
+    def _check_response(self, status_code: int, api_url: str, type_: str) -> None:
+        """Checks the status code of a response returned from the API server.
+
+        Args:
+            - status_code (int): HTTP status code of the response.
+            - api_url (str): requested url.
+            - type_ (str): type of the request.
+
+        Raises:
+            - WrongAPIKeyException: for APIKEY related issues.
+            - SeriesNotFoundException: if requested series is not found.
+            - GroupNotFoundException: if requested group or sub-category is not found.
+            - APIServiceConnectionException: for any other unsuccessful response.
+        """
+
+        if status_code == 404:
+            raise APIServiceConnectionException(
+                "EVDS API Server is currently down. Please retry later."
             )
 
-        if not request.status_code == 200:
-            print(f"request: {api_url}\nreturn:{request.status_code}\n")
+        if not status_code == 200:
+            print(f"request: {api_url}\nreturn:{status_code}\n")
 
             if self.first_request:
-                if request.status_code == 500:
+                # other requests confirm the key before they get here (see _confirm_api_key).
+                if status_code == 500:
                     raise WrongAPIKeyException(
                         f"Given api key {self.api_key} is wrong!\n"
                         f"Please check your key and try connection again."
@@ -927,14 +1439,12 @@ class Connector:
                     )
             raise APIServiceConnectionException(
                 f"\nEVDS API server didn't respond OK for the request above.\n"
-                f"The response given by the server is: {request.status_code}\n"
+                f"The response given by the server is: {status_code}\n"
                 f"Please make sure you requested correct original EVDS API series names "
                 f"or correct reference names you saved before."
             )
         self.first_request = False
 
-        return request.content
-
     def _generate_url_extensions(self, param_dict: dict[str, str]) -> str:
         """Returns extension text for the base API url.
 
@@ -967,7 +1477,9 @@ class Connector:
         # new names given
         new_names = list(new_names)
 
-        self.save_name_references(
+        # called explicitly, AsyncConnector.save_name_references is a coroutine.
+        Connector.save_name_references(
+            self,
             series_names=original_names,
             reference_names=new_names,
             old_reference_names=old_names,
@@ -1089,9 +1601,215 @@ class Connector:
         time_series: bool = True,
         ascending: bool = True,
         convert_to_bd: bool = True,
+        use_cache: bool = True,
+        incremental: bool = False,
     ) -> pd.DataFrame:
         """A dummy function for get_series"""
 
+        params, context = self._prepare_series_request(
+            series=series,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            aggregations=aggregations,
+            transformations=transformations,
+            keep_originals=keep_originals,
+            frequency=frequency,
+            new_names=new_names,
+            keep_references=keep_references,
+            time_series=time_series,
+            ascending=ascending,
+            convert_to_bd=convert_to_bd,
+        )
+
+        # transformations are computed by EVDS within the requested window, a refetch of the
+        # newest observations can't be merged into the stored ones.
+        if incremental and time_series and not self._is_transformed(params):
+            plan: dict[str, Any] = self._plan_incremental_request(params)
+            fresh: pd.DataFrame = pd.DataFrame()
+            if plan["params"] is not None:
+                frame, numeric = self._fetch_series_data(plan["params"], use_cache=use_cache)
+                fresh = self._parse_series_frame(
+                    frame, time_series, True, numeric=numeric, frequency=params["frequency"]
+                )
+            df: pd.DataFrame = self._merge_incremental_frame(plan, fresh, ascending)
+
+            return self._finalize_series_frame(df, context)
+
+        frame, numeric = self._fetch_series_data(params, use_cache=use_cache)
+        df: pd.DataFrame = self._parse_series_frame(
+            frame, time_series, ascending, numeric=numeric, frequency=params["frequency"]
+        )
+
+        return self._finalize_series_frame(df, context)
+
+    def _fetch_series_data(
+        self, params: dict[str, str], use_cache: bool = True
+    ) -> tuple[pd.DataFrame, bool]:
+        """Retrieves the observations of a series request splitting it into several requests
+        if it's too large (see _plan_series_chunks).
+
+        Args:
+            - params (dict[str, str]): series request parameters.
+            - use_cache (bool): Uses the response cache (if any).
+
+        Returns:
+            - tuple[pd.DataFrame, bool]: (observations, numeric) see load_series_frame.
+        """
+
+        chunks: list[dict[str, str]] = self._plan_series_chunks(params)
+
+        def fetch(chunk: dict[str, str]) -> tuple[pd.DataFrame, bool]:
+            data: bytes = self._get_response(
+                url=self.cfg.url_series, extensions=chunk, type_="series", use_cache=use_cache
+            )
+            return load_series_frame(data, field=self.cfg.raw_items)
+
+        if len(chunks) == 1:
+            return fetch(chunks[0])
+
+        if self.parallel_chunks:
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+                responses: list[tuple[pd.DataFrame, bool]] = list(executor.map(fetch, chunks))
+        else:
+            responses = [fetch(chunk) for chunk in chunks]
+
+        return self._stitch_series_chunks(chunks, responses)
+
+    def _plan_series_chunks(self, params: dict[str, str]) -> list[dict[str, str]]:
+        """Splits a series request into smaller requests by series groups (at most
+        max_series_per_request series) and by calendar year windows (estimated at most
+        max_observations_per_request observations). Requests with transformations are split
+        by series groups only.
+
+        Args:
+            - params (dict[str, str]): series request parameters.
+
+        Returns:
+            - list[dict[str, str]]: request parameters of the chunks ordered by date windows
+            and then by series groups. A request that doesn't need to be split is returned as is.
+        """
+
+        series: list[str] = params["series"].split("-")
+        formulas: list[str] = params["formulas"].split("-") if params["formulas"] else []
+        aggregations: list[str] = (
+            params["aggregationTypes"].split("-") if params["aggregationTypes"] else []
+        )
+
+        size: int = self.max_series_per_request
+        groups: list[range] = [
+            range(position, min(position + size, len(series)))
+            for position in range(0, len(series), size)
+        ]
+
+        start: datetime = datetime.strptime(params["startDate"], "%d-%m-%Y")
+        end: datetime = datetime.strptime(params["endDate"], "%d-%m-%Y")
+        frequency: str = str(params["frequency"] or "")
+        per_year: int = self.cfg.observations_per_year.get(frequency, 365)
+        window_years: int = max(
+            1, self.max_observations_per_request // (per_year * min(size, len(series)))
+        )
+
+        windows: list[tuple[datetime, datetime]] = [(start, end)]
+        # weekly periods don't start with the years, converted weekly data can't be split.
+        # transformations (percent change, difference, moving average...) are computed by EVDS
+        # within the requested window, a window would start without their history.
+        transformed: bool = self._is_transformed(params)
+        if end.year - start.year + 1 > window_years and frequency != "3" and not transformed:
+            windows = []
+            window_start: datetime = start
+            while window_start <= end:
+                window_end: datetime = min(
+                    datetime(window_start.year + window_years - 1, 12, 31), end
+                )
+                windows.append((window_start, window_end))
+                window_start = datetime(window_end.year + 1, 1, 1)
+
+        if len(groups) == 1 and len(windows) == 1:
+            return [params]
+
+        chunks: list[dict[str, str]] = []
+        for window_start, window_end in windows:
+            for group in groups:
+                chunk: dict[str, str] = dict(params)
+                chunk["series"] = "-".join(series[position] for position in group)
+                chunk["formulas"] = (
+                    "-".join(formulas[position] for position in group) if formulas else ""
+                )
+                chunk["aggregationTypes"] = (
+                    "-".join(aggregations[position] for position in group) if aggregations else ""
+                )
+                chunk["startDate"] = window_start.strftime("%d-%m-%Y")
+                chunk["endDate"] = window_end.strftime("%d-%m-%Y")
+                chunks.append(chunk)
+
+        return chunks
+
+    def _stitch_series_chunks(
+        self, chunks: list[dict[str, str]], responses: list[tuple[pd.DataFrame, bool]]
+    ) -> tuple[pd.DataFrame, bool]:
+        """Stitches the observations of the chunks of a split series request together.
+
+        Args:
+            - chunks (list[dict[str, str]]): chunk parameters created by _plan_series_chunks.
+            - responses (list[tuple[pd.DataFrame, bool]]): observations of the chunks in the
+            same order.
+
+        Returns:
+            - tuple[pd.DataFrame, bool]: observations as if they were returned by a single request.
+        """
+
+        date_field: str = "Tarih"
+        other_date_fields: list[str] = [self.cfg.unixtime, self.cfg.yearweek]
+        windows: dict[tuple[str, str], pd.DataFrame] = {}
+
+        # series groups of the same date window are joined on the dates and the windows are
+        # appended in order, rows keep their chronological order and an observation seen in
+        # more than one window takes the value of the later one.
+        for chunk, (frame, _) in zip(chunks, responses):
+            if frame.empty or date_field not in frame.columns:
+                continue
+            frame = frame.set_index(date_field)
+            window: tuple[str, str] = (chunk["startDate"], chunk["endDate"])
+            joined: pd.DataFrame | None = windows.get(window, None)
+            if joined is None:
+                windows[window] = frame
+                continue
+            frame = frame.drop(columns=[f for f in other_date_fields if f in joined.columns])
+            windows[window] = pd.concat([joined, frame], axis=1, join="outer", sort=False)
+
+        numeric: bool = all(numeric for _, numeric in responses)
+        if not windows:
+            return pd.DataFrame(), numeric
+
+        df: pd.DataFrame = pd.concat(list(windows.values()), axis=0, sort=False)
+        df = df[~df.index.duplicated(keep="last")]
+
+        return df.reset_index(names=date_field), numeric
+
+    def _prepare_series_request(
+        self,
+        series: str | Sequence[str],
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | pd.Timestamp | None = None,
+        period: str | None = None,
+        aggregations: str | list[str] | tuple[str] | None = None,
+        transformations: str | list[str] | tuple[str] | None = None,
+        keep_originals: bool = True,
+        frequency: str | int | None = None,
+        new_names: Sequence[str] | None = None,
+        keep_references: bool = False,
+        time_series: bool = True,
+        ascending: bool = True,
+        convert_to_bd: bool = True,
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        """Returns API request parameters and the context which is required to process
+        the response of a series request.
+
+        Returns:
+            - tuple[dict[str, str], dict[str, Any]]: (request_parameters, context)
+        """
+
         if transformations and aggregations:
             raise AmbiguousFunctionMappingException(
                 "Using transformation and aggregation function mappings at the same time is an "
@@ -1153,17 +1871,65 @@ class Connector:
             frequency=frequency,
         )
 
-        data: bytes = self._get_response(url=self.cfg.url_series, extensions=params, type_="series")
-        json_data: JSONType = load_json(data, field=self.cfg.raw_items)
+        context: dict[str, Any] = dict(
+            series=series,
+            old_names=old_names,
+            new_names=new_names,
+            transformations=transformations,
+            aggregations=aggregations,
+            transformations_param=transformations_param,
+            aggregations_param=aggregations_param,
+            keep_originals=keep_originals,
+            keep_references=keep_references,
+            time_series=time_series,
+        )
 
-        # Convert to DataFrame
-        df: pd.DataFrame = pd.DataFrame(json_data)
+        return params, context
+
+    def _parse_series_frame(
+        self,
+        data: bytes | pd.DataFrame,
+        time_series: bool,
+        ascending: bool,
+        numeric: bool = False,
+        frequency: str = "",
+    ) -> pd.DataFrame:
+        """Returns a DataFrame from a given series response of the API service.
+
+        Args:
+            - data (bytes | pd.DataFrame): series response or its observations.
+            - time_series (bool): converts the DataFrame into time series if True.
+            - ascending (bool): sort direction of the index.
+            - numeric (bool, optional): given observations are already float32.
+            - frequency (str, optional): requested frequency code. Defaults to "" (as is).
+
+        Returns:
+            - pd.DataFrame: series with their original EVDS names.
+        """
+
+        # Convert to DataFrame
+        if isinstance(data, bytes):
+            df, numeric = load_series_frame(data, field=self.cfg.raw_items)
+        else:
+            df: pd.DataFrame = data
+        # Build the time series index from the UNIXTIME stamps of the observations
+        index: pd.DatetimeIndex | None = None
+        if time_series and self.cfg.unixtime in df.columns:
+            index = create_ts_index_from_unixtime(
+                df[self.cfg.unixtime].to_numpy(),
+                dates=df["Tarih"].to_numpy() if "Tarih" in df.columns else None,
+                frequency=frequency,
+            )
         # Clear unnecessary fields
         df = drop_columns(df, [self.cfg.unixtime, self.cfg.yearweek])
         # Ensure all numerical fields are represented as float32 type in DataFrame
-        df = as_real(df, "float32")
+        if not numeric:
+            df = as_real(df, "float32")
         # Convert to time series
-        if time_series:
+        if index is not None:
+            df = drop_columns(df, ["Tarih"])
+            df.index = index
+        elif time_series:
             df = convert_to_time_series(df)
         else:
             df.rename(columns={"Tarih": "Date"}, errors="ignore", inplace=True)
@@ -1171,6 +1937,154 @@ class Connector:
         df = drop_na_columns(df)
         # Sort values
         df.sort_index(ascending=ascending, inplace=True)
+
+        return df
+
+    @staticmethod
+    def _is_transformed(params: dict[str, str]) -> bool:
+        """Returns True if any series of a request is transformed (formula other than level).
+
+        Args:
+            - params (dict[str, str]): series request parameters.
+
+        Returns:
+            - bool: True if the request has transformations.
+        """
+
+        formulas: list[str] = params["formulas"].split("-") if params["formulas"] else []
+
+        return any(formula not in ("", "0") for formula in formulas)
+
+    def _plan_incremental_request(self, params: dict[str, str]) -> dict[str, Any]:
+        """Decides which part of a series request must be retrieved from the API service
+        considering the observations that are already kept in the series store.
+
+        Args:
+            - params (dict[str, str]): series request parameters.
+
+        Returns:
+            - dict[str, Any]: a plan consisting of:
+                - key: store key of the request.
+                - request: original request parameters.
+                - params: parameters to be requested or None if the store covers the request.
+                - stored: stored frame or None if a full request is needed.
+                - start: the earliest date the stored frame will cover after the request.
+        """
+
+        if self.store is None:
+            self.store = SeriesStore()
+
+        key: str = self.store.make_key(params)
+        plan: dict[str, Any] = dict(
+            key=key, request=params, params=dict(params), stored=None, start=params["startDate"]
+        )
+
+        loaded: tuple[pd.DataFrame, dict[str, Any]] | None = self.store.load(key)
+        if loaded is None:
+            return plan
+
+        stored, entry = loaded
+        requested_start: datetime = datetime.strptime(params["startDate"], "%d-%m-%Y")
+        requested_end: datetime = datetime.strptime(params["endDate"], "%d-%m-%Y")
+        covered_start: datetime = datetime.strptime(entry["start"], "%d-%m-%Y")
+        last_seen: datetime = datetime.strptime(entry["last"], "%d-%m-%Y")
+
+        if requested_start < covered_start:
+            # the store doesn't go back that far, retrieve the whole window again.
+            return plan
+
+        plan["stored"] = stored
+        plan["start"] = entry["start"]
+
+        if requested_end < last_seen:
+            # everything requested is already in the store.
+            plan["params"] = None
+        else:
+            # the last observation is requested again to catch its revisions.
+            plan["params"]["startDate"] = entry["last"]
+
+        return plan
+
+    def _merge_incremental_frame(
+        self, plan: dict[str, Any], fresh: pd.DataFrame, ascending: bool = True
+    ) -> pd.DataFrame:
+        """Merges newly retrieved observations into the stored ones, updates the store and
+        returns the requested window.
+
+        Args:
+            - plan (dict[str, Any]): plan created by _plan_incremental_request.
+            - fresh (pd.DataFrame): observations retrieved from the API service (ascending).
+            - ascending (bool, optional): Sort direction of the index. Defaults to True.
+
+        Returns:
+            - pd.DataFrame: the requested window of the series with original EVDS names.
+        """
+
+        stored: pd.DataFrame | None = plan["stored"]
+
+        if not fresh.empty and not isinstance(fresh.index, pd.DatetimeIndex):
+            # the response couldn't be converted to time series so it can't be stored.
+            return fresh.sort_index(ascending=ascending)
+
+        if stored is None:
+            merged: pd.DataFrame = fresh
+        elif fresh.empty:
+            merged = stored
+        else:
+            freq: str | None = stored.index.freqstr if stored.index.freq is not None else None
+            # newer values overwrite the stored ones (revisions).
+            merged = fresh.combine_first(stored).sort_index()
+            columns: list[str] = list(stored.columns) + [
+                column for column in fresh.columns if column not in stored.columns
+            ]
+            merged = merged[columns].astype("float32")
+            merged.index.name = "Date"
+            if freq:
+                try:
+                    merged.index.freq = freq
+                except ValueError:
+                    pass
+
+        if plan["params"] is not None and not merged.empty:
+            self.store.save(plan["key"], merged, plan["request"], plan["start"])
+
+        start: pd.Timestamp = pd.Timestamp(
+            datetime.strptime(plan["request"]["startDate"], "%d-%m-%Y")
+        )
+        end: pd.Timestamp = pd.Timestamp(datetime.strptime(plan["request"]["endDate"], "%d-%m-%Y"))
+        if not fresh.empty:
+            end = max(end, fresh.index.max())
+        else:
+            # the index is stamped at the end of periods, include the period that end is in.
+            position: int = merged.index.searchsorted(end, side="left")
+            if position < len(merged.index) and merged.index.freq is not None:
+                if merged.index[position] - merged.index.freq < end:
+                    end = merged.index[position]
+
+        df: pd.DataFrame = merged.loc[(merged.index >= start) & (merged.index <= end)]
+
+        return drop_na_columns(df.copy()).sort_index(ascending=ascending)
+
+    def _finalize_series_frame(self, df: pd.DataFrame, context: dict[str, Any]) -> pd.DataFrame:
+        """Saves name references and renames the columns of a parsed series DataFrame.
+
+        Args:
+            - df (pd.DataFrame): parsed series.
+            - context (dict[str, Any]): context created while preparing the request.
+
+        Returns:
+            - pd.DataFrame: series with their final names.
+        """
+
+        series: list[str] = context["series"]
+        old_names: list[str] = context["old_names"]
+        new_names: list[str] | None = context["new_names"]
+        transformations: list[str] = context["transformations"]
+        aggregations: list[str] = context["aggregations"]
+        keep_originals: bool = context["keep_originals"]
+        keep_references: bool = context["keep_references"]
+        time_series: bool = context["time_series"]
+
         # add to references (must always be done before renaming columns with reference names)
         if (new_names and keep_references) and not (all(transformations) or all(aggregations)):
             # series names can be misleading if any transformation or aggregation is applied to
@@ -1192,79 +2106,16 @@ class Connector:
             df = set_column_names(df, new_names, double_size=double_size)
         else:
             # auto rename columns if there are reference names assigned before
-            self._auto_rename_columns(df, series, transformations_param, aggregations_param)
-
-        self.data = df
+            self._auto_rename_columns(
+                df, series, context["transformations_param"], context["aggregations_param"]
+            )
 
         return df
 
-    def save_key(self, key: str | None = None) -> None:
-        """Saves provided key to disk that is loaded automatically while instantiation if any other
-        key is not supplied explicitly.
-
-        Args:
-            key (str): Your EVDS API Key
-        """
-        if not key:
-            if self.api_key:
-                key = self.api_key
-            else:
-                raise ValueError("You need to supply an EVDS Key to save")
-        else:
-            self.api_key = key
-
-        write_json(self.cfg.key_file, dict(key=key))
-
-        print(f"{key} has been saved to -> {self.cfg.key_file}")
-
-    def show_transformation_references(self) -> None:
-        """Shows current transformation functions map that is used by EVDS API
-        to determine the frequency of a series.
-        """
-        self._show_references(
-            references=self.cfg.transformations_map, reference_type="transformation function"
-        )
-
-    def show_aggregation_references(self) -> None:
-        """Shows current aggregation functions map that is used by EVDS API
-        to determine the frequency of a series.
-        """
-        self._show_references(
-            references=self.cfg.aggregations_map, reference_type="aggregation function"
-        )
-
-    def show_frequency_references(self) -> None:
-        """Shows current frequency reference mapping."""
-
-        self._show_references(references=self.cfg.frequency_map, reference_type="frequency")
-
-    def show_name_references(self) -> None:
-        """Shows current series names reference mapping."""
-
-        self._show_references(references=self.name_cache, reference_type="series")
-
-    def get_main_categories(
+    def _format_main_categories(
         self, as_dict: bool = False, raw: bool = False, serialize: bool = False
     ) -> pd.DataFrame | JSONType | dict[str, Any]:
-        """Returns main data categories defined on EVDS in different formats
-
-        Args:
-            - as_dict (bool, optional): Returns main categories as a dictionary
-            - forming{CATEGORY_ID: category_name}. Defaults to False.
-            - raw (bool, optional): returns untouched JSON object retrieved from EVDS Service
-            - instead of processed types. Defaults to False
-
-        Raises:
-            - AmbiguousOutputTypeException: If both as_dict and as_raw is given True
-
-        Returns:
-            - pd.DataFrame | JSONType | dict: EVDS Service Main Categories.
-        """
-
-        if as_dict and raw:
-            raise AmbiguousOutputTypeException(
-                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
-            )
+        """Returns main categories in requested format (see get_main_categories)"""
 
         if not (as_dict or raw or serialize):
             return self.main_categories
@@ -1282,61 +2133,15 @@ class Connector:
 
         return main_dict
 
-    def get_sub_categories(
+    def _format_sub_categories(
         self,
-        main_category: int | str,
+        json_sub_categories: JSONType,
         as_dict: bool = False,
         raw: bool = False,
         verbose: bool = False,
         serialize: bool = False,
     ) -> pd.DataFrame | JSONType | dict[str, Any]:
-        """Returns sub-categories of main categories as DataFrame (or other types supported).
-
-        Args:
-            - main_category (int | str]): Could be a main category ID
-            or an actual main category name.
-                - integer: returns sub-categories which given value corresponds to main category ID.
-                - string: returns sub-categories which belongs to given main category name.
-            - as_dict (bool, optional): Returns a dictionary forming
-            {datagroup_code: datagroup_name} Defaults to False
-            - raw (bool, optional): returns untouched JSON object retrieved from EVDS Service
-            instead of processed types. Defaults to False
-            - verbose (bool, optional): a detailed version of retrieved data. Defaults to False.
-
-        Raises:
-            - AmbiguousOutputTypeException: If both as_dict and as_raw is given True
-            - SubCategoryNotFoundException: If provided sub-category is not found on EVDS
-
-        Returns:
-           - pd.DataFrame | JSONType | dict: Sub-Categories which given main categories include
-           in.
-        """
-
-        if as_dict and raw:
-            raise AmbiguousOutputTypeException(
-                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
-            )
-
-        params: dict[str, str | int] = self._find_sub_category(main_category)
-        sub_categories: bytes = self._get_response(
-            url=self.cfg.url_sub_categories, extensions=params, type_="sub_categories"
-        )
-        json_sub_categories: JSONType = load_json(sub_categories)
-
-        if not json_sub_categories:
-            child_ids = self._get_child_category_ids(params.get("code"))
-            if child_ids:
-                json_sub_categories = []
-                for child_id in child_ids:
-                    child_params: dict[str, str | int] = dict(mode=2, code=child_id, type="json")
-                    child_response: bytes = self._get_response(
-                        url=self.cfg.url_sub_categories,
-                        extensions=child_params,
-                        type_="sub_categories",
-                    )
-                    child_data: JSONType = load_json(child_response)
-                    if child_data:
-                        json_sub_categories.extend(child_data)
+        """Returns retrieved sub-categories in requested format (see get_sub_categories)"""
 
         if not json_sub_categories:
             raise SubCategoryNotFoundException(
@@ -1406,35 +2211,353 @@ class Connector:
 
             return sub_dict
 
-        df: pd.DataFrame = pd.DataFrame(json_sub_categories)
+        df: pd.DataFrame = pd.DataFrame(json_sub_categories)
+
+        if self.language == "ENG":
+            df[datagroup_frequency] = pd.Series(df.iloc[:, :][datagroup_frequency]).map(
+                self.cfg.english_frequency_map
+            )
+
+        if verbose:
+            return df
+
+        columns: list[str] = [
+            datagroup_code,
+            datagroup_id,
+            datagroup_name,
+            datagroup_frequency,
+            start_date,
+            end_date,
+        ]
+
+        df = df[columns].iloc[:, :]
+
+        try:
+            # in case of any conversion error the string dates better to be preserved.
+            df[start_date] = pd.to_datetime(df[start_date].iloc[:], format="%d-%m-%Y")
+            df[end_date] = pd.to_datetime(df[end_date].iloc[:], format="%d-%m-%Y")
+        except Exception:
+            pass
+
+        return df
+
+    def _format_groups(
+        self,
+        json_groups: JSONType,
+        as_dict: bool = False,
+        raw: bool = False,
+        verbose: bool = False,
+        parse_dt: bool = False,
+        serialize: bool = False,
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns retrieved groups in requested format (see get_groups)"""
+
+        if not json_groups:
+            raise GroupNotFoundException(
+                "Requested group is not found on EVDS!\n"
+                "Are you sure you provided a correct group name?"
+            ) from None
+
+        if raw:
+            return json_groups
+
+        series_name: str = (
+            self.cfg.series_name
+            if self.language == "TR"
+            else self.cfg.series_name + "_" + self.language
+        )
+        series_code: str = self.cfg.series_code
+        frequency: str = self.cfg.frequency_str
+        start_date: str = self.cfg.start_date
+        end_date: str = self.cfg.end_date
+
+        if as_dict or serialize:
+            if not verbose:
+                try:
+                    sub_dict: dict[str, str] = {
+                        sub[series_code]: [
+                            sub[series_name],
+                            sub[frequency],
+                            sub[start_date],
+                            sub[end_date],
+                        ]
+                        for sub in json_groups
+                        for i in range(len(json_groups))
+                    }
+
+                except KeyError:
+                    if self.language == "TR":
+                        return {"TANIMSIZ": ["TANIMSIZ" for i in range(4)]}
+                    else:
+                        return {"UNDEFINED": ["UNDEFINED" for i in range(4)]}
+            else:
+                sub_dict = {
+                    sub[series_code]: [sub[field] for field in sub if field != series_code]
+                    for sub in json_groups
+                }
+
+            if self.language == "ENG":
+                sub_dict = {
+                    k: list(
+                        map(
+                            lambda val: (
+                                self.cfg.english_frequency_map[val]
+                                if val in self.cfg.english_frequency_map
+                                else val
+                            ),
+                            v,
+                        )
+                    )
+                    for k, v in sub_dict.items()
+                }
+            if parse_dt:
+                sub_dict = {
+                    k: list(map(lambda val: parse_dates(val, ignore_errors=True), v))
+                    for k, v in sub_dict.items()
+                }
+
+            return sub_dict
+
+        df: pd.DataFrame = pd.DataFrame(json_groups)
+
+        if self.language == "ENG":
+            df[frequency] = df[frequency].iloc[:].map(self.cfg.english_frequency_map)
+
+        try:
+            # in case of any conversion error the string dates better to be preserved.
+            df[start_date] = pd.to_datetime(df[start_date].iloc[:], format="%d-%m-%Y")
+            df[end_date] = pd.to_datetime(df[end_date].iloc[:], format="%d-%m-%Y")
+        except Exception:
+            pass
+
+        columns: list[str] = [series_name, series_code, frequency, start_date, end_date]
+
+        if verbose:
+            return df
+
+        return df[columns]
+
+    def _format_series_output(
+        self,
+        result: pd.DataFrame,
+        raw: bool = False,
+        as_dict: bool = False,
+        serialize: bool = False,
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns retrieved series in requested format (see get_series)"""
+
+        if self.precision is not None:
+            result = _set_precision(result, self.precision)
+
+        if raw:
+            return result.to_json(orient="columns", date_format="iso")
+
+        if as_dict:
+            return result.to_dict(orient="dict")
+
+        if serialize:
+            return json.loads(
+                result.to_json(
+                    orient="split",
+                    index=True,
+                    date_format="iso",
+                )
+            )
+
+        return result
+
+    def _label_batch_requests(
+        self,
+        series_requests: Sequence[str | Sequence[str] | dict[str, Any]] | dict[str, Any],
+        join: bool = False,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Returns labelled get_series parameters for given batch requests.
+
+        Args:
+            - series_requests (Sequence | dict): Requests given to get_series_batch.
+            - join (bool, optional): results are requested to be joined.
+
+        Raises:
+            - TypeError: If requests are not given in a supported container.
+            - AmbiguousOutputTypeException: If results are requested to be joined but any of the
+            requests returns an output type other than DataFrame.
+
+        Returns:
+            - list[tuple[str, dict[str, Any]]]: (label, get_series parameters) pairs.
+        """
+
+        if isinstance(series_requests, Mapping):
+            labelled_requests: list[tuple[str, Any]] = [
+                (str(k), v) for k, v in series_requests.items()
+            ]
+        elif isinstance(series_requests, Sequence) and not isinstance(series_requests, str):
+            labelled_requests = []
+            labels: set[str] = set()
+            for idx, series_request in enumerate(series_requests):
+                series: Any = (
+                    series_request.get("series", "")
+                    if isinstance(series_request, Mapping)
+                    else series_request
+                )
+                label: str = series if isinstance(series, str) else ", ".join(map(str, series))
+                label = label if label not in labels else f"{label}_{idx}"
+                labels.add(label)
+                labelled_requests.append((label, series_request))
+        else:
+            raise TypeError(
+                "Batch requests must be given in a Sequence type container like a list or tuple "
+                "or in a dictionary forming {label: request}"
+            )
+
+        kwargs_list: list[tuple[str, dict[str, Any]]] = [
+            (label, dict(series_request))
+            if isinstance(series_request, Mapping)
+            else (label, dict(series=series_request))
+            for label, series_request in labelled_requests
+        ]
+
+        if join and any(
+            kwargs.get("raw") or kwargs.get("as_dict") or kwargs.get("serialize")
+            for _, kwargs in kwargs_list
+        ):
+            raise AmbiguousOutputTypeException(
+                "Output type is ambiguous. Results can only be joined if they're DataFrames."
+            )
+
+        return kwargs_list
+
+    def save_key(self, key: str | None = None) -> None:
+        """Saves provided key to disk that is loaded automatically while instantiation if any other
+        key is not supplied explicitly.
+
+        Args:
+            key (str): Your EVDS API Key
+        """
+        if not key:
+            if self.api_key:
+                key = self.api_key
+            else:
+                raise ValueError("You need to supply an EVDS Key to save")
+        else:
+            self.api_key = key
+
+        write_json(self.cfg.key_file, dict(key=key))
+
+        print(f"{key} has been saved to -> {self.cfg.key_file}")
+
+    def show_transformation_references(self) -> None:
+        """Shows current transformation functions map that is used by EVDS API
+        to determine the frequency of a series.
+        """
+        self._show_references(
+            references=self.cfg.transformations_map, reference_type="transformation function"
+        )
+
+    def show_aggregation_references(self) -> None:
+        """Shows current aggregation functions map that is used by EVDS API
+        to determine the frequency of a series.
+        """
+        self._show_references(
+            references=self.cfg.aggregations_map, reference_type="aggregation function"
+        )
+
+    def show_frequency_references(self) -> None:
+        """Shows current frequency reference mapping."""
+
+        self._show_references(references=self.cfg.frequency_map, reference_type="frequency")
+
+    def show_name_references(self) -> None:
+        """Shows current series names reference mapping."""
+
+        self._show_references(references=self.name_cache, reference_type="series")
+
+    def get_main_categories(
+        self, as_dict: bool = False, raw: bool = False, serialize: bool = False
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns main data categories defined on EVDS in different formats
+
+        Args:
+            - as_dict (bool, optional): Returns main categories as a dictionary
+            - forming{CATEGORY_ID: category_name}. Defaults to False.
+            - raw (bool, optional): returns untouched JSON object retrieved from EVDS Service
+            - instead of processed types. Defaults to False
+
+        Raises:
+            - AmbiguousOutputTypeException: If both as_dict and as_raw is given True
+
+        Returns:
+            - pd.DataFrame | JSONType | dict: EVDS Service Main Categories.
+        """
+
+        if as_dict and raw:
+            raise AmbiguousOutputTypeException(
+                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
+            )
+
+        return self._format_main_categories(as_dict=as_dict, raw=raw, serialize=serialize)
+
+    def get_sub_categories(
+        self,
+        main_category: int | str,
+        as_dict: bool = False,
+        raw: bool = False,
+        verbose: bool = False,
+        serialize: bool = False,
+        use_cache: bool = True,
+        recursive: bool = False,
+    ) -> pd.DataFrame | JSONType | dict[str, Any]:
+        """Returns sub-categories of main categories as DataFrame (or other types supported).
+
+        Args:
+            - main_category (int | str]): Could be a main category ID
+            or an actual main category name.
+                - integer: returns sub-categories which given value corresponds to main category ID.
+                - string: returns sub-categories which belongs to given main category name.
+            - as_dict (bool, optional): Returns a dictionary forming
+            {datagroup_code: datagroup_name} Defaults to False
+            - raw (bool, optional): returns untouched JSON object retrieved from EVDS Service
+            instead of processed types. Defaults to False
+            - verbose (bool, optional): a detailed version of retrieved data. Defaults to False.
+            - use_cache (bool, optional): Uses the response cache and the catalog store (if the
+            Connector has them). Set False to retrieve the sub-categories again. Defaults to True.
+            - recursive (bool, optional): A category without sub-categories of its own is
+            resolved through its child categories. If True, the child categories that have no
+            sub-categories are resolved through their own children too, down to the leaves of
+            the subtree. Defaults to False (one level).
 
-        if self.language == "ENG":
-            df[datagroup_frequency] = pd.Series(df.iloc[:, :][datagroup_frequency]).map(
-                self.cfg.english_frequency_map
-            )
+        Raises:
+            - AmbiguousOutputTypeException: If both as_dict and as_raw is given True
+            - SubCategoryNotFoundException: If provided sub-category is not found on EVDS
 
-        if verbose:
-            return df
+        Returns:
+           - pd.DataFrame | JSONType | dict: Sub-Categories which given main categories include
+           in.
+        """
 
-        columns: list[str] = [
-            datagroup_code,
-            datagroup_id,
-            datagroup_name,
-            datagroup_frequency,
-            start_date,
-            end_date,
-        ]
+        if as_dict and raw:
+            raise AmbiguousOutputTypeException(
+                "Output type is ambiguous. Please select either 'raw' or 'dict' type."
+            )
 
-        df = df[columns].iloc[:, :]
+        params: dict[str, str | int] = self._find_sub_category(main_category)
+        sub_categories: bytes = self._get_metadata_response(
+            url=self.cfg.url_sub_categories,
+            extensions=params,
+            type_="sub_categories",
+            use_cache=use_cache,
+        )
+        json_sub_categories: JSONType = load_json(sub_categories)
 
-        try:
-            # in case of any conversion error the string dates better to be preserved.
-            df[start_date] = pd.to_datetime(df[start_date].iloc[:], format="%d-%m-%Y")
-            df[end_date] = pd.to_datetime(df[end_date].iloc[:], format="%d-%m-%Y")
-        except Exception:
-            pass
+        if not json_sub_categories:
+            child_sub_categories: list[dict[str, Any]] = self._get_child_sub_categories(
+                params.get("code"), use_cache=use_cache, recursive=recursive
+            )
+            if child_sub_categories:
+                json_sub_categories = child_sub_categories
 
-        return df
+        return self._format_sub_categories(
+            json_sub_categories, as_dict=as_dict, raw=raw, verbose=verbose, serialize=serialize
+        )
 
     def get_groups(
         self,
@@ -1444,6 +2567,7 @@ class Connector:
         verbose: bool = False,
         parse_dt: bool = False,
         serialize: bool = False,
+        use_cache: bool = True,
     ) -> pd.DataFrame | JSONType | dict[str, Any]:
         """Returns all series names, codes and observations start dates belong to given
         sub-categories as DataFrame (or other supported formats).
@@ -1459,6 +2583,8 @@ class Connector:
             - parse_dt (bool, optional): Defaults to False:
                 - True: datetime fields in returned dictionary are converted to Python date object.
                 - False: datetime fields in returned dictionary are returned as is (string)
+            - use_cache (bool, optional): Uses the response cache and the catalog store (if the
+            Connector has them). Set False to retrieve the group again. Defaults to True.
 
         Raises:
             - AmbiguousOutputTypeException: If both as_dict and as_raw is given True
@@ -1474,95 +2600,19 @@ class Connector:
             )
 
         params: dict[str, str] = dict(code=data_group_code, type="json")
-        series: bytes = self._get_response(
-            url=self.cfg.url_groups, extensions=params, type_="groups"
+        series: bytes = self._get_metadata_response(
+            url=self.cfg.url_groups, extensions=params, type_="groups", use_cache=use_cache
         )
         json_groups: JSONType = load_json(series)
 
-        if not json_groups:
-            raise GroupNotFoundException(
-                "Requested group is not found on EVDS!\n"
-                "Are you sure you provided a correct group name?"
-            ) from None
-
-        if raw:
-            return json_groups
-
-        series_name: str = (
-            self.cfg.series_name
-            if self.language == "TR"
-            else self.cfg.series_name + "_" + self.language
+        return self._format_groups(
+            json_groups,
+            as_dict=as_dict,
+            raw=raw,
+            verbose=verbose,
+            parse_dt=parse_dt,
+            serialize=serialize,
         )
-        series_code: str = self.cfg.series_code
-        frequency: str = self.cfg.frequency_str
-        start_date: str = self.cfg.start_date
-        end_date: str = self.cfg.end_date
-
-        if as_dict or serialize:
-            if not verbose:
-                try:
-                    sub_dict: dict[str, str] = {
-                        sub[series_code]: [
-                            sub[series_name],
-                            sub[frequency],
-                            sub[start_date],
-                            sub[end_date],
-                        ]
-                        for sub in json_groups
-                        for i in range(len(json_groups))
-                    }
-
-                except KeyError:
-                    if self.language == "TR":
-                        return {"TANIMSIZ": ["TANIMSIZ" for i in range(4)]}
-                    else:
-                        return {"UNDEFINED": ["UNDEFINED" for i in range(4)]}
-            else:
-                sub_dict = {
-                    sub[series_code]: [sub[field] for field in sub if field != series_code]
-                    for sub in json_groups
-                }
-
-            if self.language == "ENG":
-                sub_dict = {
-                    k: list(
-                        map(
-                            lambda val: (
-                                self.cfg.english_frequency_map[val]
-                                if val in self.cfg.english_frequency_map
-                                else val
-                            ),
-                            v,
-                        )
-                    )
-                    for k, v in sub_dict.items()
-                }
-            if parse_dt:
-                sub_dict = {
-                    k: list(map(lambda val: parse_dates(val, ignore_errors=True), v))
-                    for k, v in sub_dict.items()
-                }
-
-            return sub_dict
-
-        df: pd.DataFrame = pd.DataFrame(json_groups)
-
-        if self.language == "ENG":
-            df[frequency] = df[frequency].iloc[:].map(self.cfg.english_frequency_map)
-
-        try:
-            # in case of any conversion error the string dates better to be preserved.
-            df[start_date] = pd.to_datetime(df[start_date].iloc[:], format="%d-%m-%Y")
-            df[end_date] = pd.to_datetime(df[end_date].iloc[:], format="%d-%m-%Y")
-        except Exception:
-            pass
-
-        columns: list[str] = [series_name, series_code, frequency, start_date, end_date]
-
-        if verbose:
-            return df
-
-        return df[columns]
 
     def get_series(
         self,
@@ -1582,6 +2632,8 @@ class Connector:
         as_dict: bool = False,
         serialize: bool = False,
         convert_to_bd: bool = True,
+        use_cache: bool = True,
+        incremental: bool = False,
     ) -> pd.DataFrame | JSONType | dict[str, Any]:
         """Returns requested time series from the EVDS API Service.
 
@@ -1681,17 +2733,76 @@ class Connector:
             - serialize(bool, optional): Returns retrieved data as JSON serializable dict.
             - convert_to_bd (bool, optional): Checks start_date and end_date and returns the nearest
             business date if any of them encounters in weekend. Defaults to True.
+            - use_cache (bool, optional): Uses the response cache (if the Connector has one).
+            Set False to bypass the cache for this call. Defaults to True.
+            - incremental (bool, optional): Requests only the observations that are newer than
+            the ones kept in the local series store (see `store` parameter of Connector) and
+            merges them into the stored series. The whole window is requested if the store
+            doesn't cover the start date yet. Works only if time_series is True, requests with
+            transformations are always retrieved as a whole. Defaults to False.
 
         Raises:
             - AmbiguousOutputTypeException: If both as_dict and as_raw is given True
 
         Usage:
             - x.get_series(["TP.FE.OKTG01", "TP.DK.USD.A.YTL"], start_date=1-1-2022)
+            - x.get_series("TP.DK.USD.A.YTL", start_date="01-01-2000", incremental=True)
 
         Returns:
             - pd.DataFrame | JSONType | dict: Time Series in requested format.
         """
 
+        result: pd.DataFrame
+        output: pd.DataFrame | JSONType | dict[str, Any]
+        result, output = self._series_output(
+            series=series,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            aggregations=aggregations,
+            transformations=transformations,
+            keep_originals=keep_originals,
+            frequency=frequency,
+            new_names=new_names,
+            keep_references=keep_references,
+            time_series=time_series,
+            ascending=ascending,
+            raw=raw,
+            as_dict=as_dict,
+            serialize=serialize,
+            convert_to_bd=convert_to_bd,
+            use_cache=use_cache,
+            incremental=incremental,
+        )
+        self.data = result
+
+        return output
+
+    def _series_output(
+        self,
+        series: str | Sequence[str],
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | pd.Timestamp | None = None,
+        period: str | None = None,
+        aggregations: str | list[str] | tuple[str] | None = None,
+        transformations: str | list[str] | tuple[str] | None = None,
+        keep_originals: bool = True,
+        frequency: str | int | None = None,
+        new_names: Sequence[str] | None = None,
+        keep_references: bool = False,
+        time_series: bool = True,
+        ascending: bool = True,
+        raw: bool = False,
+        as_dict: bool = False,
+        serialize: bool = False,
+        convert_to_bd: bool = True,
+        use_cache: bool = True,
+        incremental: bool = False,
+    ) -> tuple[pd.DataFrame, pd.DataFrame | JSONType | dict[str, Any]]:
+        """Returns requested time series both as retrieved and in requested format without
+        keeping them in `data` (see get_series).
+        """
+
         if as_dict and raw:
             raise AmbiguousOutputTypeException(
                 "Output type is ambiguous. Please select either 'raw' or 'dict' type."
@@ -1699,12 +2810,14 @@ class Connector:
 
         new_names_1: list[str] = []
         new_names_2: list[str] = []
+        with_originals: bool = bool(aggregations and keep_originals and time_series)
 
-        if aggregations and keep_originals and time_series and new_names:
+        if with_originals and new_names:
             new_names, _ = self._parse_series_names(new_names, check_references=False)
             new_names_1 = [name for idx, name in enumerate(new_names) if idx >= len(new_names) / 2]
+            new_names_2 = [name for idx, name in enumerate(new_names) if idx < len(new_names) / 2]
 
-        result: pd.DataFrame = self._get_series(
+        request: dict[str, Any] = dict(
             series=series,
             start_date=start_date,
             end_date=end_date,
@@ -1718,47 +2831,207 @@ class Connector:
             time_series=time_series,
             ascending=ascending,
             convert_to_bd=convert_to_bd,
+            use_cache=use_cache,
+            incremental=incremental,
         )
 
-        # any other operations needed.
-        if aggregations and keep_originals and time_series and new_names:
-            new_names, _ = self._parse_series_names(new_names, check_references=False)
-            new_names_2 = [name for idx, name in enumerate(new_names) if idx < len(new_names) / 2]
-
-        if aggregations and keep_originals and time_series:
-            originals: pd.DataFrame = self._get_series(
-                series=series,
-                start_date=start_date,
-                end_date=end_date,
-                period=period,
-                frequency=frequency,
-                new_names=new_names_2 if new_names_2 else new_names,
-                time_series=time_series,
-                ascending=ascending,
-                convert_to_bd=convert_to_bd,
+        if not with_originals:
+            result: pd.DataFrame = self._get_series(**request)
+            return result, self._format_series_output(
+                result, raw=raw, as_dict=as_dict, serialize=serialize
             )
 
-            result = pd.concat([originals, result], axis=1)
+        # aggregated series and their originals share the same column names on EVDS, so they
+        # can't be requested together. Request them at the same time instead: two concurrent
+        # requests (one wall-clock round trip). The cache and the series store are used by both.
+        originals_request: dict[str, Any] = dict(
+            series=series,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            frequency=frequency,
+            new_names=new_names_2 if new_names_2 else new_names,
+            time_series=time_series,
+            ascending=ascending,
+            convert_to_bd=convert_to_bd,
+            use_cache=use_cache,
+            incremental=incremental,
+        )
 
-        if self.precision is not None:
-            result = _set_precision(result, self.precision)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            aggregated_future: Future = executor.submit(self._get_series, **request)
+            originals_future: Future = executor.submit(self._get_series, **originals_request)
+            result = aggregated_future.result()
+            originals: pd.DataFrame = originals_future.result()
 
-        if raw:
-            return result.to_json(orient="columns", date_format="iso")
+        result = pd.concat([originals, result], axis=1)
 
-        if as_dict:
-            return result.to_dict(orient="dict")
+        return result, self._format_series_output(
+            result, raw=raw, as_dict=as_dict, serialize=serialize
+        )
 
-        if serialize:
-            return json.loads(
-                result.to_json(
-                    orient="split",
-                    index=True,
-                    date_format="iso",
+    def get_series_batch(
+        self,
+        series_requests: Sequence[str | Sequence[str] | dict[str, Any]] | dict[str, Any],
+        max_workers: int | None = None,
+        join: bool = False,
+        raise_errors: bool = True,
+    ) -> dict[str, pd.DataFrame] | pd.DataFrame:
+        """Returns many time series requests at once retrieving them concurrently.
+
+        Args:
+            - series_requests (Sequence | dict): Requests to be retrieved. Every request can be
+            given as:
+                - series names in any form that `get_series` accepts: "usdtry, eurtry"
+                - a dictionary of `get_series` parameters: {"series": "usdtry", "period": "2y"}
+            A dictionary of requests {label: request} can also be given to label the results.
+            - max_workers (int | None, optional): Number of worker threads. The number of requests
+            sent to the EVDS API service at the same time never exceeds `max_concurrent_requests`
+            of the Connector anyway. Defaults to `None` (`max_concurrent_requests`).
+            - join (bool, optional): Returns all results outer joined in one DataFrame instead of
+            a dictionary. Defaults to False.
+            - raise_errors (bool, optional): Raises the first error occured if True. Otherwise, the
+            failed requests are reported and left out of the results. Defaults to True.
+
+        Usage:
+            - x.get_series_batch(["TP.FE.OKTG01", "TP.DK.USD.A.YTL"], max_workers=4)
+            - x.get_series_batch({"cpi": {"series": "TP.FE.OKTG01", "period": "2y"}}, join=True)
+
+        Returns:
+            - dict[str, pd.DataFrame] | pd.DataFrame: results by labels or a joined DataFrame.
+            The joined DataFrame (or the last labelled result) is also kept in `data`.
+        """
+
+        kwargs_list: list[tuple[str, dict[str, Any]]] = self._label_batch_requests(
+            series_requests, join=join
+        )
+
+        results: dict[str, pd.DataFrame] = {}
+        frames: dict[str, pd.DataFrame] = {}
+        workers: int = max_workers if max_workers else self.max_concurrent_requests
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # the first request of the connector is settled by _get_response.
+            futures: list[tuple[str, Future]] = [
+                (label, executor.submit(self._series_output, **kwargs))
+                for label, kwargs in kwargs_list
+            ]
+            for label, future in futures:
+                try:
+                    frames[label], results[label] = future.result()
+                except Exception as ex:
+                    if raise_errors:
+                        for _, pending in futures:
+                            pending.cancel()
+                        raise
+                    print(f"{label} could not be retrieved: {ex}")
+
+        if join:
+            if not results:
+                self.data = pd.DataFrame()
+                return self.data
+            joined: pd.DataFrame = pd.concat(results.values(), axis=1, join="outer")
+            self.data = joined.sort_index()
+            return self.data
+
+        if frames:
+            self.data = list(frames.values())[-1]
+
+        return results
+
+    def connection_stats(self) -> dict[str, int | float]:
+        """Returns how well the connections to the EVDS API service are reused.
+
+        Returns:
+            - dict[str, int | float]: number of requests sent, connections opened, requests sent
+            over an already open connection and the reuse ratio.
+        """
+
+        requests_sent: int = 0
+        connections: int = 0
+        for adapter in set(self.session.adapters.values()):
+            if isinstance(adapter, EVDSHttpAdapter):
+                stats: dict[str, int] = adapter.connection_stats()
+                requests_sent += stats["requests"]
+                connections += stats["connections"]
+
+        if not self.keep_alive:
+            # pooled connections closed by 'Connection: close' are reopened, not counted as new.
+            connections = requests_sent
+
+        return self._connection_reuse(requests_sent, connections)
+
+    def prefetch_catalog(
+        self, refresh: bool = False, max_workers: int | None = None
+    ) -> dict[str, int]:
+        """Downloads the whole EVDS catalog (category tree, datagroups of every category and
+        series metadata of every datagroup) into the catalog store at once.
+
+        A `CatalogStore` in the default file is created if the Connector doesn't have one. Later
+        `get_main_categories`, `get_sub_categories` and `get_groups` calls are answered from the
+        store without connecting to the EVDS API service.
+
+        Args:
+            - refresh (bool, optional): Retrieves every node again even if the store keeps a
+            fresh one. Defaults to False (only missing and expired nodes are retrieved).
+            - max_workers (int | None, optional): Number of worker threads. Defaults to `None`
+            (`max_concurrent_requests`).
+
+        Returns:
+            - dict[str, int]: numbers of categories and datagroups in the catalog and the number
+            of nodes that couldn't be retrieved.
+        """
+
+        if self.catalog is None:
+            self.catalog = CatalogStore()
+
+        use_cache: bool = not refresh
+        response: bytes = self._get_metadata_response(
+            self.cfg.url_main_categories,
+            extensions=dict(type="json"),
+            type_="main_categories",
+            use_cache=use_cache,
+        )
+        with self._categories_lock:
+            self._save_main_categories_response(response)
+            self._main_categories = self._parse_main_categories(response)
+
+        category_ids: list[int] = self._catalog_category_ids()
+        workers: int = max_workers if max_workers else self.max_concurrent_requests
+        failed: list[str] = []
+
+        def fetch(url: str, type_: str, extensions: dict[str, Any]) -> bytes | None:
+            try:
+                return self._get_metadata_response(
+                    url, extensions=extensions, type_=type_, use_cache=use_cache
+                )
+            except Exception as ex:
+                failed.append(f"{type_} {extensions['code']}: {ex}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sub_categories: list[bytes | None] = list(
+                executor.map(
+                    lambda id_: fetch(
+                        self.cfg.url_sub_categories,
+                        "sub_categories",
+                        dict(mode=2, code=id_, type="json"),
+                    ),
+                    category_ids,
+                )
+            )
+            datagroups: list[str] = self._catalog_datagroups([r for r in sub_categories if r])
+            list(
+                executor.map(
+                    lambda code: fetch(self.cfg.url_groups, "groups", dict(code=code, type="json")),
+                    datagroups,
                 )
             )
 
-        return result
+        for failure in failed:
+            print(f"could not be retrieved: {failure}")
+
+        return dict(categories=len(category_ids), datagroups=len(datagroups), failed=len(failed))
 
     def save_name_references(
         self,
@@ -1959,22 +3232,86 @@ class Connector:
 
         write_data(data, data_format, filename, delimiter)
 
-    def where(self, keyword: str, n: int = 100, verbose: bool = True) -> dict[str, str]:
+    def where(
+        self,
+        keyword: str,
+        n: int = 100,
+        verbose: bool = True,
+        frequency: str | Sequence[str] | None = None,
+        active_after: DateLike = None,
+        category: int | Sequence[int] | None = None,
+        archived: bool = False,
+    ) -> dict[str, str]:
         """Searches given words to determine related series identifications on EVDS API service.
 
         Args:
             - keyword (str): words to be searched (for instance: consumer price index)
             - verbose (bool, optional): Shows the results on screen if True. Defaults to True.
             - n (int, optional): Number of maxiumum related results to be returned. Defaults to 100.
+            - frequency (str | Sequence[str] | None, optional): Frequencies of the series as they
+            are shown in the results (e.g. 'AYLIK', 'MONTHLY'). Defaults to None (any frequency).
+            - active_after (DateLike, optional): Only the series that have observations after
+            the date. Defaults to None (any date).
+            - category (int | Sequence[int] | None, optional): Main category ids of the series
+            (see get_main_categories). Defaults to None (any category).
+            - archived (bool, optional): Includes the archived series if True. Defaults to False.
 
         Raises:
             - ValueError: if there is no keyword provided to search.
+            - WrongDateFormatException: if active_after can not be parsed into a date.
 
         Returns:
             None | dict[str, str]: Results dictionary.
         """
 
-        return self.search_engine.where(keyword=keyword, n=n, verbose=verbose)
+        return self.search_engine.where(
+            keyword=keyword,
+            n=n,
+            verbose=verbose,
+            frequency=frequency,
+            active_after=active_after,
+            category=category,
+            archived=archived,
+        )
+
+    def where_many(
+        self,
+        keywords: Sequence[str],
+        n: int = 100,
+        verbose: bool = False,
+        frequency: str | Sequence[str] | None = None,
+        active_after: DateLike = None,
+        category: int | Sequence[int] | None = None,
+        archived: bool = False,
+    ) -> dict[str, dict[str, str]]:
+        """Searches several keywords at once to determine related series identifications.
+
+        Search results are cached until the search index changes.
+
+        Args:
+            - keywords (Sequence[str]): keywords to be searched (for instance: ["tüfe", "faiz"])
+            - n (int, optional): Number of maxiumum related results to be returned for every
+            keyword. Defaults to 100.
+            - verbose (bool, optional): Shows the results on screen if True. Defaults to False.
+            - frequency, active_after, category, archived: search filters (see `where`).
+
+        Raises:
+            - ValueError: if there is no keyword provided to search.
+            - WrongDateFormatException: if active_after can not be parsed into a date.
+
+        Returns:
+            None | dict[str, dict[str, str]]: Results dictionaries of the keywords.
+        """
+
+        return self.search_engine.where_many(
+            keywords=keywords,
+            n=n,
+            verbose=verbose,
+            frequency=frequency,
+            active_after=active_after,
+            category=category,
+            archived=archived,
+        )
 
     def purge(self) -> None:
         """Purges all cached data from the memory"""
@@ -1988,5 +3325,8 @@ class Connector:
             f"key: {self.api_key}\nlanguage: {self.language}\nshow_links: {self.show_links}\n"
             f"proxy servers: {self.proxy_servers}\nverify certificates: {self.verify_certificates}\n"
             f"jupyter mode: {self.jupyter_mode}\nprecision: {self.precision}\n"
+            f"cache: {self.cache.__class__.__name__ if self.cache else None}\n"
+            f"max concurrent requests: {self.max_concurrent_requests}\n"
+            f"rate limiter: {self.rate_limiter.__class__.__name__ if self.rate_limiter else None}\n"
             f"references file: {self.references_file}\nname references:\n{self.name_cache}"
         )
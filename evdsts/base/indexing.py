@@ -8,17 +8,21 @@ __internal__ = "0.0.2"
 
 
 import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from json import JSONDecodeError
 from pathlib import Path
-from time import sleep
 from typing import Any
 
 from tqdm import tqdm
 
 from evdsts.base.connecting import Connector
+from evdsts.base.limiting import RateLimiter
+from evdsts.base.searching import InvertedIndex
 from evdsts.configuration.cfg import EVDSTSConfig
-from evdsts.utils.general import delete_file, write_json
+from evdsts.utils.general import delete_file, write_json_atomic
 
 
 class IndexBuilder:
@@ -31,6 +35,7 @@ class IndexBuilder:
         proxy_servers: dict[str, str] | None = None,
         verify_certificates: bool = True,
         secure: bool = True,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         """EVDS (EDDS) Search Index Builder.
 
@@ -45,19 +50,29 @@ class IndexBuilder:
                 - False: No security check (use the option if you encounter connection problems
                 despite the API service is actually on-line)
             Defaults to True.
+            - rate_limiter (RateLimiter | None, optional): A shared rate limiter (e.g. a
+            FileRateLimiter used by other jobs on the host). If not given, the requests are paced
+            by the waiting time given to build_index. Defaults to None
         """
 
         self.cfg: EVDSTSConfig = EVDSTSConfig()
 
         self.key: str = key if key else self._load_key()
         self.index_file: str = ""
+        self.binary_index_file: str = ""
+        self.version_file: str = ""
+        self.checkpoint_file: str = ""
+        self.fingerprint_file: str = ""
+        self._checkpoint_lock: threading.Lock = threading.Lock()
         self.connector = Connector(
             key=self.key,
             language=language,
             proxy_servers=proxy_servers,
             verify_certificates=verify_certificates,
             secure=secure,
+            rate_limiter=rate_limiter,
         )
+        self._shared_rate_limiter: bool = rate_limiter is not None
 
         self.language: str = language
 
@@ -104,6 +119,10 @@ class IndexBuilder:
 
         # reload when the language is chenged
         self.index_file = self._set_index_file(language)
+        self.binary_index_file = self._set_binary_index_file(language)
+        self.version_file = self._set_version_file(language)
+        self.checkpoint_file = self._set_checkpoint_file(language)
+        self.fingerprint_file = self._set_fingerprint_file(language)
         self.connector.language = language
 
     def _load_key(self) -> None:
@@ -151,6 +170,54 @@ class IndexBuilder:
         else:
             return self.cfg.index_file_en
 
+    def _set_binary_index_file(self, language: str) -> str:
+        """Sets binary search index file corresponding to given language
+
+        Returns:
+            - str: binary index file name
+        """
+
+        if language == "TR":
+            return self.cfg.index_binary_file_tr
+        else:
+            return self.cfg.index_binary_file_en
+
+    def _set_version_file(self, language: str) -> str:
+        """Sets index version file corresponding to given language
+
+        Returns:
+            - str: version file name
+        """
+
+        if language == "TR":
+            return self.cfg.index_version_file_tr
+        else:
+            return self.cfg.index_version_file_en
+
+    def _set_checkpoint_file(self, language: str) -> str:
+        """Sets index build checkpoint file corresponding to given language
+
+        Returns:
+            - str: checkpoint file name
+        """
+
+        if language == "TR":
+            return self.cfg.index_checkpoint_file_tr
+        else:
+            return self.cfg.index_checkpoint_file_en
+
+    def _set_fingerprint_file(self, language: str) -> str:
+        """Sets datagroup fingerprints file corresponding to given language
+
+        Returns:
+            - str: fingerprints file name
+        """
+
+        if language == "TR":
+            return self.cfg.index_fingerprint_file_tr
+        else:
+            return self.cfg.index_fingerprint_file_en
+
     def _estimate_total_series(self) -> int:
         """Estimates total series count from the existing index file.
 
@@ -163,18 +230,177 @@ class IndexBuilder:
         except (FileNotFoundError, JSONDecodeError, ValueError):
             return 0
 
-    def _get_series(self, wait: int) -> dict[str, Any]:
-        """Downloads indexing data from the API Service
+    def _load_checkpoint(self) -> dict[str, list[Any]]:
+        """Loads the datagroups fetched by an unfinished index build.
+
+        Returns:
+            - dict[str, list[Any]]: {datagroup: [category id, series of the datagroup, listing
+            of the datagroup when it's fetched]}
+        """
+
+        checkpoint: dict[str, list[Any]] = {}
+        try:
+            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record: dict[str, Any] = json.loads(line)
+                        checkpoint[record["datagroup"]] = [
+                            record["category"],
+                            record["series"],
+                            record.get("listing", None),
+                        ]
+                    except (JSONDecodeError, KeyError, TypeError):
+                        # the last line of an interrupted build might be written partially.
+                        continue
+        except FileNotFoundError:
+            pass
+
+        return checkpoint
+
+    def _save_checkpoint(
+        self, category: int, group: str, series: dict[str, Any], listing: list[str]
+    ) -> None:
+        """Appends a fetched datagroup to the checkpoint file.
 
         Args:
-            - wait (int): waiting time in seconds before each new connection is established.
+            - category (int): main category id of the datagroup.
+            - group (str): datagroup code.
+            - series (dict[str, Any]): index entries of the series in the datagroup.
+            - listing (list[str]): [frequency, start date, end date] of the datagroup in the
+            sub-categories listing.
+        """
+
+        record: str = json.dumps(
+            dict(category=category, datagroup=group, series=series, listing=listing),
+            ensure_ascii=False,
+        )
+        with self._checkpoint_lock:
+            with open(self.checkpoint_file, "a", encoding="utf-8") as f:
+                f.write(record + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _fetch_group(self, category: int, group: str, listing: list[str]) -> dict[str, Any]:
+        """Downloads the series of a datagroup and records them in the checkpoint file.
+
+        Args:
+            - category (int): main category id of the datagroup.
+            - group (str): datagroup code.
+            - listing (list[str]): [frequency, start date, end date] of the datagroup in the
+            sub-categories listing.
+
+        Returns:
+            - dict[str, Any]: index entries of the series in the datagroup.
+        """
+
+        series_group: dict[str, Any] = self.connector.get_groups(group, as_dict=True)
+        # keep the category and the datagroup of the series for search filters.
+        series: dict[str, Any] = {
+            code: list(info) + [category, group] for code, info in series_group.items()
+        }
+        self._save_checkpoint(category, group, series, listing)
+
+        return series
+
+    @staticmethod
+    def _make_fingerprint(
+        category: int, listing: list[str], series: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Returns the fingerprint of a datagroup.
+
+        Args:
+            - category (int): main category id of the datagroup.
+            - listing (list[str]): [frequency, start date, end date] of the datagroup in the
+            sub-categories listing.
+            - series (dict[str, Any]): index entries of the series in the datagroup.
+
+        Returns:
+            - dict[str, Any]: category id, the listing fields that change when the datagroup is
+            updated (frequency, start and end dates), number of series and the latest end date
+            of the series.
+        """
+
+        end_dates: list[datetime] = []
+        for info in series.values():
+            try:
+                end_dates.append(datetime.strptime(str(info[3]), "%d-%m-%Y"))
+            except (IndexError, ValueError):
+                continue
+
+        return dict(
+            category=category,
+            listing=listing,
+            series=len(series),
+            end=max(end_dates).strftime("%d-%m-%Y") if end_dates else None,
+        )
+
+    def _load_fingerprints(self) -> dict[str, dict[str, Any]]:
+        """Loads the fingerprints of the datagroups in the current index.
+
+        Returns:
+            - dict[str, dict[str, Any]]: {datagroup: fingerprint} (see _make_fingerprint)
+        """
+
+        try:
+            with open(self.fingerprint_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, JSONDecodeError):
+            return {}
+
+    def _get_series(
+        self,
+        wait: float,
+        workers: int | None = None,
+        resume: bool = True,
+        previous: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], list[str], dict[str, dict[str, Any]]]:
+        """Downloads indexing data from the API Service.
+
+        The datagroups are fetched by a pool of worker threads that share the rate limiter of
+        the connector. Every fetched datagroup is appended to the checkpoint file, so an
+        interrupted build resumes from the datagroups that are already fetched. A datagroup is
+        taken from the current index if its fingerprint is not changed, otherwise from the
+        checkpoint if it was fetched with the same listing.
+
+        Args:
+            - wait (float): waiting time in seconds before each new connection is established.
                 - can not be set less then 5 secs. in order not to overload the API service.
+            - workers (int | None, optional): number of worker threads. Defaults to None (2).
+            - resume (bool, optional): reuses the datagroups in the checkpoint file if True.
+            Defaults to True.
+            - previous (dict[str, Any] | None, optional): current index whose datagroups are
+            reused if their fingerprints in the sub-categories listings are not changed (see
+            refresh_index). Defaults to None (all datagroups are fetched).
+
+        Raises:
+            - KeyboardInterrupt: If the build is aborted (the checkpoint file is kept).
 
         Returns:
-            dict[str, Any]: All available series on EVDS service.
+            tuple[dict[str, Any], list[str], dict[str, dict[str, Any]]]:
+                - All available series on EVDS service
+                ({series code: [name, frequency, start date, end date, category id, datagroup]}).
+                - the categories and the datagroups that could not be retrieved.
+                - fingerprints of the datagroups in the index.
         """
 
-        index: dict[str, Any] = {}
+        if not self._shared_rate_limiter:
+            # one request per 'wait' seconds, enforced by the connector before each request.
+            self.connector.rate_limiter = RateLimiter(rate=1 / wait, burst=1)
+
+        if not resume:
+            Path(self.checkpoint_file).unlink(missing_ok=True)
+        checkpoint: dict[str, list[Any]] = self._load_checkpoint()
+        if checkpoint:
+            print(f"Resuming the build from {len(checkpoint)} datagroups fetched before.\n")
+        fetched: dict[str, list[Any]] = {}
+
+        previous_fingerprints: dict[str, dict[str, Any]] = {}
+        previous_groups: dict[str, dict[str, Any]] = {}
+        if previous is not None:
+            previous_fingerprints = self._load_fingerprints()
+            for code, info in previous.items():
+                if len(info) > 5:
+                    previous_groups.setdefault(str(info[5]), {})[code] = info
 
         main_categories: dict[int, str] = self.connector.get_main_categories(as_dict=True)
         all_cats = self.connector._all_categories
@@ -194,57 +420,150 @@ class IndexBuilder:
             unit=" series",
             dynamic_ncols=True,
         )
-        exit_: bool = False
 
-        for id_ in leaf_category_ids:
-            try:
-                sub_categories: dict[str, Any] = self.connector.get_sub_categories(
-                    id_, as_dict=True
-                ).keys()
-            except Exception:
-                sleep(wait)
-                continue
-            sleep(wait)
-            try:
-                for group in sub_categories:
-                    series_group: dict[str, Any] = self.connector.get_groups(group, as_dict=True)
-                    index.update(series_group)
-                    pbar.update(len(series_group))
-                    sleep(wait)
-            except KeyboardInterrupt:
-                exit_ = True
-            except Exception:
-                sleep(wait)
-
-            if exit_:
-                break
-
-        pbar.total = len(index)
-        pbar.n = len(index)
-        pbar.refresh()
-        pbar.close()
-
-        if exit_:
-            print("\nAborted !")
-
-        return index
-
-    def _write_index(self, index: dict[str, Any]) -> None:
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers if workers else self.cfg.index_build_workers
+        )
+        failed: list[str] = []
+        try:
+            listings: list[tuple[int, Future]] = [
+                (id_, executor.submit(self.connector.get_sub_categories, id_, as_dict=True))
+                for id_ in leaf_category_ids
+            ]
+            # (category id, datagroup) in the order of EVDS and the listing fingerprints.
+            groups: list[tuple[int, str]] = []
+            listed: dict[str, list[str]] = {}
+            futures: dict[Future, tuple[int, str]] = {}
+            for id_, listing in listings:
+                try:
+                    sub_categories: dict[str, list[str]] = {
+                        group: [str(field) for field in fields[2:5]]
+                        for group, fields in listing.result().items()
+                    }
+                except Exception:
+                    failed.append(f"category {id_}")
+                    # keep the datagroups of the category in the current index.
+                    sub_categories = {
+                        group: fingerprint["listing"]
+                        for group, fingerprint in previous_fingerprints.items()
+                        if fingerprint.get("category") == id_ and group in previous_groups
+                    }
+                for group, fields in sub_categories.items():
+                    groups.append((id_, group))
+                    listed[group] = fields
+                    if group in fetched:
+                        continue
+                    if (
+                        group in previous_groups
+                        and previous_fingerprints.get(group, {}).get("listing") == fields
+                    ):
+                        # the datagroup is not changed since the current index is built.
+                        fetched[group] = [id_, previous_groups[group]]
+                        pbar.update(len(previous_groups[group]))
+                    elif group in checkpoint and checkpoint[group][2] == fields:
+                        # fetched by an unfinished build or refresh and not changed since.
+                        fetched[group] = checkpoint[group][:2]
+                        pbar.update(len(checkpoint[group][1]))
+                    else:
+                        submitted: Future = executor.submit(self._fetch_group, id_, group, fields)
+                        futures[submitted] = (id_, group)
+
+            for future in as_completed(futures):
+                id_, group = futures[future]
+                try:
+                    series: dict[str, Any] = future.result()
+                except Exception:
+                    failed.append(group)
+                    if group in previous_groups:
+                        # an outdated datagroup is better than a missing one, it's fetched again
+                        # by the next refresh.
+                        fetched[group] = [id_, previous_groups[group]]
+                        listed[group] = previous_fingerprints.get(group, {}).get("listing", [])
+                    continue
+                fetched[group] = [id_, series]
+                pbar.update(len(series))
+        finally:
+            # in-flight requests are completed (and checkpointed), the pending ones are dropped.
+            executor.shutdown(wait=False, cancel_futures=True)
+            pbar.close()
+
+        if failed:
+            print(
+                f"\n{len(failed)} datagroups could not be retrieved ({', '.join(failed[:5])}"
+                f"{', ...' if len(failed) > 5 else ''}).\n"
+                "Run refresh_index to retry them, the fetched ones are kept in the index."
+            )
+
+        # the index keeps the order of the categories and the datagroups on EVDS.
+        index: dict[str, Any] = {}
+        fingerprints: dict[str, dict[str, Any]] = {}
+        for id_, group in groups:
+            if group in fetched:
+                index.update(fetched[group][1])
+                fingerprints[group] = self._make_fingerprint(id_, listed[group], fetched[group][1])
+
+        return index, failed, fingerprints
+
+    def _write_index(
+        self, index: dict[str, Any], fingerprints: dict[str, dict[str, Any]] | None = None
+    ) -> None:
         """Writes created index to the disk.
 
+        Every file is written into a temporary file and renamed over the current one, so the
+        searches that are running meanwhile keep using the current index. The fingerprints are
+        written after the index and the version file is written last, SearchEngine reloads the
+        index when it sees a new version.
+
         Args:
             index (dict[str, Any]): provided created index dictionary.
+            fingerprints (dict[str, dict[str, Any]] | None, optional): fingerprints of the
+            datagroups in the index. Defaults to None (not written).
         """
 
-        write_json(self.index_file, reference_dict=index)
+        write_json_atomic(self.index_file, index.items())
+        # a memory-mapped copy for the searches (see SearchEngine._load_binary_index), written
+        # after the JSON index in order not to be taken as stale.
+        InvertedIndex.from_entries(index).save(self.binary_index_file, index)
+        # fingerprints describe the written index, a failed write above must not mark the
+        # datagroups as up to date.
+        if fingerprints is not None:
+            write_json_atomic(self.fingerprint_file, fingerprints.items())
 
-    def build_index(self, wait: float = 5, confirm: bool = True) -> None:
+        try:
+            with open(self.version_file, "r", encoding="utf-8") as f:
+                version: int = int(json.load(f)["version"])
+        except (FileNotFoundError, JSONDecodeError, KeyError, TypeError, ValueError):
+            version = 0
+        write_json_atomic(
+            self.version_file,
+            dict(
+                version=version + 1,
+                created=datetime.now().isoformat(timespec="seconds"),
+                series=len(index),
+            ).items(),
+        )
+
+    def build_index(
+        self,
+        wait: float = 5,
+        confirm: bool = True,
+        workers: int | None = None,
+        resume: bool = True,
+    ) -> None:
         """Builds a new search index that is required by in-situ searches.
 
+        Every fetched datagroup is kept in a checkpoint file until the index is written, so an
+        aborted (ctrl+C) or crashed build continues from where it's left when it's run again.
+
         Args:
             - wait (int): waiting time in seconds before each new connection is established.
                 - can not be set less then 5 secs. in order not to overload the API service.
             - confirm (bool): whether to ask for user confirmation before building.
+            - workers (int | None, optional): number of worker threads that fetch the datagroups.
+            The requests are still paced by `wait` (or the shared rate limiter), the workers
+            only overlap the response times. Defaults to None (2).
+            - resume (bool, optional): continues an unfinished build if there is one. Set False
+            to start over. Defaults to True.
         """
 
         if wait < 5:
@@ -269,11 +588,87 @@ class IndexBuilder:
                 return
 
         print("(1/2) creating index... (ctrl+C to abort)\n")
-        index: dict[str, Any] = self._get_series(wait)
-        print(f"\n(2/2) writing index -> {self.index_file}\n")
-        self._write_index(index)
+        try:
+            index, failed, fingerprints = self._get_series(wait, workers=workers, resume=resume)
+        except KeyboardInterrupt:
+            print(
+                "\nAborted !\n"
+                "Fetched datagroups are kept, run build_index again to continue from where it's "
+                "left."
+            )
+            return
+
+        if not index:
+            print("\nNo series could be retrieved, the current index is kept.")
+            return
+
+        print(f"\n(2/2) writing index -> {self.index_file}, {self.binary_index_file}\n")
+        self._write_index(index, fingerprints)
+        # the fetched datagroups are in the index now, the failed ones are missing in its
+        # fingerprints and are fetched by the next refresh.
+        Path(self.checkpoint_file).unlink(missing_ok=True)
         print("done...\n")
         print(
             "The search index is created with most up-to-date entries from EVDS service.\n"
             "You can now search series in this updated index."
         )
+
+    def refresh_index(self, wait: float = 5, workers: int | None = None) -> None:
+        """Updates the search index by fetching only the datagroups that are changed.
+
+        The sub-categories listings (a request per category) are compared with the fingerprints
+        of the datagroups kept by the last build, only the new and the changed datagroups are
+        fetched again and the others are taken from the current index.
+
+        Args:
+            - wait (int): waiting time in seconds before each new connection is established.
+                - can not be set less then 5 secs. in order not to overload the API service.
+            - workers (int | None, optional): number of worker threads that fetch the datagroups.
+            Defaults to None (2).
+        """
+
+        if wait < 5:
+            print(
+                "Connecting the server intensively could cause a service overload.\n"
+                "waiting time before a new connection is established must be at least 5 sec."
+            )
+            return
+
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                current: dict[str, Any] = json.load(f)
+        except (FileNotFoundError, JSONDecodeError):
+            current = {}
+
+        if not current or not self._load_fingerprints():
+            print(
+                "\nThere is no index built with datagroup fingerprints to be refreshed.\n"
+                "Use build_index to build one."
+            )
+            return
+
+        print("(1/2) refreshing index... (ctrl+C to abort)\n")
+        try:
+            index, failed, fingerprints = self._get_series(
+                wait, workers=workers, resume=True, previous=current
+            )
+        except KeyboardInterrupt:
+            print(
+                "\nAborted !\n"
+                "Fetched datagroups are kept, run refresh_index again to continue from where it's "
+                "left."
+            )
+            return
+
+        if not index:
+            print("\nNo series could be retrieved, the current index is kept.")
+            return
+
+        changed: int = sum(
+            1 for code, info in index.items() if current.get(code, None) != info
+        ) + sum(1 for code in current if code not in index)
+        print(f"\n{changed} series are added, changed or removed.")
+        print(f"\n(2/2) writing index -> {self.index_file}, {self.binary_index_file}\n")
+        self._write_index(index, fingerprints)
+        Path(self.checkpoint_file).unlink(missing_ok=True)
+        print("done...\n")
@@ -0,0 +1,234 @@
+"""evdsts Rate Limiter Classes"""
+
+__author__ = "Burak CELIK"
+__copyright__ = "Copyright (c) 2022 Burak CELIK"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__internal__ = "0.0.1"
+
+
+import asyncio
+import os
+import struct
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from time import monotonic, sleep, time
+
+from evdsts.configuration.cfg import EVDSTSConfig
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class RateLimiter:
+    """A thread-safe token bucket that paces the requests sent to the EVDS API service.
+
+    The bucket is refilled with `rate` tokens per second and holds at most `burst` tokens. Every
+    request takes a token. If there is no token left, the request waits until the bucket
+    is refilled. A single limiter can be shared by several Connector instances.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int | None = None) -> None:
+        """Token bucket rate limiter.
+
+        Args:
+            - rate (float | None, optional): Allowed requests per second. Defaults to `None` (2).
+            - burst (int | None, optional): Maximum number of requests that can be sent at once
+            after an idle period. Defaults to `None` (5).
+
+        Raises:
+            - ValueError: If rate or burst is not positive.
+        """
+
+        self.cfg: EVDSTSConfig = EVDSTSConfig()
+        self.rate: float = self.cfg.rate_limit if rate is None else rate
+        self.burst: int = self.cfg.rate_limit_burst if burst is None else burst
+
+        if self.rate <= 0:
+            raise ValueError("Rate must be a positive number of requests per second")
+        if not isinstance(self.burst, int) or self.burst < 1:
+            raise ValueError("Burst must be a positive integer")
+
+        self._lock: threading.Lock = threading.Lock()
+        self._tokens: float = float(self.burst)
+        self._stamp: float = self._clock()
+
+    def _clock(self) -> float:
+
+        return monotonic()
+
+    @contextmanager
+    def _state(self) -> Iterator[list[float]]:
+        """Yields the [tokens, stamp] state of the bucket exclusively and saves it afterwards"""
+
+        with self._lock:
+            state: list[float] = [self._tokens, self._stamp]
+            yield state
+            self._tokens, self._stamp = state
+
+    def _take(self, tokens: float, penalty: float | None = None) -> float:
+        """Refills the bucket, takes given tokens and returns the time to wait for them.
+
+        Args:
+            - tokens (float): number of tokens to be taken.
+            - penalty (float | None, optional): seconds that every later request must wait, the
+            bucket is emptied even if it's 0. Defaults to `None` (no penalty).
+
+        Returns:
+            - float: waiting time in seconds.
+        """
+
+        with self._state() as state:
+            now: float = self._clock()
+            available: float = min(float(self.burst), state[0] + (now - state[1]) * self.rate)
+            if penalty is not None:
+                available = min(available, 0.0) - penalty * self.rate
+            available -= tokens
+            state[0], state[1] = available, now
+
+        return 0.0 if available >= 0 else -available / self.rate
+
+    def reserve(self) -> float:
+        """Reserves a token for a request.
+
+        The token is taken immediately, the caller is responsible for waiting before sending
+        the request.
+
+        Returns:
+            - float: seconds to wait before the request can be sent.
+        """
+
+        return self._take(1.0)
+
+    def acquire(self) -> None:
+        """Blocks until a request can be sent"""
+
+        wait: float = self.reserve()
+        if wait > 0:
+            sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Waits without blocking the event loop until a request can be sent"""
+
+        wait: float = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float | None = None) -> None:
+        """Empties the bucket and holds every following request back for given seconds.
+
+        Used when the EVDS API service responds with 429 (Too Many Requests).
+
+        Args:
+            - seconds (float | None, optional): penalty time in seconds. Defaults to `None` (5).
+        """
+
+        self._take(0.0, self.cfg.rate_limit_penalty if seconds is None else seconds)
+
+    async def apenalize(self, seconds: float | None = None) -> None:
+        """Empties the bucket without blocking the event loop (see penalize).
+
+        Args:
+            - seconds (float | None, optional): penalty time in seconds. Defaults to `None` (5).
+        """
+
+        self.penalize(seconds)
+
+    def __repr__(self) -> str:
+
+        return f"\n*{self.__class__.__name__}*:\n\nrate: {self.rate}\nburst: {self.burst}"
+
+
+class FileRateLimiter(RateLimiter):
+    """A token bucket rate limiter whose state is shared by all processes on the host.
+
+    The state of the bucket is kept in a small file that is locked while it's updated, so several
+    worker processes that use the same file share one request budget.
+    """
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(
+        self,
+        fname: str | Path | None = None,
+        rate: float | None = None,
+        burst: int | None = None,
+    ) -> None:
+        """Process-shared token bucket rate limiter.
+
+        Args:
+            - fname (str | Path | None, optional): State file of the bucket. Defaults to `None`
+            (evds_rate_limit.bin in the data folder of evdsts).
+            - rate (float | None, optional): Allowed requests per second. Defaults to `None` (2).
+            - burst (int | None, optional): Maximum number of requests that can be sent at once
+            after an idle period. Defaults to `None` (5).
+        """
+
+        super().__init__(rate=rate, burst=burst)
+        self.fname: str = str(fname) if fname else self.cfg.rate_limit_file
+
+    def _clock(self) -> float:
+
+        # processes do not share a monotonic clock.
+        return time()
+
+    @contextmanager
+    def _state(self) -> Iterator[list[float]]:
+
+        with self._lock:
+            fd: int = os.open(self.fname, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                self._lock_file(fd)
+                try:
+                    raw: bytes = os.read(fd, self._STATE.size)
+                    if len(raw) == self._STATE.size:
+                        state: list[float] = list(self._STATE.unpack(raw))
+                    else:
+                        state = [float(self.burst), self._clock()]
+
+                    yield state
+
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    os.write(fd, self._STATE.pack(*state))
+                finally:
+                    self._unlock_file(fd)
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _lock_file(fd: int) -> None:
+
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, FileRateLimiter._STATE.size)
+
+    @staticmethod
+    def _unlock_file(fd: int) -> None:
+
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, FileRateLimiter._STATE.size)
+
+    async def aacquire(self) -> None:
+
+        # the state file is locked and read while reserving, keep the event loop free.
+        wait: float = await asyncio.to_thread(self.reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def apenalize(self, seconds: float | None = None) -> None:
+
+        await asyncio.to_thread(self.penalize, seconds)
+
+    def __repr__(self) -> str:
+
+        return super().__repr__() + f"\nfile: {self.fname}"
@@ -0,0 +1,230 @@
+"""evdsts RetryPolicy Class"""
+
+__author__ = "Burak CELIK"
+__copyright__ = "Copyright (c) 2022 Burak CELIK"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__internal__ = "0.0.1"
+
+
+import random
+import threading
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import Any
+
+from evdsts.configuration.cfg import EVDSTSConfig
+from evdsts.configuration.exceptions import CircuitOpenException
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again.
+
+    Failed requests (connection errors and the retryable response statuses) are retried with
+    full-jitter exponential backoff, so the workers hitting the same outage don't retry in
+    lockstep. A `Retry-After` header given by the EVDS API service is honored instead of the
+    backoff. A request is not retried after `max_attempts` attempts or if the next attempt would
+    start after its `deadline`.
+
+    The policy also works as a circuit breaker: after `failure_threshold` consecutive failures
+    every request fails fast with CircuitOpenException for `recovery_time` seconds, then a single
+    trial request is let through and its result closes or reopens the circuit. A single policy
+    can be shared by several Connector instances.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+        deadline: float | None = None,
+        retry_statuses: Iterable[int] | None = None,
+        failure_threshold: int | None = None,
+        recovery_time: float | None = None,
+    ) -> None:
+        """Retry policy with a circuit breaker.
+
+        Args:
+            - max_attempts (int | None, optional): Maximum number of attempts of a request
+            (including the first one). Defaults to `None` (4).
+            - base_delay (float | None, optional): Upper bound of the first backoff in seconds,
+            doubled on every retry. Defaults to `None` (3).
+            - max_delay (float | None, optional): Upper bound of any backoff in seconds.
+            Defaults to `None` (60).
+            - deadline (float | None, optional): Seconds after which a request is not retried
+            anymore, counted from its first attempt. Defaults to `None` (120).
+            - retry_statuses (Iterable[int] | None, optional): Response statuses that are retried.
+            Defaults to `None` (429, 502, 503, 504).
+            - failure_threshold (int | None, optional): Number of consecutive failures that opens
+            the circuit. Defaults to `None` (5).
+            - recovery_time (float | None, optional): Seconds the circuit stays open before a
+            trial request is let through. Defaults to `None` (30).
+
+        Raises:
+            - ValueError: If max_attempts or failure_threshold is not a positive integer, or a
+            delay is negative.
+        """
+
+        self.cfg: EVDSTSConfig = EVDSTSConfig()
+        self.max_attempts: int = (
+            self.cfg.retry_max_attempts if max_attempts is None else max_attempts
+        )
+        self.base_delay: float = self.cfg.retry_base_delay if base_delay is None else base_delay
+        self.max_delay: float = self.cfg.retry_max_delay if max_delay is None else max_delay
+        self.deadline: float = self.cfg.retry_deadline if deadline is None else deadline
+        self.retry_statuses: frozenset[int] = frozenset(
+            self.cfg.retry_statuses if retry_statuses is None else retry_statuses
+        )
+        self.failure_threshold: int = (
+            self.cfg.circuit_failure_threshold if failure_threshold is None else failure_threshold
+        )
+        self.recovery_time: float = (
+            self.cfg.circuit_recovery_time if recovery_time is None else recovery_time
+        )
+
+        if not isinstance(self.max_attempts, int) or self.max_attempts < 1:
+            raise ValueError("Maximum number of attempts must be a positive integer")
+        if not isinstance(self.failure_threshold, int) or self.failure_threshold < 1:
+            raise ValueError("Failure threshold must be a positive integer")
+        if min(self.base_delay, self.max_delay, self.deadline, self.recovery_time) < 0:
+            raise ValueError("Delays, deadline and recovery time can't be negative")
+
+        self._lock: threading.Lock = threading.Lock()
+        self._failures: int = 0
+        self._opened_at: float | None = None
+        self._trial_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Returns the state of the circuit ('closed', 'open' or 'half-open')"""
+
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if monotonic() - self._opened_at < self.recovery_time:
+                return "open"
+            return "half-open"
+
+    def start(self) -> float:
+        """Returns the deadline of a request that is about to be sent for the first time"""
+
+        return monotonic() + self.deadline
+
+    def backoff(self, attempt: int) -> float:
+        """Returns a full-jitter backoff for given attempt.
+
+        Args:
+            - attempt (int): zero based number of the failed attempt.
+
+        Returns:
+            - float: seconds drawn uniformly between zero and the exponential bound.
+        """
+
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    @staticmethod
+    def retry_after(headers: Mapping[str, Any]) -> float | None:
+        """Returns the waiting time asked by a `Retry-After` header.
+
+        Args:
+            - headers (Mapping[str, Any]): response headers.
+
+        Returns:
+            - float | None: seconds to wait or None if there is no (valid) header.
+        """
+
+        value: Any = headers.get("Retry-After", None)
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            until: datetime = parsedate_to_datetime(str(value))
+        except (TypeError, ValueError):
+            return None
+        if until.tzinfo is None:
+            until = until.replace(tzinfo=timezone.utc)
+
+        return max((until - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def next_delay(
+        self, attempt: int, deadline: float, retry_after: float | None = None
+    ) -> float | None:
+        """Returns the seconds to wait before the next attempt of a failed request.
+
+        Args:
+            - attempt (int): zero based number of the failed attempt.
+            - deadline (float): deadline of the request (see `start`).
+            - retry_after (float | None, optional): waiting time asked by the server.
+
+        Returns:
+            - float | None: seconds to wait or None if the request must not be retried.
+        """
+
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        delay: float = self.backoff(attempt) if retry_after is None else retry_after
+        if monotonic() + delay > deadline:
+            return None
+
+        return delay
+
+    def check_circuit(self) -> None:
+        """Lets a request through unless the circuit is open.
+
+        Raises:
+            - CircuitOpenException: If the circuit is open.
+        """
+
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            now: float = monotonic()
+            remaining: float = self.recovery_time - (now - self._opened_at)
+            # a trial that never reported back (e.g. interrupted) doesn't block forever.
+            trial_pending: bool = (
+                self._trial_at is not None and now - self._trial_at < self.recovery_time
+            )
+            if remaining > 0 or trial_pending:
+                raise CircuitOpenException(
+                    f"EVDS API service failed {self._failures} times in a row. Requests are not "
+                    f"sent for {max(remaining, 0):.1f} more seconds. Please retry later."
+                )
+
+            self._trial_at = now
+
+    def record_success(self) -> None:
+        """Closes the circuit after a request that reached the server"""
+
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_at = None
+
+    def record_failure(self) -> None:
+        """Counts a failed request and opens the circuit if needed"""
+
+        with self._lock:
+            self._failures += 1
+            if self._trial_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = monotonic()
+            self._trial_at = None
+
+    def __repr__(self) -> str:
+
+        return (
+            f"\n*{self.__class__.__name__}*:\n\n"
+            f"max attempts: {self.max_attempts}\nbase delay: {self.base_delay}\n"
+            f"max delay: {self.max_delay}\ndeadline: {self.deadline}\n"
+            f"retry statuses: {sorted(self.retry_statuses)}\n"
+            f"failure threshold: {self.failure_threshold}\nrecovery time: {self.recovery_time}\n"
+            f"circuit: {self.state}"
+        )
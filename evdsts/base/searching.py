@@ -8,19 +8,42 @@ __mail__ = "synertic@gmail.com"
 
 
 import json
+import mmap
+import os
 import re
-from collections import Counter
+import struct
+import sys
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from itertools import permutations
+from itertools import chain, compress, permutations
 from json import JSONDecodeError
 from pathlib import Path
 from pprint import pprint
 from time import perf_counter
+from typing import Any
+
+import numpy as np
 
 from evdsts.configuration.cfg import EVDSTSConfig
+from evdsts.configuration.types import DateLike
 from evdsts.utils.general import delete_file
+from evdsts.utils.time_series import correct_date
 
 _TR_CHAR_MAP = str.maketrans("İıÖöÜüŞşÇçĞğ", "IiOoUuSsCcGg")
+_TR_LOWER_FOLDS: tuple[tuple[str, str], ...] = tuple(zip("ıöüşçğ", "iouscg"))
+_TOKEN_PATTERN: re.Pattern[str] = re.compile(r"[^\W_]+")
+_TOKENS_PATTERN: re.Pattern[str] = re.compile(r"[^\W_]+|\x1f")
+
+
+_EPOCH: datetime = datetime(1970, 1, 1)
+_NO_DATE: int = int(np.iinfo("int32").min)
+
+
+# (regex, compiled regex, compiled Turkish-normalized regex, difficulty)
+_CompiledPattern = tuple[str, re.Pattern[str], re.Pattern[str], int]
 
 
 def _normalize_turkish(text: str) -> str:
@@ -28,19 +51,851 @@ def _normalize_turkish(text: str) -> str:
     return text.translate(_TR_CHAR_MAP)
 
 
+def _fold(text: str) -> str:
+    """Lower-cases a text in Turkish way and folds the Turkish characters to ASCII."""
+    # 'İ'.lower() is 'i' with a combining dot in Python, lower it in Turkish way first.
+    text = text.replace("İ", "i").lower()
+    for turkish, ascii_ in _TR_LOWER_FOLDS:
+        text = text.replace(turkish, ascii_)
+
+    return text
+
+
+def _tokenize(text: str) -> list[str]:
+    """Splits a text into lower-cased, Turkish-normalized words."""
+    return _TOKEN_PATTERN.findall(_fold(str(text)))
+
+
+def _tokenize_many(texts: Iterable[str]) -> list[list[str]]:
+    """Tokenizes many texts at once (see _tokenize)."""
+    # folding a single joined text is much faster than folding the texts one by one.
+    folded: str = _fold("\x1f".join(str(text).replace("\x1f", " ") for text in texts))
+    tokens: list[str] = _TOKENS_PATTERN.findall(folded)
+    ends: list[int] = [i for i, token in enumerate(tokens) if token == "\x1f"] + [len(tokens)]
+
+    return [tokens[start + 1 : end] for start, end in zip([-1] + ends[:-1], ends)]
+
+
+def _trigrams(word: str) -> list[str]:
+    """Returns the trigrams of a word padded with '$' (e.g. 'kur' -> '$ku', 'kur', 'ur$')."""
+    padded: str = f"${word}$"
+
+    return [padded[i : i + 3] for i in range(len(padded) - 2)]
+
+
+def _edit_distance(first: str, second: str, limit: int) -> int:
+    """Returns the Levenshtein distance of two words (limit + 1 if it's more than the limit)."""
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+
+    previous: list[int] = list(range(len(second) + 1))
+    for i, char in enumerate(first, 1):
+        current: list[int] = [i]
+        for j, other in enumerate(second, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other))
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+
+    return previous[-1]
+
+
+def _date_to_days(date: Any) -> int:
+    """Converts a 'dd-mm-YYYY' date into days since 01-01-1970 (_NO_DATE if it's not a date)."""
+    try:
+        day, month, year = (int(part) for part in str(date).strip().split("-"))
+        return (datetime(year, month, day) - _EPOCH).days
+    except ValueError:
+        return _NO_DATE
+
+
+def _facet_arrays(informations: Iterable[Sequence[Any]]) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the category ids (-1 if unknown) and the end dates (days since 01-01-1970) of the
+    series from their informations ([name, frequency, start, end, category, datagroup])."""
+    categories: list[int] = []
+    end_days: list[int] = []
+    for info in informations:
+        category: str = str(info[4]).strip() if len(info) > 4 else ""
+        categories.append(int(category) if category.lstrip("-").isdigit() else -1)
+        end_days.append(_date_to_days(info[3]) if len(info) > 3 else _NO_DATE)
+
+    return np.array(categories, dtype="int32"), np.array(end_days, dtype="int32")
+
+
+class _Postings:
+    """Posting lists of a field (token -> documents and the positions of the token in them)"""
+
+    STRIDE: int = 32
+
+    def __init__(
+        self,
+        terms: Sequence[str],
+        term_offsets: np.ndarray,
+        docs: np.ndarray,
+        position_offsets: np.ndarray,
+        positions: np.ndarray,
+    ) -> None:
+
+        # terms are sorted, postings of terms[i] are docs[term_offsets[i]:term_offsets[i + 1]]
+        # and positions of a posting j are positions[position_offsets[j]:position_offsets[j + 1]]
+        self.terms: Sequence[str] = terms
+        self.term_offsets: np.ndarray = term_offsets
+        self.docs: np.ndarray = docs
+        self.position_offsets: np.ndarray = position_offsets
+        self.positions: np.ndarray = positions
+
+    @classmethod
+    def build(cls, documents: Iterable[list[str]]) -> "_Postings":
+        """Builds posting lists of tokenized documents.
+
+        Args:
+            - documents (Iterable[list[str]]): tokens of every document in document order.
+
+        Returns:
+            - _Postings: posting lists
+        """
+
+        documents = list(documents)
+        tokens: list[str] = list(chain.from_iterable(documents))
+        terms: list[str] = sorted(set(tokens))
+        vocabulary: dict[str, int] = {term: i for i, term in enumerate(terms)}
+
+        counts: np.ndarray = np.fromiter(map(len, documents), dtype="int64", count=len(documents))
+        term_ids: np.ndarray = np.fromiter(
+            map(vocabulary.__getitem__, tokens), dtype="int64", count=len(tokens)
+        )
+        docs: np.ndarray = np.repeat(np.arange(len(counts)), counts)
+        positions: np.ndarray = np.arange(len(term_ids)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+
+        # order the occurrences by term, document and position.
+        order: np.ndarray = np.lexsort((positions, docs, term_ids))
+        term_ids, docs, positions = term_ids[order], docs[order], positions[order]
+
+        # a posting starts wherever the term or the document changes.
+        starts: np.ndarray = np.flatnonzero(
+            np.concatenate(([True], (term_ids[1:] != term_ids[:-1]) | (docs[1:] != docs[:-1])))
+        )
+        posting_terms: np.ndarray = term_ids[starts]
+
+        return cls(
+            terms,
+            np.searchsorted(posting_terms, np.arange(len(terms) + 1)).astype("int64"),
+            docs[starts].astype("int32"),
+            np.append(starts, len(term_ids)).astype("int64"),
+            positions.astype("int32"),
+        )
+
+    def find(self, term: str) -> int:
+        """Returns the id of a term or -1 if it's not in the postings"""
+
+        i: int = bisect_left(self.terms, term)
+
+        return i if i < len(self.terms) and self.terms[i] == term else -1
+
+    def expand(self, word: str, prefix_weight: float, limit: int) -> list[tuple[int, float]]:
+        """Returns the terms that a query word matches with their weights.
+
+        The word matches itself with a weight of 1 and the longer words it prefixes (e.g. 'faiz'
+        -> 'faizi', 'faizleri') with the prefix weight.
+
+        Args:
+            - word (str): normalized query word.
+            - prefix_weight (float): weight of the prefix matches.
+            - limit (int): maximum number of prefix matches.
+
+        Returns:
+            - list[tuple[int, float]]: (term id, weight) pairs.
+        """
+
+        matches: list[tuple[int, float]] = []
+        i: int = bisect_left(self.terms, word)
+        if i < len(self.terms) and self.terms[i] == word:
+            matches.append((i, 1.0))
+            i += 1
+
+        if len(word) < 3:
+            # too short to be a meaningful stem.
+            return matches
+
+        end: int = min(len(self.terms), i + limit)
+        while i < end and self.terms[i].startswith(word):
+            matches.append((i, prefix_weight))
+            i += 1
+
+        return matches
+
+    def postings(self, term_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """Returns documents that include a term and the term frequencies in them"""
+
+        start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+        frequencies: np.ndarray = np.diff(self.position_offsets[start : end + 1])
+
+        return self.docs[start:end], frequencies
+
+    def occurrences(self, term_ids: Iterable[int]) -> np.ndarray:
+        """Returns all occurrences of given terms as sorted (document << STRIDE | position)"""
+
+        found: list[np.ndarray] = []
+        for term_id in term_ids:
+            start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+            frequencies: np.ndarray = np.diff(self.position_offsets[start : end + 1])
+            docs: np.ndarray = np.repeat(self.docs[start:end].astype("int64"), frequencies)
+            positions: np.ndarray = self.positions[
+                self.position_offsets[start] : self.position_offsets[end]
+            ]
+            found.append((docs << self.STRIDE) | positions)
+
+        return np.unique(np.concatenate(found)) if found else np.empty(0, dtype="int64")
+
+
+class _StringTable(Sequence[str]):
+    """A read-only sequence of strings kept in a UTF-8 blob with an offsets array.
+
+    Strings are decoded only when they are accessed, so a memory-mapped table costs nothing until
+    it's used.
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray) -> None:
+
+        self.data: np.ndarray = data
+        self.offsets: np.ndarray = offsets
+
+    @staticmethod
+    def encode(strings: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the (blob, offsets) arrays of given strings"""
+
+        encoded: list[bytes] = [str(string).encode("utf-8") for string in strings]
+        offsets: np.ndarray = np.zeros(len(encoded) + 1, dtype="int64")
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+
+        return np.frombuffer(b"".join(encoded), dtype="uint8"), offsets
+
+    def __getitem__(self, i: int) -> str:
+
+        if i < 0:
+            i += len(self)
+
+        return self.data[self.offsets[i] : self.offsets[i + 1]].tobytes().decode("utf-8")
+
+    def __len__(self) -> int:
+
+        return len(self.offsets) - 1
+
+
+class _MappedEntries(Mapping[str, list[str]]):
+    """A read-only {series code: [name, frequency, ...]} mapping over a binary search index"""
+
+    def __init__(
+        self,
+        keys: _StringTable,
+        fields: _StringTable,
+        field_offsets: np.ndarray,
+        order: np.ndarray,
+    ) -> None:
+
+        # informations of a document are fields[field_offsets[doc]:field_offsets[doc + 1]] and
+        # order sorts the documents by their keys for binary searching.
+        self.keys: _StringTable = keys
+        self.fields: _StringTable = fields
+        self.field_offsets: np.ndarray = field_offsets
+        self.order: np.ndarray = order
+
+    def _fields(self, doc: int) -> list[str]:
+
+        return [
+            self.fields[i] for i in range(self.field_offsets[doc], self.field_offsets[doc + 1])
+        ]
+
+    def __getitem__(self, key: str) -> list[str]:
+
+        low, high = 0, len(self.order)
+        while low < high:
+            middle: int = (low + high) // 2
+            if self.keys[int(self.order[middle])] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == len(self.order) or self.keys[int(self.order[low])] != key:
+            raise KeyError(key)
+
+        return self._fields(int(self.order[low]))
+
+    def __iter__(self) -> Iterator[str]:
+
+        return iter(self.keys)
+
+    def __len__(self) -> int:
+
+        return len(self.keys)
+
+    def items(self) -> Iterator[tuple[str, list[str]]]:
+        """Iterates over (series code, informations) in the index order"""
+
+        for doc, key in enumerate(self.keys):
+            yield key, self._fields(doc)
+
+
+class InvertedIndex:
+    """A token based inverted index of the series names and codes scored with BM25.
+
+    Series names are tokenized into lower-cased, Turkish-normalized words. A query is scored by
+    BM25 over the names plus a bonus for the words found in the series codes and the frequency,
+    and a proximity bonus for the query words that appear close to each other (and in the same
+    order) in the names. Query words that are not in the names are matched to the terms a typo
+    or two away from them through a trigram index. The index is built once and answers a query
+    by only visiting the posting lists of the query words.
+
+    The frequencies, end dates, categories and archived flags of the series are kept in arrays,
+    so searches can be narrowed down to the matching series before scoring (see `candidates`).
+    """
+
+    MAGIC: bytes = b"EVDSIDX\x01"
+
+    K1: float = 1.2
+    B: float = 0.75
+    PREFIX_WEIGHT: float = 0.5
+    MAX_EXPANSIONS: int = 64
+    CODE_WEIGHT: float = 1.0
+    FREQUENCY_BONUS: float = 1.0
+    PROXIMITY_WEIGHT: float = 2.0
+    FUZZY_WEIGHT: float = 0.5
+    MAX_FUZZY_CANDIDATES: int = 256
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        names: _Postings,
+        codes: _Postings,
+        lengths: np.ndarray,
+        archived: np.ndarray,
+        frequencies: Sequence[str],
+        frequency_ids: np.ndarray,
+        categories: np.ndarray,
+        end_days: np.ndarray,
+        trigrams: _Postings | None = None,
+    ) -> None:
+
+        # trigrams are the posting lists of the trigrams of the name terms (trigram -> terms).
+        self._trigrams: _Postings | None = trigrams
+        self.keys: Sequence[str] = keys
+        self.names: _Postings = names
+        self.codes: _Postings = codes
+        self.lengths: np.ndarray = lengths
+        self.archived: np.ndarray = archived
+        self.frequencies: Sequence[str] = frequencies
+        self.frequency_ids: np.ndarray = frequency_ids
+        self.categories: np.ndarray = categories
+        self.end_days: np.ndarray = end_days
+        self.average_length: float = float(lengths.mean()) if len(lengths) else 0.0
+
+    @classmethod
+    def from_entries(cls, index: Mapping[str, Sequence[str]]) -> "InvertedIndex":
+        """Builds an inverted index from a series index.
+
+        Args:
+            - index (Mapping[str, Sequence[str]]): {series code: [name, frequency, ...]}
+
+        Returns:
+            - InvertedIndex: inverted index of the series.
+        """
+
+        keys: list[str] = list(index)
+        names: list[str] = [str(info[0]) if len(info) else "" for info in index.values()]
+        name_tokens: list[list[str]] = _tokenize_many(names)
+
+        frequency_table: dict[str, int] = {}
+        frequency_ids: list[int] = [
+            frequency_table.setdefault(str(info[1]) if len(info) > 1 else "", len(frequency_table))
+            for info in index.values()
+        ]
+        categories, end_days = _facet_arrays(index.values())
+
+        return cls(
+            keys=keys,
+            names=_Postings.build(name_tokens),
+            codes=_Postings.build(_tokenize_many(keys)),
+            lengths=np.array([len(tokens) for tokens in name_tokens], dtype="float32"),
+            archived=np.array(["arşiv" in name.lower() for name in names], dtype="bool"),
+            frequencies=[" ".join(_tokenize(frequency)) for frequency in frequency_table],
+            frequency_ids=np.array(frequency_ids, dtype="int32"),
+            categories=categories,
+            end_days=end_days,
+        )
+
+    def save(self, fname: str | Path, index: Mapping[str, Sequence[str]]) -> None:
+        """Writes the inverted index with the series informations into a binary file that can be
+        memory-mapped by `InvertedIndex.load`.
+
+        The file consists of a magic number, the length of a JSON header, the JSON header that
+        describes the arrays (dtype, offset, count) and the 8 byte aligned arrays.
+
+        Args:
+            - fname (str | Path): binary index file.
+            - index (Mapping[str, Sequence[str]]): {series code: [name, frequency, ...]} that the
+            inverted index is built from.
+        """
+
+        arrays: dict[str, np.ndarray] = {}
+
+        def add_strings(name: str, strings: Iterable[str]) -> None:
+            arrays[f"{name}.data"], arrays[f"{name}.offsets"] = _StringTable.encode(strings)
+
+        def add_postings(name: str, postings: _Postings) -> None:
+            add_strings(f"{name}.terms", postings.terms)
+            arrays[f"{name}.term_offsets"] = postings.term_offsets
+            arrays[f"{name}.docs"] = postings.docs
+            arrays[f"{name}.position_offsets"] = postings.position_offsets
+            arrays[f"{name}.positions"] = postings.positions
+
+        keys: list[str] = list(self.keys)
+        add_strings("keys", keys)
+        informations: list[Sequence[str]] = [index[key] for key in keys]
+        add_strings("fields", (field for info in informations for field in info))
+        arrays["field_offsets"] = np.zeros(len(keys) + 1, dtype="int64")
+        np.cumsum([len(info) for info in informations], out=arrays["field_offsets"][1:])
+        arrays["order"] = np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype="int32")
+        add_postings("names", self.names)
+        add_postings("codes", self.codes)
+        add_postings("trigrams", self.trigrams)
+        arrays["lengths"] = np.asarray(self.lengths, dtype="float32")
+        arrays["archived"] = np.asarray(self.archived, dtype="bool")
+        add_strings("frequencies", self.frequencies)
+        arrays["frequency_ids"] = np.asarray(self.frequency_ids, dtype="int32")
+        arrays["categories"] = np.asarray(self.categories, dtype="int32")
+        arrays["end_days"] = np.asarray(self.end_days, dtype="int32")
+
+        layout: dict[str, list[Any]] = {}
+        offset: int = 0
+        for name, array in arrays.items():
+            layout[name] = [array.dtype.str, offset, len(array)]
+            offset += -(-array.nbytes // 8) * 8
+
+        header: bytes = json.dumps(dict(version=1, arrays=layout)).encode("utf-8")
+        header += b" " * (-len(header) % 8)
+
+        temp_file: Path = Path(fname).with_suffix(".tmp")
+        with open(temp_file, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for array in arrays.values():
+                f.write(array.tobytes())
+                f.write(b"\x00" * (-array.nbytes % 8))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, fname)
+
+    @classmethod
+    def load(cls, fname: str | Path) -> tuple[Mapping[str, list[str]], "InvertedIndex"]:
+        """Memory-maps a binary index file written by `InvertedIndex.save`.
+
+        Nothing is deserialized, the arrays are used in place and the strings are decoded only
+        when they are accessed.
+
+        Args:
+            - fname (str | Path): binary index file.
+
+        Raises:
+            - ValueError: If the file is not a valid binary index.
+
+        Returns:
+            - tuple[Mapping[str, list[str]], InvertedIndex]: series informations and the inverted
+            index.
+        """
+
+        with open(fname, "rb") as f:
+            buffer: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if buffer[: len(cls.MAGIC)] != cls.MAGIC:
+                raise ValueError(f"{fname} is not a binary search index.")
+            start: int = len(cls.MAGIC) + 8
+            (length,) = struct.unpack("<Q", buffer[len(cls.MAGIC) : start])
+            layout: dict[str, list[Any]] = json.loads(buffer[start : start + length])["arrays"]
+            base: int = start + length
+
+            def array(name: str) -> np.ndarray:
+                dtype, offset, count = layout[name]
+                if not count:
+                    return np.empty(0, dtype=dtype)
+                return np.frombuffer(buffer, dtype=dtype, count=count, offset=base + offset)
+
+            def strings(name: str) -> _StringTable:
+                return _StringTable(array(f"{name}.data"), array(f"{name}.offsets"))
+
+            def postings(name: str) -> _Postings:
+                return _Postings(
+                    strings(f"{name}.terms"),
+                    array(f"{name}.term_offsets"),
+                    array(f"{name}.docs"),
+                    array(f"{name}.position_offsets"),
+                    array(f"{name}.positions"),
+                )
+
+            keys: _StringTable = strings("keys")
+            entries: _MappedEntries = _MappedEntries(
+                keys, strings("fields"), array("field_offsets"), array("order")
+            )
+            if "categories" in layout:
+                categories, end_days = array("categories"), array("end_days")
+            else:
+                # binary indexes written before the facets were added.
+                categories, end_days = _facet_arrays(info for _, info in entries.items())
+            inverted_index: InvertedIndex = cls(
+                keys=keys,
+                names=postings("names"),
+                codes=postings("codes"),
+                lengths=array("lengths"),
+                archived=array("archived"),
+                frequencies=strings("frequencies"),
+                frequency_ids=array("frequency_ids"),
+                categories=categories,
+                end_days=end_days,
+                # binary indexes written before trigrams were added build them on demand.
+                trigrams=postings("trigrams") if "trigrams.docs" in layout else None,
+            )
+        except (KeyError, TypeError, ValueError, struct.error) as exc:
+            raise ValueError(f"{fname} is not a valid binary search index.") from exc
+
+        return entries, inverted_index
+
+    def __len__(self) -> int:
+
+        return len(self.keys)
+
+    @property
+    def trigrams(self) -> _Postings:
+        """Returns the trigram index of the name terms (built on demand)"""
+
+        if self._trigrams is None:
+            self._trigrams = _Postings.build(_trigrams(term) for term in self.names.terms)
+
+        return self._trigrams
+
+    def _fuzzy_terms(self, word: str) -> list[tuple[int, float]]:
+        """Returns the name terms that are a few typos away from a query word.
+
+        Candidate terms are the ones sharing trigrams with the word (only the posting lists of
+        the trigrams of the word are visited), they are verified by their edit distances.
+
+        Args:
+            - word (str): normalized query word.
+
+        Returns:
+            - list[tuple[int, float]]: (term id, weight) pairs.
+        """
+
+        if len(word) < 3:
+            return []
+
+        limit: int = 1 if len(word) < 6 else 2
+        word_trigrams: list[str] = list(dict.fromkeys(_trigrams(word)))
+        found: list[np.ndarray] = []
+        for trigram in word_trigrams:
+            trigram_id: int = self.trigrams.find(trigram)
+            if trigram_id != -1:
+                found.append(self.trigrams.postings(trigram_id)[0])
+        if not found:
+            return []
+
+        # a typo changes at most 3 trigrams of a word.
+        candidates, shared = np.unique(np.concatenate(found), return_counts=True)
+        enough: np.ndarray = shared >= max(1, len(word_trigrams) - 3 * limit)
+        candidates, shared = candidates[enough], shared[enough]
+        candidates = candidates[np.argsort(-shared, kind="stable")][: self.MAX_FUZZY_CANDIDATES]
+
+        matches: list[tuple[int, float]] = []
+        for term_id in candidates:
+            distance: int = _edit_distance(word, self.names.terms[int(term_id)], limit)
+            if 0 < distance <= limit:
+                matches.append((int(term_id), self.FUZZY_WEIGHT / distance))
+
+        return matches
+
+    def candidates(
+        self,
+        frequencies: Iterable[str] = (),
+        active_after: int | None = None,
+        categories: Iterable[int] = (),
+        archived: bool = False,
+    ) -> np.ndarray:
+        """Returns the series that pass given filters.
+
+        Args:
+            - frequencies (Iterable[str], optional): frequencies of the series (as they are in
+            the index, e.g. 'AYLIK'). Defaults to () (any frequency).
+            - active_after (int | None, optional): the series must have observations after this
+            date (days since 01-01-1970). Defaults to None (any date).
+            - categories (Iterable[int], optional): main category ids of the series. Defaults to
+            () (any category).
+            - archived (bool, optional): keeps the archived series if True. Defaults to False.
+
+        Returns:
+            - np.ndarray: a boolean mask of the documents.
+        """
+
+        mask: np.ndarray = np.ones(len(self.keys), dtype="bool")
+        if not archived:
+            mask &= ~np.asarray(self.archived, dtype="bool")
+
+        wanted: set[str] = {" ".join(_tokenize(frequency)) for frequency in frequencies}
+        if wanted:
+            frequency_ids: list[int] = [
+                i for i, frequency in enumerate(self.frequencies) if frequency in wanted
+            ]
+            mask &= np.isin(self.frequency_ids, frequency_ids)
+
+        if active_after is not None:
+            mask &= self.end_days >= active_after
+
+        categories = list(categories)
+        if categories:
+            mask &= np.isin(self.categories, categories)
+
+        return mask
+
+    def _field_scores(
+        self,
+        postings: _Postings,
+        word: str,
+        lengths: np.ndarray | None,
+        candidates: np.ndarray,
+    ) -> tuple[np.ndarray, list[int]]:
+        """Returns the scores of the candidate documents for a query word in a field.
+
+        Args:
+            - postings (_Postings): posting lists of the field.
+            - word (str): normalized query word.
+            - lengths (np.ndarray | None): document lengths for BM25, or None for idf only
+            scoring.
+            - candidates (np.ndarray): boolean mask of the documents to be scored.
+
+        Returns:
+            - tuple[np.ndarray, list[int]]: scores of all documents and the matched term ids.
+        """
+
+        total: int = len(self.keys)
+        scores: np.ndarray = np.zeros(total, dtype="float64")
+        matches: list[tuple[int, float]] = postings.expand(
+            word, self.PREFIX_WEIGHT, self.MAX_EXPANSIONS
+        )
+        if postings is self.names and not any(weight == 1.0 for _, weight in matches):
+            # the word is not in the names, it might be misspelled.
+            matches += [match for match in self._fuzzy_terms(word) if match not in matches]
+
+        for term_id, weight in matches:
+            docs, frequencies = postings.postings(term_id)
+            idf: float = np.log(1.0 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            # idf is of the whole index, so filtering doesn't change the scores of the series.
+            keep: np.ndarray = candidates[docs]
+            docs, frequencies = docs[keep], frequencies[keep]
+            if lengths is None:
+                term_scores: np.ndarray = np.full(len(docs), weight * idf)
+            else:
+                norms: np.ndarray = self.K1 * (
+                    1.0 - self.B + self.B * lengths[docs] / max(self.average_length, 1.0)
+                )
+                term_scores = weight * idf * frequencies * (self.K1 + 1.0) / (frequencies + norms)
+            # a word counts once per document even if it matches several terms.
+            scores[docs] = np.maximum(scores[docs], term_scores)
+
+        return scores, [term_id for term_id, _ in matches]
+
+    def _nearest_gaps(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Returns the smallest distance of every document from an occurrence of a word to the
+        next occurrence of another word in the same name (inf if there isn't any).
+
+        Args:
+            - first (np.ndarray): sorted occurrences of the first word.
+            - second (np.ndarray): sorted occurrences of the second word.
+
+        Returns:
+            - np.ndarray: distances of all documents.
+        """
+
+        gaps: np.ndarray = np.full(len(self.keys), np.inf)
+        following: np.ndarray = np.searchsorted(second, first, side="right")
+        found: np.ndarray = following < len(second)
+        first, following = first[found], second[following[found]]
+        same: np.ndarray = (first >> _Postings.STRIDE) == (following >> _Postings.STRIDE)
+        np.minimum.at(gaps, first[same] >> _Postings.STRIDE, following[same] - first[same])
+
+        return gaps
+
+    def _proximity(self, word_terms: list[list[int]], candidates: np.ndarray) -> np.ndarray:
+        """Returns the proximity bonuses of the documents for consecutive query words.
+
+        Args:
+            - word_terms (list[list[int]]): matched name term ids of every query word.
+            - candidates (np.ndarray): boolean mask of the documents to be scored.
+
+        Returns:
+            - np.ndarray: proximity bonuses of all documents.
+        """
+
+        bonus: np.ndarray = np.zeros(len(self.keys), dtype="float64")
+        occurrences: list[np.ndarray] = []
+        for term_ids in word_terms:
+            found: np.ndarray = self.names.occurrences(term_ids)
+            occurrences.append(found[candidates[found >> _Postings.STRIDE]])
+
+        for previous, current in zip(occurrences, occurrences[1:]):
+            if not len(previous) or not len(current):
+                continue
+            # 1 is a phrase, words appearing in the reverse order get half of the bonus.
+            forward: np.ndarray = self._nearest_gaps(previous, current)
+            backward: np.ndarray = self._nearest_gaps(current, previous)
+            bonus += np.where(
+                np.isfinite(forward),
+                1.0 / forward,
+                np.where(np.isfinite(backward), 0.5 / backward, 0.0),
+            )
+
+        return bonus * self.PROXIMITY_WEIGHT
+
+    def score(
+        self, keyword: str, n: int | None = None, candidates: np.ndarray | None = None
+    ) -> Counter:
+        """Scores the series for given keywords.
+
+        Args:
+            - keyword (str): words to be searched.
+            - n (int | None, optional): number of the best matches to be returned. Defaults to
+            None (all matches).
+            - candidates (np.ndarray | None, optional): boolean mask of the series to be scored
+            (see `candidates`). Defaults to None (the series that are not archived).
+
+        Returns:
+            - Counter: {series code: score} of the matching series in descending order of the
+            scores (equal scores keep the order of the index).
+        """
+
+        words: list[str] = list(dict.fromkeys(_tokenize(keyword)))
+        if not words or not len(self.keys):
+            return Counter()
+
+        if candidates is None:
+            # punishment: Archived series
+            candidates = self.candidates()
+        if not candidates.any():
+            return Counter()
+
+        scores: np.ndarray = np.zeros(len(self.keys), dtype="float64")
+        word_terms: list[list[int]] = []
+
+        for word in words:
+            name_scores, term_ids = self._field_scores(
+                self.names, word, self.lengths, candidates
+            )
+            code_scores, _ = self._field_scores(self.codes, word, None, candidates)
+            scores += name_scores + self.CODE_WEIGHT * code_scores
+            word_terms.append(term_ids)
+
+        # bonus: the keywords are (in) the frequency of the series.
+        phrase: str = " ".join(words)
+        frequency_bonus: np.ndarray = np.array(
+            [self.FREQUENCY_BONUS if phrase in frequency else 0.0 for frequency in self.frequencies]
+        )
+        if frequency_bonus.any():
+            scores += np.where(scores > 0, frequency_bonus[self.frequency_ids], 0.0)
+
+        # bonus: consecutive keywords appear close to each other in the series names.
+        if len(words) > 1:
+            scores += self._proximity(word_terms, candidates)
+
+        found: np.ndarray = np.flatnonzero(scores > 0)
+        if n is not None and n < len(found):
+            # keep the n best and the ones tied with the n-th best.
+            threshold: float = np.partition(scores[found], len(found) - n)[len(found) - n]
+            found = found[scores[found] >= threshold]
+        # stable sort keeps the index order for equal scores.
+        found = found[np.argsort(-scores[found], kind="stable")][:n]
+
+        return Counter({self.keys[doc]: float(scores[doc]) for doc in found})
+
+
+def _free_threaded() -> bool:
+    """Returns True if the interpreter runs without the GIL (e.g. Python 3.13t)"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+# search texts and the engine of a parallel scoring worker process.
+_worker_texts: list[tuple[str, str, str, str, str]] = []
+_worker_engine: "SearchEngine | None" = None
+
+
+def _init_search_worker(texts: list[tuple[str, str, str, str, str]]) -> None:
+    """Keeps the search texts of the index in a parallel scoring worker process"""
+    global _worker_texts
+    _worker_texts = texts
+
+
+def _score_search_shard(
+    start: int,
+    end: int,
+    keywords: Sequence[str],
+    n: int,
+    overtime: float,
+    candidates: np.ndarray,
+) -> tuple[list[list[tuple[str, int]]], bool]:
+    """Returns the n best matches of the keywords in a shard of the index (worker process)"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = SearchEngine(language="TR", scorer="regex")
+
+    texts: list[tuple[str, str, str, str, str]] = list(
+        compress(_worker_texts[start:end], candidates)
+    )
+
+    return _worker_engine._score_shard(texts, keywords, n, overtime)
+
+
 class SearchEngine:
     """A simple search engine created for EVDS index searching"""
 
-    def __init__(self, language: str) -> None:
+    SCORERS: tuple[str, ...] = ("bm25", "regex")
+    MAX_CACHED_PATTERNS: int = 1024
+    MIN_SHARD_SIZE: int = 1000
+    # (frequencies, active after, categories, archived) of the searches without filters.
+    NO_FILTERS: tuple[Any, ...] = ((), None, (), False)
+
+    def __init__(
+        self, language: str, scorer: str | None = None, workers: int | None = None
+    ) -> None:
         """A simple search engine originally developed for evdsts series code search.
 
         Args:
             language (str): index language
+            scorer (str | None, optional): scoring of the searches. Defaults to None ('bm25').
+                - 'bm25': token based inverted index built once when the index is loaded.
+                - 'regex': legacy regex scan over all the series names.
+            workers (int | None, optional): number of index shards that the regex scorer
+            scores in parallel (in a process pool, or in threads on free-threaded Python).
+            Defaults to None (1, serial).
         """
         self.cfg: EVDSTSConfig = EVDSTSConfig()
+        self.workers: int = workers if workers else self.cfg.search_workers
+        self._executor: Executor | None = None
+        self._executor_version: tuple[Any, ...] | None = None
         self.index_file: str = ""
+        self.binary_index_file: str = ""
+        self.version_file: str = ""
+        self.inverted_index: InvertedIndex | None = None
+        self.scorer: str = scorer if scorer else self.cfg.search_scorer
         self.language: str = language
-        self.index: dict[str, str] = {}
+        self.index: Mapping[str, Sequence[str]] = {}
+        self._search_texts: list[tuple[str, str, str, str, str]] | None = None
+        self._searchable: np.ndarray = np.empty(0, dtype="bool")
+        self._pattern_cache: dict[str, tuple[_CompiledPattern, ...]] = {}
+        self._results_cache: OrderedDict[tuple[Any, ...], dict[str, str]] = OrderedDict()
+        self.index_version: tuple[Any, ...] = ()
 
     @property
     def language(self) -> str:
@@ -59,6 +914,20 @@ class SearchEngine:
         # change language dependent features.
         self._language_changed(self._language)
 
+    @property
+    def scorer(self) -> str:
+        """Returns the scorer of the searches"""
+
+        return self._scorer
+
+    @scorer.setter
+    def scorer(self, val: str) -> None:
+        """Sets the scorer of the searches"""
+
+        if val.strip() not in self.SCORERS:
+            raise ValueError(f"{val.strip()} is not a defined scorer, use one of {self.SCORERS}.")
+        self._scorer = val.strip()
+
     @property
     def index_age_in_days(self) -> int:
         """Returns the age of the search index file in days.
@@ -82,7 +951,11 @@ class SearchEngine:
 
         # reload when the language is chenged
         self.index_file = self._set_index_file(language)
+        self.binary_index_file = self._set_binary_index_file(language)
+        self.version_file = self._set_version_file(language)
         self.index = {}
+        self.inverted_index = None
+        self._search_texts = None
 
     def _set_index_file(self, language: str) -> str:
         """Sets search index file corresponding to given language
@@ -96,10 +969,66 @@ class SearchEngine:
         else:
             return self.cfg.index_file_en
 
+    def _set_binary_index_file(self, language: str) -> str:
+        """Sets binary search index file corresponding to given language
+
+        Returns:
+            - str: binary index file name
+        """
+
+        if language == "TR":
+            return self.cfg.index_binary_file_tr
+        else:
+            return self.cfg.index_binary_file_en
+
+    def _set_version_file(self, language: str) -> str:
+        """Sets index version file corresponding to given language
+
+        Returns:
+            - str: version file name
+        """
+
+        if language == "TR":
+            return self.cfg.index_version_file_tr
+        else:
+            return self.cfg.index_version_file_en
+
+    def _load_binary_index(self) -> bool:
+        """Memory-maps the binary series index if it's not older than the JSON index.
+
+        Returns:
+            - bool: True if the binary index is loaded.
+        """
+
+        binary_file: Path = Path(self.binary_index_file)
+        if not binary_file.is_file():
+            return False
+
+        json_file: Path = Path(self.index_file)
+        if json_file.is_file() and json_file.stat().st_mtime > binary_file.stat().st_mtime:
+            # the JSON index is written after the binary one, don't search in a stale index.
+            return False
+
+        try:
+            self.index, self.inverted_index = InvertedIndex.load(binary_file)
+        except (OSError, ValueError):
+            print("Binary file that keeps the series index can not be read and is removed!")
+            delete_file(self.binary_index_file)
+            return False
+
+        return True
+
     def _load_index(self) -> None:
         """Loads series index"""
 
         # load index on demand in order not to allocate memory unnecessarily.
+        self._search_texts = None
+        self._results_cache.clear()
+        self.index_version = self._get_index_version()
+        # the binary index is memory-mapped, so it's neither parsed nor copied into memory.
+        if self._load_binary_index():
+            return
+
         corrupted_file: bool = False
         check: bool = Path(self.index_file).is_file()
         if not check:
@@ -114,6 +1043,11 @@ class SearchEngine:
 
         if corrupted_file:
             delete_file(self.index_file)
+            return
+
+        self.inverted_index = None
+        if self.scorer == "bm25":
+            self.inverted_index = InvertedIndex.from_entries(self.index)
 
     def _show_search_results(self, results: dict[str, list[str]]) -> None:
         """Writes series search results to screen.
@@ -210,11 +1144,126 @@ class SearchEngine:
 
         return regexes
 
-    def _match_text(self, regex: str, text: str) -> bool:
+    def _get_compiled_patterns(self, keyword: str) -> tuple[_CompiledPattern, ...]:
+        """Returns compiled regex patterns of given keywords (see _create_regex_patterns).
+
+        Patterns are compiled once per keyword set and memoized.
+
+        Args:
+            - keyword (str): words to be searched.
+
+        Returns:
+            - tuple[_CompiledPattern, ...]: (regex, compiled regex, compiled Turkish-normalized
+            regex, difficulty) of every pattern.
+        """
+
+        compiled: tuple[_CompiledPattern, ...] | None = self._pattern_cache.get(keyword, None)
+        if compiled is None:
+            compiled = tuple(
+                (
+                    regex,
+                    re.compile(regex, re.IGNORECASE),
+                    re.compile(_normalize_turkish(regex), re.IGNORECASE),
+                    difficulty,
+                )
+                for regex, difficulty in self._create_regex_patterns(keyword)
+            )
+            if len(self._pattern_cache) >= self.MAX_CACHED_PATTERNS:
+                self._pattern_cache.clear()
+            self._pattern_cache[keyword] = compiled
+
+        return compiled
+
+    def _get_search_texts(self) -> list[tuple[str, str, str, str, str]]:
+        """Returns the texts of the index entries that the regex scorer searches in.
+
+        Series names are lower-cased and Turkish-normalized once and kept until the index is
+        reloaded.
+
+        Returns:
+            - list[tuple[str, str, str, str, str]]: (series code, series name, normalized series
+            name, upper-cased series code words, upper-cased frequency) of all the series in the
+            index order.
+        """
+
+        if self._search_texts is None:
+            self._search_texts = [
+                (
+                    key,
+                    info[0],
+                    _normalize_turkish(info[0]),
+                    key.upper().replace(".", " "),
+                    info[1].upper() if len(info) > 1 else "",
+                )
+                for key, info in self.index.items()
+            ]
+            # punishment: Archived series
+            self._searchable = np.array(
+                [name.lower().find("arşiv") == -1 for _, name, *_ in self._search_texts],
+                dtype="bool",
+            )
+
+        return self._search_texts
+
+    def _get_inverted_index(self) -> InvertedIndex:
+        """Returns the inverted index of the series index (built on demand)"""
+
+        if self.inverted_index is None:
+            self.inverted_index = InvertedIndex.from_entries(self.index)
+
+        return self.inverted_index
+
+    def _facet_filters(
+        self,
+        frequency: str | Sequence[str] | None = None,
+        active_after: DateLike = None,
+        category: int | Sequence[int] | None = None,
+        archived: bool = False,
+    ) -> tuple[Any, ...]:
+        """Returns the normalized filters of a search (see `where`).
+
+        Raises:
+            - WrongDateFormatException: If active_after can not be parsed into a date.
+
+        Returns:
+            - tuple[Any, ...]: (frequencies, active after in days since 01-01-1970, category ids,
+            archived)
+        """
+
+        if isinstance(frequency, str):
+            frequency = [frequency]
+        if isinstance(category, int):
+            category = [category]
+
+        return (
+            tuple(sorted({" ".join(_tokenize(freq)) for freq in frequency or ()})),
+            None if active_after is None else _date_to_days(correct_date(active_after)),
+            tuple(sorted({int(id_) for id_ in category or ()})),
+            bool(archived),
+        )
+
+    def _get_candidates(self, filters: tuple[Any, ...]) -> np.ndarray:
+        """Returns a boolean mask of the series that pass the filters of a search in the index
+        order.
+
+        Args:
+            - filters (tuple[Any, ...]): normalized filters (see `_facet_filters`).
+
+        Returns:
+            - np.ndarray: candidate series to be scored.
+        """
+
+        if filters == self.NO_FILTERS and self.scorer == "regex":
+            # the legacy regex scorer doesn't need the facets of the inverted index.
+            self._get_search_texts()
+            return self._searchable
+
+        return self._get_inverted_index().candidates(*filters)
+
+    @staticmethod
+    def _match_text(pattern: _CompiledPattern, text: str, normalized_text: str) -> bool:
         """Matches regex against text with Turkish character normalization fallback."""
-        if re.search(regex, text, re.IGNORECASE):
-            return True
-        return bool(re.search(_normalize_turkish(regex), _normalize_turkish(text), re.IGNORECASE))
+        return bool(pattern[1].search(text) or pattern[2].search(normalized_text))
 
     def _search_score(
         self,
@@ -234,130 +1283,467 @@ class SearchEngine:
                 - a flag for providing information if the search was interceped due to timeover.
         """
 
-        # and second use a scoring schema that gives scores to the matches according to difficulty
+        results, time_over = self._search_scores([keyword], overtime=overtime)
+
+        return results[0], time_over
+
+    def _search_scores(
+        self,
+        keywords: Sequence[str],
+        overtime: float = 4.0,
+        texts: list[tuple[str, str, str, str, str]] | None = None,
+        candidates: np.ndarray | None = None,
+    ) -> tuple[list[Counter], bool]:
+        """Calculates search results of several keywords in a single pass over the index.
+
+        Args:
+            - keywords (Sequence[str]): keywords to be searched
+            - overtime (float): defines how long the scoring process can takes maximum in seconds.
+            - texts (list[tuple[str, str, str, str, str]] | None, optional): a shard of the
+            search texts to be scored. Defaults to None (the candidates in the index).
+            - candidates (np.ndarray | None, optional): boolean mask of the series in the index
+            to be scored if texts is None. Defaults to None (the series that are not archived).
+
+        Returns:
+            - tuple[list[Counter], bool]:
+                - matching keys and their scores for every keyword
+                - a flag for providing information if the search was interceped due to timeover.
+        """
+
+        # use a scoring schema that gives scores to the matches according to difficulty
         # of matching.
 
-        counter_list: list[str] = []
+        queries: list[tuple[Any, ...]] = []
+        for keyword in keywords:
+            patterns: tuple[_CompiledPattern, ...] = self._get_compiled_patterns(keyword)
+            keyword_upper: str = keyword.strip().upper()
+            single_patterns: list[_CompiledPattern] = []
+            for pattern in patterns:
+                # regexes comes in order by difficulty from _create_regex_patterns.
+                if pattern[3] != 1:
+                    break
+                single_patterns.append(pattern)
+            queries.append(
+                (
+                    patterns,
+                    single_patterns,
+                    keyword_upper,
+                    keyword_upper.split(),
+                    keyword.strip().split(" "),
+                )
+            )
+
+        counter_lists: list[list[str]] = [[] for _ in keywords]
         exclude_list: list[str] = []
         time_over: bool = False
 
-        patterns: tuple[tuple[str, int]] = self._create_regex_patterns(keyword)
-        keyword_upper: str = keyword.strip().upper()
-
         start: float = perf_counter()
 
         # not a readibility focused but performance.
-        # info[0] is actual names of the series'.
-        # regexes comes in order by difficulty from _create_regex_patterns.
-        for key, info in self.index.items():
-            score = 0
-            exclude_list = []
-
-            # punishment: Archived series
-            if info[0].lower().find("arşiv") != -1:
+        # name is actual names of the series'.
+        if texts is None:
+            texts = self._get_search_texts()
+            texts = list(compress(texts, self._searchable if candidates is None else candidates))
+
+        for key, name, normalized_name, key_upper, frequency_upper in texts:
+            for query, counter_list in zip(queries, counter_lists):
+                patterns, single_patterns, keyword_upper, upper_words, words = query
                 score = 0
-                continue
+                exclude_list = []
 
-            # bonus: match against series code (e.g. "USD" matches "TP.DK.USD.A.YTL")
-            key_upper: str = key.upper().replace(".", " ")
-            for word in keyword_upper.split():
-                if word in key_upper:
-                    score += 2
+                # bonus: match against series code (e.g. "USD" matches "TP.DK.USD.A.YTL")
+                for word in upper_words:
+                    if word in key_upper:
+                        score += 2
 
-            # bonus: match against frequency field if available
-            if len(info) > 1 and keyword_upper in info[1].upper():
-                score += 1
+                # bonus: match against frequency field if available
+                if frequency_upper and keyword_upper in frequency_upper:
+                    score += 1
 
-            for regex, difficulty in patterns:
                 # first check 1 word long regexes
-                if difficulty == 1:
-                    if self._match_text(regex, info[0]):
-                        score += difficulty
+                for pattern in single_patterns:
+                    if self._match_text(pattern, name, normalized_name):
+                        score += 1
                     else:
                         # not matched so all aliases of the word will be excluded from furter
                         # searches
-                        exclude_list += [regex.strip(r"\b")]
+                        exclude_list.append(pattern[0].strip(r"\b"))
+
+                if exclude_list:
+                    # exclude not matching individual words.
+                    new_keyword: str = " ".join(
+                        (word for word in words if word not in exclude_list)
+                    )
+                    new_patterns: tuple[_CompiledPattern, ...] = self._get_compiled_patterns(
+                        new_keyword
+                    )
+
                 else:
-                    break
+                    # everyone onf them is matched
+                    new_patterns = patterns
+
+                for pattern in new_patterns:
+                    # check regexes only longer the 1 word
+                    if pattern[3] > 1:
+                        if self._match_text(pattern, name, normalized_name):
+                            score += pattern[3]
 
-            if exclude_list:
-                # exclude not matching individual words.
-                new_keyword: str = " ".join(
-                    (word for word in keyword.strip().split(" ") if word not in exclude_list)
+                    if (perf_counter() - start) > overtime:
+                        time_over = True
+                        break
+
+                if score:
+                    counter_list.extend([key] * score)
+
+        return [Counter(counter_list) for counter_list in counter_lists], time_over
+
+    def _get_executor(self) -> Executor:
+        """Returns the pool that scores the index shards in parallel.
+
+        Threads are used if the interpreter runs without the GIL, otherwise the search texts are
+        handed to the worker processes once when the pool is created, so the pool is recreated
+        whenever the index is reloaded.
+
+        Returns:
+            - Executor: worker pool
+        """
+
+        if _free_threaded():
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+        if self._executor is None or self._executor_version != self.index_version:
+            self.close()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_search_worker,
+                initargs=(self._get_search_texts(),),
+            )
+            self._executor_version = self.index_version
+
+        return self._executor
+
+    def _parallel_search_scores(
+        self,
+        keywords: Sequence[str],
+        n: int,
+        overtime: float = 4.0,
+        candidates: np.ndarray | None = None,
+    ) -> tuple[list[Counter], bool]:
+        """Calculates search results of several keywords over the index shards in parallel.
+
+        Every shard returns its n best matches, they are merged in the index order, so the
+        results are the same as the results of the serial scoring.
+
+        Args:
+            - keywords (Sequence[str]): keywords to be searched
+            - n (int): number of the best matches to be kept.
+            - overtime (float): defines how long the scoring of a shard can takes maximum in
+            seconds.
+            - candidates (np.ndarray | None, optional): boolean mask of the series in the index
+            to be scored. Defaults to None (the series that are not archived).
+
+        Returns:
+            - tuple[list[Counter], bool]:
+                - matching keys and their scores for every keyword
+                - a flag for providing information if the search was interceped due to timeover.
+        """
+
+        texts: list[tuple[str, str, str, str, str]] = self._get_search_texts()
+        if candidates is None:
+            candidates = self._searchable
+        size: int = -(-len(texts) // self.workers)
+        shards: list[tuple[int, int]] = [
+            (start, min(start + size, len(texts))) for start in range(0, len(texts), size)
+        ]
+
+        executor: Executor = self._get_executor()
+        if isinstance(executor, ThreadPoolExecutor):
+            futures: list[Future] = [
+                executor.submit(
+                    self._score_shard,
+                    list(compress(texts[start:end], candidates[start:end])),
+                    keywords,
+                    n,
+                    overtime,
+                )
+                for start, end in shards
+            ]
+        else:
+            futures = [
+                executor.submit(
+                    _score_search_shard, start, end, keywords, n, overtime, candidates[start:end]
                 )
-                new_patterns: tuple[tuple[str, int]] = self._create_regex_patterns(new_keyword)
+                for start, end in shards
+            ]
 
-            else:
-                # everyone onf them is matched
-                new_keyword = keyword
-                new_patterns = patterns
-
-            for regex, difficulty in new_patterns:
-                # check regexes only longer the 1 word
-                if difficulty > 1:
-                    if self._match_text(regex, info[0]):
-                        score += difficulty
-
-                if (perf_counter() - start) > overtime:
-                    time_over = True
-                    break
+        merged: list[Counter] = [Counter() for _ in keywords]
+        time_over: bool = False
+        # merge the shards in the index order for keeping the order of the equal scores.
+        for future in futures:
+            shard_scores, shard_time_over = future.result()
+            time_over = time_over or shard_time_over
+            for counter, shard_score in zip(merged, shard_scores):
+                counter.update(dict(shard_score))
+
+        return merged, time_over
+
+    def _score_shard(
+        self,
+        texts: list[tuple[str, str, str, str, str]],
+        keywords: Sequence[str],
+        n: int,
+        overtime: float,
+    ) -> tuple[list[list[tuple[str, int]]], bool]:
+        """Returns the n best matches of the keywords in a shard of the index"""
+
+        scores, time_over = self._search_scores(keywords, overtime=overtime, texts=texts)
+
+        return [score.most_common(n) for score in scores], time_over
+
+    def close(self) -> None:
+        """Shuts the parallel scoring workers down"""
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+            self._executor_version = None
+
+    def _get_index_version(self) -> tuple[Any, ...]:
+        """Returns the version of the index files on disk.
+
+        IndexBuilder writes the version file after the index files are replaced, so an index
+        that is being written is not reloaded before it's completed.
+
+        Returns:
+            - tuple[Any, ...]: ('version', number) recorded in the version file, or
+            (modification time, size) of the JSON and the binary index files (None for a missing
+            file) for the indexes that don't have a version file.
+        """
+
+        try:
+            with open(self.version_file, "r", encoding="utf-8") as f:
+                return ("version", int(json.load(f)["version"]))
+        except (OSError, JSONDecodeError, KeyError, TypeError, ValueError):
+            pass
+
+        version: list[tuple[int, int] | None] = []
+        for fname in (self.index_file, self.binary_index_file):
+            try:
+                stat: os.stat_result = os.stat(fname)
+                version.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                version.append(None)
+
+        return tuple(version)
+
+    def _ensure_index(self) -> bool:
+        """Loads the index if it's not loaded yet or its files are changed since it's loaded.
+
+        Returns:
+            - bool: True if there is an index to be searched.
+        """
+
+        if not self.index or self._get_index_version() != self.index_version:
+            self.index = {}
+            self._load_index()
+
+        return bool(self.index)
+
+    def _cache_key(
+        self, keyword: str, n: int, filters: tuple[Any, ...] = NO_FILTERS
+    ) -> tuple[Any, ...]:
+        """Returns the results cache key of a search"""
+
+        if self.scorer == "bm25":
+            # the inverted index only sees the normalized words.
+            normalized: str = " ".join(_tokenize(keyword))
+        else:
+            normalized = keyword.strip()
+
+        return (self.scorer, normalized, n, filters, self.index_version)
+
+    def _show_where_results(
+        self, keyword: str, result: dict[str, list[str]], time_over: bool, overtime: float
+    ) -> None:
+        """Writes results of a search to screen.
+
+        Args:
+            - keyword (str): searched keywords.
+            - result (dict[str, list[str]]): search results.
+            - time_over (bool): the search was intercepted due to timeover.
+            - overtime (float): time limit of the search in seconds.
+        """
+
+        if result:
+            print(f"{len(result)} most relevant results for '{keyword}' are shown below.\n")
+            self._show_search_results(result)
+        else:
+            print(f"Nothing found for {keyword}")
 
-            if score:
-                counter_list.extend([key] * score)
+        if time_over:
+            print(
+                f"Warning: searching took more time than {overtime} seconds and intercepted!\n"
+                "Please try to search using less words (max. 6 words are ideal in general) if you "
+                "don't find the series names you're looking for."
+            )
 
-        result: Counter = Counter(counter_list)
+    def clear_cache(self) -> None:
+        """Removes all cached search results"""
 
-        return result, time_over
+        self._results_cache.clear()
 
     def where(
         self,
         keyword: str,
         n: int = 100,
         verbose: bool = True,
+        frequency: str | Sequence[str] | None = None,
+        active_after: DateLike = None,
+        category: int | Sequence[int] | None = None,
+        archived: bool = False,
     ) -> dict[str, str]:
         """Searches given words to determine related series identifications on EVDS API service.
 
+        Filters are applied before scoring, so only the series that pass them are scored.
+
         Args:
             - keyword (str): words to be searched (for instance: consumer price index)
             - verbose (bool, optional): Shows the results on screen if True. Defaults to True.
             - n (int, optional): Number of maxiumum related results to be returned. Defaults to 100.
+            - frequency (str | Sequence[str] | None, optional): Frequencies of the series as they
+            are shown in the results (e.g. 'AYLIK', 'MONTHLY'). Defaults to None (any frequency).
+            - active_after (DateLike, optional): Only the series that have observations after
+            the date. Defaults to None (any date).
+            - category (int | Sequence[int] | None, optional): Main category ids of the series
+            (see get_main_categories). Defaults to None (any category).
+            - archived (bool, optional): Includes the archived series if True. Defaults to False.
 
         Raises:
             - ValueError: if there is no keyword provided to search.
+            - WrongDateFormatException: if active_after can not be parsed into a date.
 
         Returns:
             None | dict[str, str]: Results dictionary.
         """
 
-        if not self.index:
-            self._load_index()
-            if not self.index:
-                print(
-                    "There is no index found to be searched!\n"
-                    "Use IndexBuilder to build one to search in."
-                )
-                return
+        if not self._ensure_index():
+            print(
+                "There is no index found to be searched!\n"
+                "Use IndexBuilder to build one to search in."
+            )
+            return
 
         if not keyword:
             raise ValueError("Keyword can not be None type.")
 
-        overtime: float = 4.0
-        score, time_over = self._search_score(keyword, overtime=overtime)
-        most_commons: list[tuple[str, int]] = score.most_common(n)
-        result: dict[str, str] = {k: self.index[k][:3] for k, _ in most_commons}
+        return self.where_many(
+            [keyword],
+            n=n,
+            verbose=verbose,
+            frequency=frequency,
+            active_after=active_after,
+            category=category,
+            archived=archived,
+        )[keyword]
+
+    def where_many(
+        self,
+        keywords: Sequence[str],
+        n: int = 100,
+        verbose: bool = False,
+        frequency: str | Sequence[str] | None = None,
+        active_after: DateLike = None,
+        category: int | Sequence[int] | None = None,
+        archived: bool = False,
+    ) -> dict[str, dict[str, str]]:
+        """Searches several keywords at once.
 
-        if verbose:
-            if result:
-                print(f"{len(result)} most relevant results for '{keyword}' are shown below.\n")
-                self._show_search_results(result)
-            else:
-                print(f"Nothing found for {keyword}")
+        Results are cached (see `clear_cache`), the keywords that are not in the cache are scored
+        together in a single pass over the series that pass the filters.
 
-        if time_over:
+        Args:
+            - keywords (Sequence[str]): keywords to be searched (for instance: ["tüfe", "faiz"])
+            - n (int, optional): Number of maxiumum related results to be returned for every
+            keyword. Defaults to 100.
+            - verbose (bool, optional): Shows the results on screen if True. Defaults to False.
+            - frequency (str | Sequence[str] | None, optional): Frequencies of the series.
+            Defaults to None (any frequency).
+            - active_after (DateLike, optional): Only the series that have observations after
+            the date. Defaults to None (any date).
+            - category (int | Sequence[int] | None, optional): Main category ids of the series.
+            Defaults to None (any category).
+            - archived (bool, optional): Includes the archived series if True. Defaults to False.
+
+        Raises:
+            - ValueError: if there is no keyword provided to search.
+            - WrongDateFormatException: if active_after can not be parsed into a date.
+
+        Returns:
+            None | dict[str, dict[str, str]]: Results dictionaries of the keywords.
+        """
+
+        if not self._ensure_index():
             print(
-                f"Warning: searching took more time than {overtime} seconds and intercepted!\n"
-                "Please try to search using less words (max. 6 words are ideal in general) if you "
-                "don't find the series names you're looking for."
+                "There is no index found to be searched!\n"
+                "Use IndexBuilder to build one to search in."
             )
+            return
+
+        if isinstance(keywords, str):
+            keywords = [keywords]
+
+        if not keywords or not all(keywords):
+            raise ValueError("Keyword can not be None type.")
+
+        filters: tuple[Any, ...] = self._facet_filters(frequency, active_after, category, archived)
+        overtime: float = 4.0
+        time_over: bool = False
+        results: dict[str, dict[str, str]] = {}
+        missing: list[str] = []
+
+        for keyword in dict.fromkeys(keywords):
+            key: tuple[Any, ...] = self._cache_key(keyword, n, filters)
+            cached: dict[str, str] | None = self._results_cache.get(key, None)
+            if cached is not None:
+                self._results_cache.move_to_end(key)
+                results[keyword] = {k: list(v) for k, v in cached.items()}
+            else:
+                missing.append(keyword)
+
+        if missing:
+            candidates: np.ndarray = self._get_candidates(filters)
+            if self.scorer == "bm25":
+                scores: list[Counter] = [
+                    self._get_inverted_index().score(keyword, n=n, candidates=candidates)
+                    for keyword in missing
+                ]
+            elif self.workers > 1 and len(self._get_search_texts()) >= self.MIN_SHARD_SIZE:
+                scores, time_over = self._parallel_search_scores(
+                    missing, n, overtime=overtime, candidates=candidates
+                )
+            else:
+                scores, time_over = self._search_scores(
+                    missing, overtime=overtime, candidates=candidates
+                )
+
+            for keyword, score in zip(missing, scores):
+                most_commons: list[tuple[str, int]] = score.most_common(n)
+                result: dict[str, str] = {k: self.index[k][:3] for k, _ in most_commons}
+                results[keyword] = result
+                if not time_over:
+                    # intercepted searches are incomplete, don't keep them.
+                    self._results_cache[self._cache_key(keyword, n, filters)] = {
+                        k: list(v) for k, v in result.items()
+                    }
+                    while len(self._results_cache) > self.cfg.search_cache_size:
+                        self._results_cache.popitem(last=False)
+
+        if verbose:
+            for keyword in results:
+                self._show_where_results(
+                    keyword, results[keyword], time_over and keyword in missing, overtime
+                )
 
-        return result
+        return results
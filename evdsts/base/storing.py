@@ -0,0 +1,243 @@
+"""evdsts SeriesStore Class"""
+
+__author__ = "Burak CELIK"
+__copyright__ = "Copyright (c) 2022 Burak CELIK"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__internal__ = "0.0.1"
+
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from json import JSONDecodeError
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from evdsts.configuration.cfg import EVDSTSConfig
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class SeriesStore:
+    """A local columnar store of the retrieved time series.
+
+    Every stored frame is kept in its own .npz file (one array per column plus the index) and
+    a JSON manifest keeps the date coverage of the frames keyed on the requested series,
+    frequency, transformations and aggregations. Connector uses the store to request only the
+    observations that are newer than the stored ones (see `get_series(..., incremental=True)`).
+    The manifest is updated under a file lock, so a store can be shared by several processes.
+    """
+
+    MANIFEST: str = "manifest.json"
+    LOCK: str = "manifest.lock"
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        """Local series store.
+
+        Args:
+            - directory (str | Path | None, optional): Folder that keeps the stored series.
+            Defaults to `None` (evds_series_store in the data folder of evdsts).
+        """
+
+        self.cfg: EVDSTSConfig = EVDSTSConfig()
+        self.directory: Path = Path(directory) if directory else Path(self.cfg.store_directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def manifest_file(self) -> Path:
+        """Returns the manifest file of the store"""
+
+        return self.directory / self.MANIFEST
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Holds the store exclusively for the threads and processes that share it"""
+
+        with self._lock:
+            fd: int = os.open(self.directory / self.LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    else:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def make_key(params: dict[str, str]) -> str:
+        """Returns a store key for the parameters of a series request.
+
+        Args:
+            - params (dict[str, str]): series request parameters.
+
+        Returns:
+            - str: store key
+        """
+
+        identifier: dict[str, str] = {
+            field: str(params.get(field, "") or "")
+            for field in ("series", "frequency", "formulas", "aggregationTypes")
+        }
+
+        return hashlib.sha256(json.dumps(identifier, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _load_manifest(self) -> dict[str, dict[str, Any]]:
+
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, JSONDecodeError):
+            return {}
+
+    def _write_manifest(self, manifest: dict[str, dict[str, Any]]) -> None:
+
+        temp_file: Path = self.manifest_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=4)
+        os.replace(temp_file, self.manifest_file)
+
+    def entry(self, key: str) -> dict[str, Any] | None:
+        """Returns the manifest entry of a stored frame.
+
+        Args:
+            - key (str): store key.
+
+        Returns:
+            - dict[str, Any] | None: coverage information of the stored frame or None if the
+            key is not in the store.
+        """
+
+        with self._locked():
+            return self._load_manifest().get(key, None)
+
+    def load(self, key: str) -> tuple[pd.DataFrame, dict[str, Any]] | None:
+        """Returns a stored frame with its manifest entry.
+
+        Args:
+            - key (str): store key.
+
+        Returns:
+            - tuple[pd.DataFrame, dict[str, Any]] | None: (frame, entry) or None if the key is
+            not in the store or its file is missing.
+        """
+
+        with self._locked():
+            entry: dict[str, Any] | None = self._load_manifest().get(key, None)
+            if entry is None:
+                return None
+
+            try:
+                with np.load(self.directory / f"{key}.npz", allow_pickle=False) as arrays:
+                    unit: str = entry.get("unit", "ns")
+                    index = pd.DatetimeIndex(
+                        arrays["index"].astype(f"datetime64[{unit}]"), name="Date"
+                    )
+                    df: pd.DataFrame = pd.DataFrame(
+                        {
+                            column: arrays[f"c{position}"]
+                            for position, column in enumerate(entry["columns"])
+                        },
+                        index=index,
+                    )
+            except (FileNotFoundError, KeyError, ValueError, OSError):
+                return None
+
+        if entry.get("freq"):
+            try:
+                df.index.freq = entry["freq"]
+            except ValueError:
+                pass
+
+        return df, entry
+
+    def save(self, key: str, df: pd.DataFrame, params: dict[str, str], start: str) -> None:
+        """Stores a frame.
+
+        Args:
+            - key (str): store key.
+            - df (pd.DataFrame): time series with original EVDS column names.
+            - params (dict[str, str]): parameters of the series request.
+            - start (str): the earliest requested date ('dd-mm-YYYY') that the frame covers.
+        """
+
+        df = df.sort_index()
+        observed: pd.DataFrame = df.dropna(how="all")
+        last: pd.Timestamp = observed.index.max() if not observed.empty else df.index.max()
+
+        arrays: dict[str, np.ndarray] = {
+            f"c{position}": df[column].to_numpy(dtype="float32")
+            for position, column in enumerate(df.columns)
+        }
+        arrays["index"] = df.index.asi8
+
+        entry: dict[str, Any] = dict(
+            series=params.get("series", ""),
+            frequency=params.get("frequency", ""),
+            formulas=params.get("formulas", ""),
+            aggregationTypes=params.get("aggregationTypes", ""),
+            columns=[str(column) for column in df.columns],
+            freq=df.index.freqstr if df.index.freq is not None else None,
+            unit=df.index.unit,
+            start=start,
+            last=last.strftime("%d-%m-%Y"),
+            updated=datetime.now().isoformat(timespec="seconds"),
+        )
+
+        with self._locked():
+            temp_file: Path = self.directory / f"{key}.tmp.npz"
+            np.savez(temp_file, **arrays)
+            os.replace(temp_file, self.directory / f"{key}.npz")
+            manifest: dict[str, dict[str, Any]] = self._load_manifest()
+            manifest[key] = entry
+            self._write_manifest(manifest)
+
+    def remove(self, key: str) -> None:
+        """Removes a stored frame.
+
+        Args:
+            - key (str): store key.
+        """
+
+        with self._locked():
+            manifest: dict[str, dict[str, Any]] = self._load_manifest()
+            if manifest.pop(key, None) is not None:
+                self._write_manifest(manifest)
+            (self.directory / f"{key}.npz").unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Removes all stored frames"""
+
+        with self._locked():
+            for key in self._load_manifest():
+                (self.directory / f"{key}.npz").unlink(missing_ok=True)
+            self._write_manifest({})
+
+    def __len__(self) -> int:
+
+        with self._locked():
+            return len(self._load_manifest())
+
+    def __repr__(self) -> str:
+
+        return f"\n*{self.__class__.__name__}*:\n\ndirectory: {self.directory}\nentries: {len(self)}"
@@ -8,6 +8,7 @@ __mail__ = "synertic@gmail.com"
 
 from itertools import combinations
 from collections.abc import Sequence
+from typing import Type
 
 import numpy as np
 import pandas as pd
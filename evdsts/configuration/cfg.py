@@ -18,7 +18,15 @@ __mail__ = "synertic@gmail.com"
 
 from evdsts.configuration.globals import (
     AGGREGATIONS_MAP,
+    CACHE_FILE,
+    CACHE_HISTORICAL_TTL,
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    CATALOG_FILE,
+    CATALOG_MAX_AGE,
     CATEGORY_ID,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RECOVERY_TIME,
     DATAGROUP_CODE,
     DATAGROUP_NAME,
     DATE_SEPARATORS,
@@ -28,15 +36,48 @@ from evdsts.configuration.globals import (
     FREQUENCY_MAP,
     FREQUENCY_REGEXES,
     FREQUENCY_STR,
+    INDEX_BINARY_FILE_EN,
+    INDEX_BINARY_FILE_TR,
+    INDEX_BUILD_WORKERS,
+    INDEX_CHECKPOINT_FILE_EN,
+    INDEX_CHECKPOINT_FILE_TR,
     INDEX_FILE_EN,
     INDEX_FILE_TR,
+    INDEX_FINGERPRINT_FILE_EN,
+    INDEX_FINGERPRINT_FILE_TR,
+    INDEX_VERSION_FILE_EN,
+    INDEX_VERSION_FILE_TR,
     KEY_FILE,
+    MAIN_CATEGORIES_FILE,
+    MAIN_CATEGORIES_TTL,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_OBSERVATIONS_PER_REQUEST,
+    MAX_SERIES_PER_REQUEST,
     NOT_AVAILABLE_CATEGORIES,
+    OBSERVATIONS_PER_YEAR,
+    PANDAS_FREQUENCIES,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RATE_LIMIT,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_FILE,
+    RATE_LIMIT_PENALTY,
     RAW_ITEMS,
     REFERENCE_FILE,
+    REQUEST_TIMEOUT,
+    RETRY_BASE_DELAY,
+    RETRY_DEADLINE,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    RETRY_STATUSES,
+    SEARCH_CACHE_SIZE,
+    SEARCH_SCORER,
+    SEARCH_WORKERS,
     SERIES_CODE,
     SERIES_NAME,
     START_DATE,
+    STORE_DIRECTORY,
     TOPIC_TITLE,
     TRANSFORMATIONS_MAP,
     UNIXTIME,
@@ -62,6 +103,7 @@ class EVDSTSConfig:
     defined_languages: dict[str, str] = DEFINED_LANGUAGES
     not_available_categories: list[int] = NOT_AVAILABLE_CATEGORIES
     frequency_map: dict[tuple[str, str, str, int], str] = FREQUENCY_MAP
+    pandas_frequencies: dict[str, str] = PANDAS_FREQUENCIES
     category_id: str = CATEGORY_ID
     transformations_map: dict[tuple[str, str, int], str] = TRANSFORMATIONS_MAP
     aggregations_map: dict[tuple[str, str, int], str] = AGGREGATIONS_MAP
@@ -79,7 +121,47 @@ class EVDSTSConfig:
     yearweek: str = YEARWEEK
     index_file_tr: str = INDEX_FILE_TR
     index_file_en: str = INDEX_FILE_EN
+    index_binary_file_tr: str = INDEX_BINARY_FILE_TR
+    index_binary_file_en: str = INDEX_BINARY_FILE_EN
+    index_version_file_tr: str = INDEX_VERSION_FILE_TR
+    index_version_file_en: str = INDEX_VERSION_FILE_EN
+    index_checkpoint_file_tr: str = INDEX_CHECKPOINT_FILE_TR
+    index_checkpoint_file_en: str = INDEX_CHECKPOINT_FILE_EN
+    index_fingerprint_file_tr: str = INDEX_FINGERPRINT_FILE_TR
+    index_fingerprint_file_en: str = INDEX_FINGERPRINT_FILE_EN
+    index_build_workers: int = INDEX_BUILD_WORKERS
+    search_scorer: str = SEARCH_SCORER
+    search_cache_size: int = SEARCH_CACHE_SIZE
+    search_workers: int = SEARCH_WORKERS
     key_file: str = KEY_FILE
     date_separators: list[str] = DATE_SEPARATORS
     frequency_regexes: dict[str, list[str]] = FREQUENCY_REGEXES
     raw_items: str = RAW_ITEMS
+    main_categories_file: str = MAIN_CATEGORIES_FILE
+    main_categories_ttl: float = MAIN_CATEGORIES_TTL
+    cache_file: str = CACHE_FILE
+    cache_ttl: float = CACHE_TTL
+    cache_historical_ttl: float = CACHE_HISTORICAL_TTL
+    cache_max_size: int = CACHE_MAX_SIZE
+    catalog_file: str = CATALOG_FILE
+    catalog_max_age: float = CATALOG_MAX_AGE
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS
+    pool_connections: int = POOL_CONNECTIONS
+    pool_maxsize: int | None = POOL_MAXSIZE
+    pool_block: bool = POOL_BLOCK
+    rate_limit: float = RATE_LIMIT
+    rate_limit_burst: int = RATE_LIMIT_BURST
+    rate_limit_penalty: float = RATE_LIMIT_PENALTY
+    rate_limit_file: str = RATE_LIMIT_FILE
+    store_directory: str = STORE_DIRECTORY
+    max_series_per_request: int = MAX_SERIES_PER_REQUEST
+    max_observations_per_request: int = MAX_OBSERVATIONS_PER_REQUEST
+    observations_per_year: dict[str, int] = OBSERVATIONS_PER_YEAR
+    request_timeout: tuple[float, float] = REQUEST_TIMEOUT
+    retry_max_attempts: int = RETRY_MAX_ATTEMPTS
+    retry_base_delay: float = RETRY_BASE_DELAY
+    retry_max_delay: float = RETRY_MAX_DELAY
+    retry_deadline: float = RETRY_DEADLINE
+    retry_statuses: tuple[int, ...] = RETRY_STATUSES
+    circuit_failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD
+    circuit_recovery_time: float = CIRCUIT_RECOVERY_TIME
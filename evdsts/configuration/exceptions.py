@@ -77,3 +77,7 @@ class InsufficientSampleSizeException(Exception):
 
 class OptionalPackageRequiredException(Exception):
     """Raisess if a required optional package is not found on environment"""
+
+
+class CircuitOpenException(APIServiceConnectionException):
+    """Raisess when requests are not sent because the EVDS API service keeps failing"""
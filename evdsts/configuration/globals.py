@@ -87,6 +87,19 @@ FREQUENCY_MAP: dict[tuple[str, str, str, int], str] = {
     ("yearly", "Y", "8", 8): "8",
 }
 
+# * Define the pandas frequencies that time series indexes are created with. Observations are
+# * stamped at the end of their periods (weekly series are announced on Fridays).
+PANDAS_FREQUENCIES: dict[str, str] = {
+    "daily": "D",
+    "bdaily": "B",
+    "weekly": "W-FRI",
+    "semimonthly": "SME",
+    "monthly": "ME",
+    "quarterly": "QE",
+    "semiyearly": "6ME",
+    "yearly": "YE",
+}
+
 # * Define a transformation functions map that all keys can be used for getting
 # * corresponding identifier as API parameter.
 TRANSFORMATIONS_MAP: dict[tuple[str, str, int], str] = {
@@ -133,6 +146,119 @@ REFERENCE_FILE: str = str(Path.cwd() / Path("evds_series_references.json"))
 # * Series index file path to search operations.
 INDEX_FILE_TR: str = str(Path(__file__).parent.parent / Path("data") / Path("evds_index_tr.json"))
 INDEX_FILE_EN: str = str(Path(__file__).parent.parent / Path("data") / Path("evds_index_en.json"))
+# * Memory-mapped binary versions of the series indexes written by IndexBuilder.
+INDEX_BINARY_FILE_TR: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_tr.bin")
+)
+INDEX_BINARY_FILE_EN: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_en.bin")
+)
+# * Versions of the series indexes, written after the index files by IndexBuilder. SearchEngine
+# * reloads the index when its version changes.
+INDEX_VERSION_FILE_TR: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_tr.version.json")
+)
+INDEX_VERSION_FILE_EN: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_en.version.json")
+)
+# * Datagroups fetched by an unfinished index build, an interrupted build resumes from them.
+INDEX_CHECKPOINT_FILE_TR: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_tr.checkpoint")
+)
+INDEX_CHECKPOINT_FILE_EN: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_en.checkpoint")
+)
+# * Fingerprints of the datagroups in the series indexes for refreshing only the changed ones.
+INDEX_FINGERPRINT_FILE_TR: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_tr.groups.json")
+)
+INDEX_FINGERPRINT_FILE_EN: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_index_en.groups.json")
+)
+# * Number of worker threads that fetch the datagroups while building the index.
+INDEX_BUILD_WORKERS: int = 2
+
+# * Default scorer of the series search ('bm25': inverted index, 'regex': legacy regex scan).
+SEARCH_SCORER: str = "bm25"
+# * Maximum number of search results kept in the results cache of SearchEngine.
+SEARCH_CACHE_SIZE: int = 512
+# * Number of index shards that the regex scorer scores in parallel (1: serial).
+SEARCH_WORKERS: int = 1
 
 # * Define raw JSONType data related variables.
 RAW_ITEMS: str = "items"
+
+# * Main categories are loaded on their first use and kept on the disk for a week.
+MAIN_CATEGORIES_FILE: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_main_categories.json")
+)
+MAIN_CATEGORIES_TTL: float = 60 * 60 * 24 * 7
+
+# * Response cache file path and its default expiration/size policies.
+# * Historical windows (ending before today) can not change anymore so they are kept much longer
+# * than the windows that reach today.
+CACHE_FILE: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_response_cache.sqlite")
+)
+CACHE_TTL: float = 60 * 60
+CACHE_HISTORICAL_TTL: float = 60 * 60 * 24 * 30
+CACHE_MAX_SIZE: int = 256 * 1024 * 1024
+
+# * Catalog store file (categories, datagroups and series metadata) and the age of its nodes in
+# * seconds after which they are retrieved again.
+CATALOG_FILE: str = str(Path(__file__).parent.parent / Path("data") / Path("evds_catalog.sqlite"))
+CATALOG_MAX_AGE: float = 60 * 60 * 24 * 7
+
+# * Maximum number of requests that a Connector sends to the EVDS API service at the same time.
+MAX_CONCURRENT_REQUESTS: int = 4
+
+# * HTTP connection pools of the Connectors: number of hosts pooled, connections kept per host
+# * (None: max_concurrent_requests, at least 10) and whether a request waits for a pooled
+# * connection instead of opening a throwaway one when all of them are in use.
+POOL_CONNECTIONS: int = 10
+POOL_MAXSIZE: int | None = None
+POOL_BLOCK: bool = True
+
+# * Default token bucket rate limiter settings (requests per second, burst size, the waiting time
+# * after a 429 response) and the state file of the limiter that is shared between processes.
+RATE_LIMIT: float = 2.0
+RATE_LIMIT_BURST: int = 5
+RATE_LIMIT_PENALTY: float = 5.0
+RATE_LIMIT_FILE: str = str(
+    Path(__file__).parent.parent / Path("data") / Path("evds_rate_limit.bin")
+)
+
+# * Local series store folder used by the incremental series requests.
+STORE_DIRECTORY: str = str(Path(__file__).parent.parent / Path("data") / Path("evds_series_store"))
+
+# * Request planning limits. Series requests exceeding them are split into several requests
+# * (by series groups and by calendar year windows) and the responses are stitched back together.
+# * Observations per year are estimated from the requested frequency ("" -> as is, assume daily).
+MAX_SERIES_PER_REQUEST: int = 25
+MAX_OBSERVATIONS_PER_REQUEST: int = 50000
+OBSERVATIONS_PER_YEAR: dict[str, int] = {
+    "": 365,
+    "1": 365,
+    "2": 260,
+    "3": 52,
+    "4": 24,
+    "5": 12,
+    "6": 4,
+    "7": 2,
+    "8": 1,
+}
+
+# * Retry policy of the requests: attempts per request, full-jitter exponential backoff bounds,
+# * the time budget of a request with its retries in seconds and the response statuses retried.
+# * After CIRCUIT_FAILURE_THRESHOLD consecutive failures the requests fail fast for
+# * CIRCUIT_RECOVERY_TIME seconds, then a single trial request decides to close or reopen.
+RETRY_MAX_ATTEMPTS: int = 4
+RETRY_BASE_DELAY: float = 3.0
+RETRY_MAX_DELAY: float = 60.0
+RETRY_DEADLINE: float = 120.0
+RETRY_STATUSES: tuple[int, ...] = (429, 502, 503, 504)
+CIRCUIT_FAILURE_THRESHOLD: int = 5
+CIRCUIT_RECOVERY_TIME: float = 30.0
+
+# * (connect, read) timeouts of the requests in seconds.
+REQUEST_TIMEOUT: tuple[float, float] = (10, 15)
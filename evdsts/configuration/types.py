@@ -25,7 +25,11 @@ FrameLike = dict | Series | DataFrame
 
 
 class EVDSHttpAdapter(HTTPAdapter):
-    """A tailored HTTP adapter to use for security layer connections"""
+    """A tailored HTTP adapter to use for security layer connections.
+
+    Takes the pool settings of HTTPAdapter (`pool_connections`, `pool_maxsize`, `pool_block`) and
+    reports the requests sent and the connections opened by its pools.
+    """
 
     def __init__(self, ssl_context: Any = None, **kwargs: Any):
 
@@ -33,8 +37,26 @@ class EVDSHttpAdapter(HTTPAdapter):
         super().__init__(**kwargs)
 
     # override
-    def init_poolmanager(self, connections: int, maxsize: Any, block: bool | None = False) -> None:
+    def init_poolmanager(
+        self, connections: int, maxsize: Any, block: bool | None = False, **pool_kwargs: Any
+    ) -> None:
+
+        if self.ssl_context is not None:
+            pool_kwargs["ssl_context"] = self.ssl_context
 
         self.poolmanager = PoolManager(
-            num_pools=connections, maxsize=maxsize, block=block, ssl_context=self.ssl_context
+            num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs
         )
+
+    def connection_stats(self) -> dict[str, int]:
+        """Returns the numbers of requests sent and connections opened by the alive pools"""
+
+        stats: dict[str, int] = dict(requests=0, connections=0)
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                stats["requests"] += pool.num_requests
+                stats["connections"] += pool.num_connections
+
+        return stats
@@ -8,15 +8,18 @@ __mail__ = "synertic@gmail.com"
 
 import csv
 import json
+import os
+import re
 import shutil
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date, datetime
 from io import StringIO
 from json import JSONDecodeError, JSONEncoder
 from pathlib import Path
 from typing import Any, TextIO
 
+import numpy as np
 import pandas as pd
 
 from evdsts.configuration.exceptions import (
@@ -119,6 +122,48 @@ def write_json(fname: str, reference_dict: dict[str, str]) -> None:
         )
 
 
+def write_json_atomic(fname: str, items: Iterable[tuple[str, Any]]) -> None:
+    """Writes (key, value) pairs into a JSON object file atomically.
+
+    The pairs are serialized one by one into a temporary file next to the target file. It's
+    flushed to the disk and renamed over the target, so the readers of the file see either the
+    old or the new file but never a partially written one.
+
+    Args:
+        fname (str): file name to be written.
+        items (Iterable[tuple[str, Any]]): pairs to be written (e.g. dict.items()).
+    """
+
+    temp_file: Path = Path(fname).with_name(Path(fname).name + ".tmp")
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write("{")
+            for i, (key, value) in enumerate(items):
+                f.write(", " if i else "")
+                f.write(json.dumps(str(key), ensure_ascii=False))
+                f.write(": ")
+                f.write(json.dumps(value, ensure_ascii=False, default=str))
+            f.write("}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, fname)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    try:
+        # persist the rename itself (directories can't be opened on Windows).
+        directory: int = os.open(Path(fname).parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(directory)
+    except OSError:
+        pass
+    finally:
+        os.close(directory)
+
+
 def load_json(text: str | bytes, field: str | None = None) -> JSONType:
     """Returns JSON data from a given literal.
 
@@ -145,6 +190,125 @@ def load_json(text: str | bytes, field: str | None = None) -> JSONType:
     return json_val
 
 
+# whitespace between JSON tokens.
+_JSON_WHITESPACE: re.Pattern = re.compile(r"\s*")
+
+
+def _stream_items(text: str, field: str) -> Iterator[JSONType]:
+    """Yields the elements of a top-level JSON array field one at a time.
+
+    Args:
+        - text (str): JSON text.
+        - field (str): name of the array field.
+
+    Raises:
+        - ValueError: if the field can not be found or the text is not a valid JSON array.
+
+    Yields:
+        - JSONType: array elements.
+    """
+
+    key: re.Match | None = re.search(r'"' + re.escape(field) + r'"\s*:\s*\[', text)
+    if key is None:
+        raise ValueError(f"{field} array can not be found")
+
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    position: int = _JSON_WHITESPACE.match(text, key.end()).end()
+
+    if text[position : position + 1] == "]":
+        return
+
+    while True:
+        item, position = decoder.raw_decode(text, position)
+        yield item
+        position = _JSON_WHITESPACE.match(text, position).end()
+        separator: str = text[position : position + 1]
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"unexpected character {separator!r} in {field} array")
+        position = _JSON_WHITESPACE.match(text, position + 1).end()
+
+
+def load_series_frame(
+    data: bytes | str,
+    field: str = "items",
+    date_fields: Sequence[str] = ("Tarih", "UNIXTIME", "YEARWEEK"),
+    convert_to_na: Sequence[str] = ("ND",),
+) -> tuple[pd.DataFrame, bool]:
+    """Returns a DataFrame from a series response of the EVDS API service.
+
+    The observations are decoded one at a time and their values are parsed straight into
+    preallocated float32 column buffers (with 'ND' and nulls as NaN), so neither the whole decoded
+    document nor an intermediate block of Python objects is created.
+
+    Args:
+        - data (bytes | str): series response.
+        - field (str, optional): the field that keeps the observations. Defaults to "items".
+        - date_fields (Sequence[str], optional): fields that are kept as they are.
+        - convert_to_na (Sequence[str], optional): strings that represent missing values.
+
+    Returns:
+        - tuple[pd.DataFrame, bool]: (frame, numeric). numeric is False if a field (other than
+        the date fields) can't be parsed into float32 and is left as it is.
+    """
+
+    text: str = data.decode("utf-8") if isinstance(data, bytes) else data
+    # every observation has a single date so the number of rows can be known in advance.
+    capacity: int = max(text.count('"' + date_fields[0] + '"'), 1) if date_fields else 1
+
+    # one buffer per field, float32 for the values and object for the dates (and for the
+    # fields that turn out not to be numeric).
+    columns: dict[str, np.ndarray] = {}
+    numeric: bool = True
+    rows: int = 0
+
+    def new_buffer(dtype: type, size: int, filled: int) -> np.ndarray:
+        buffer: np.ndarray = np.empty(size, dtype=dtype)
+        buffer[:filled] = None if dtype is object else np.nan
+        return buffer
+
+    try:
+        for item in _stream_items(text, field):
+            if rows == capacity:
+                capacity *= 2
+                for name, buffer in columns.items():
+                    columns[name] = np.empty(capacity, dtype=buffer.dtype)
+                    columns[name][:rows] = buffer[:rows]
+
+            for name, value in item.items():
+                buffer: np.ndarray | None = columns.get(name, None)
+                if buffer is None:
+                    dtype: type = object if name in date_fields else np.float32
+                    buffer = columns[name] = new_buffer(dtype, capacity, rows)
+
+                if name in date_fields:
+                    buffer[rows] = value
+                elif value is None or value in convert_to_na:
+                    buffer[rows] = None if buffer.dtype == object else np.nan
+                elif buffer.dtype == object:
+                    buffer[rows] = value
+                else:
+                    try:
+                        buffer[rows] = float(value)
+                    except (ValueError, TypeError):
+                        buffer = columns[name] = buffer.astype(object)
+                        buffer[rows] = value
+                        numeric = False
+
+            if len(item) != len(columns):
+                # fields missing in the observation.
+                for name, buffer in columns.items():
+                    if name not in item:
+                        buffer[rows] = None if buffer.dtype == object else np.nan
+            rows += 1
+    except ValueError:
+        # JSONDecodeError is a ValueError too, load_json reports the invalid responses.
+        return pd.DataFrame(load_json(text, field=field)), False
+
+    return pd.DataFrame({name: buffer[:rows] for name, buffer in columns.items()}), numeric
+
+
 def write_excel(
     df: pd.DataFrame,
     fname: Path,
@@ -9,6 +9,7 @@ __mail__ = "synertic@gmail.com"
 import re
 from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -365,6 +366,108 @@ def find_datelike_columns(df: pd.DataFrame) -> pd.DataFrame:
     return datelike_columns
 
 
+# frequency sniffing regexes are compiled once, identical patterns share a compiled object.
+_FREQUENCY_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    key: [re.compile(pattern) for pattern in patterns]
+    for key, patterns in config.frequency_regexes.items()
+}
+_SEPARATORS: str = "".join(re.escape(separator) for separator in config.date_separators)
+# YYYY-P formats (monthly, quarterly and semiyearly) and dd-mm-YYYY formats.
+_PERIOD_PATTERN: re.Pattern[str] = re.compile(rf"(\d+)[{_SEPARATORS}]\D*(\d+)\D*")
+_DAY_PATTERN: re.Pattern[str] = re.compile(rf"(\d+)[{_SEPARATORS}](\d+)[{_SEPARATORS}](\d+)")
+# number of periods in a year and the period prefix of the frequencies in YYYY-P format.
+_PERIODS_IN_YEAR: dict[str, tuple[int, str]] = dict(
+    monthly=(12, ""), quarterly=(4, "Q"), semiyearly=(2, "")
+)
+
+
+@lru_cache(maxsize=1024)
+def _sniff_frequencies(sample: tuple[str, ...], method: str) -> tuple[str, ...]:
+    """Returns possible frequencies that a sample of date strings could belong to.
+
+    Args:
+        - sample (tuple[str, ...]): date strings.
+        - method (str): 'greedy' (any of the samples matches) or 'lazy' (all of them match).
+
+    Returns:
+        - tuple[str, ...]: possible frequencies in the order of FREQUENCY_REGEXES.
+    """
+
+    values: pd.Series = pd.Series(sample, dtype="object")
+    results: dict[re.Pattern[str], bool] = {}
+    possible_formats: list[str] = []
+
+    for key, patterns in _FREQUENCY_PATTERNS.items():
+        for pattern in patterns:
+            if pattern not in results:
+                matches: pd.Series = values.str.fullmatch(pattern).fillna(False)
+                results[pattern] = bool(matches.any() if method == "greedy" else matches.all())
+            if results[pattern]:
+                # a single match is enough for a frequency, skip its remaining patterns.
+                possible_formats.append(key)
+                break
+
+    return tuple(possible_formats)
+
+
+def _period_range(first: str, last: str, frequency: str) -> tuple[Any, Any] | None:
+    """Returns start and end dates of a date range that covers the first and the last
+    observations of a series.
+
+    Args:
+        - first (str): date string of the first observation.
+        - last (str): date string of the last observation.
+        - frequency (str): sniffed frequency (daily, bdaily, ... yearly).
+
+    Returns:
+        - tuple[Any, Any] | None: (start, end) or None if the dates don't fit the frequency.
+    """
+
+    # For yearly data, just take first and last + 1 to create a suitable date range.
+    if frequency == "yearly":
+        return first, str(int(last) + 1)
+
+    # for monthly, quarterly and semiyearly data, find the first period and create a period
+    # more of the last to include the current period.
+    if frequency in _PERIODS_IN_YEAR:
+        periods, prefix = _PERIODS_IN_YEAR[frequency]
+        matched_first: re.Match[str] | None = _PERIOD_PATTERN.fullmatch(first)
+        matched_last: re.Match[str] | None = _PERIOD_PATTERN.fullmatch(last)
+        if not matched_first or not matched_last:
+            return None
+
+        year, period = int(matched_last[1]), int(matched_last[2])
+        if not 1 <= period <= periods:
+            return None
+
+        start: str = f"{matched_first[1]}-{prefix}{matched_first[2]}"
+        end: str = f"{year + period // periods}-{prefix}{period % periods + 1}"
+        if frequency == "semiyearly":
+            # half-years are stamped at their ends (Jun 30 / Dec 31) like the UNIXTIME based
+            # indexes, so the range starts in the last month of the first half-year.
+            start = f"{matched_first[1]}-{int(matched_first[2]) * 6}"
+            end = f"{year + period // periods}-{period % periods * 6 + 1}"
+
+        return start, end
+
+    # below are all in format dd-mm-YYYY.
+    matched_first = _DAY_PATTERN.fullmatch(first)
+    matched_last = _DAY_PATTERN.fullmatch(last)
+    if not matched_first or not matched_last:
+        return None
+
+    day, month, year = (int(part) for part in matched_first.groups())
+    start_date: Timestamp = Timestamp(year, month, day)
+    day, month, year = (int(part) for part in matched_last.groups())
+    end_date: Timestamp = Timestamp(year, month, day)
+
+    if frequency not in ("daily", "bdaily"):
+        # Add one day to guarantee that it includes the period the last data currently in.
+        end_date += timedelta(days=1)
+
+    return start_date, end_date
+
+
 def crete_ts_index(df: pd.DataFrame, method: str) -> pd.Series:
     """Returns a date range that it's frequency exactly fits in the supplied DataFrame.
 
@@ -373,255 +476,217 @@ def crete_ts_index(df: pd.DataFrame, method: str) -> pd.Series:
         - method (str): The sniffing for the series to detect their possible frequencies.
 
     Returns:
-        - pd.Series: _description_
+        - pd.Series: a DatetimeIndex or an empty series if none of the frequencies fits.
     """
 
-    #! this can be easliy done with UNIXTIME but I'm working on another thing that consists of
-    #! only string indexes. Therefore, I'm going to use this converter instead of using UNIXTIME
-    #! against future compatibilities.
-
-    def sniff_format(column: pd.Series) -> list[str]:
-        """Returns possible frequencies that may belong to given series' as sniffing
-        supplied data to detect it's frequency.
-
-        Args:
-            - column (pd.Series): datelike series objects.
-
-        Returns:
-            - list[str]: A list of possible frequencies that given series could be fit.
-        """
-
-        test_series: pd.Series
-        test: bool = False
-        # get a small sample from time series to sniff date format.
-        sample: pd.Series = column.dropna(how="all").head(10)
-        # try to sniff date format from that sample using all defined regex patterns.
-        # an API returned series can be matched with more than one format like;
-        # daily frequency can be matched with both daily, business daily, weekly, etc.
-        # detect all possible formats for the data in question.
-        possible_formats: list[str] = []
-        for key, patterns in regexes.items():
-            for pattern in patterns:
-                test_series = sample.apply(
-                    lambda datelike, pattern=pattern: bool(re.match(pattern, str(datelike)))
-                )
-                # greedy sniff looks for any value in series is matched to given pattern
-                if method == "greedy":
-                    test = test_series.any()
-                # lazy sniff chacks if all values in series are matched to given pattern
-                else:
-                    test = test_series.all()
-                if test:
-                    possible_formats.append(key)
-
-        return possible_formats
-
-    # load all sniffing regexes that can detect EVDS API returned date identifiers.
-    regexes: dict[str, list[str]] = config.frequency_regexes
-    # create possible formats as sniffing them using a small sample of data.
-    # aggregate all results for individual datelike series that could possibly be time series.
-    possible_date_frequencies: pd.Series = df.agg(sniff_format)
+    # UNIXTIME based indexes are created by create_ts_index_from_unixtime, this converter is
+    # kept for the frames that consist of only string dates.
 
     index: pd.Series = pd.Series(dtype="object")
-    first: str = None  # first record of series
-    last: str = None  # last record of series
-    splitted_first: list[str] = []  # splitted first record of series by date separator
-    splitted_last: list[str] = []  # splitted last record of series by date separator
-    start: str = None  # starting date of date range
-    end: str = None  # ending date of date range
-    # date range frequencies corresponding to determined frequencies.
-    frequency_map: dict[str, str] = dict(
-        daily="D",
-        bdaily="B",
-        weekly="W",
-        semimonthly="SM",
-        monthly="ME",
-        quarterly="Q",
-        semiyearly="6M",
-        yearly="Y",
-    )
 
     # iterate through all sniffed date formats to determine which one is correct.
     # we can't just create a daterange with period equaling to length of the given data
     # because that would mean fitting the to the created frequency. On contrary, we need
     # to fit our date range to data to determine the correct frequency.
-    # name: pd.Series name, frequencies: a list of sniffed formats from the sample data.
-    for name, frequencies in possible_date_frequencies.items():
-        # iterate through all sniffed frequencies to determine which one is actually suitable
-        # for the data that is returned from the EVDS API.
-        for frequency in frequencies:
+    for name in df.columns:
+        column: pd.Series = df[name]
+        # get a small sample from time series to sniff date format. an API returned series can
+        # be matched with more than one format like; daily frequency can be matched with both
+        # daily, business daily, weekly, etc.
+        sample: tuple[str, ...] = tuple(
+            column.dropna().head(10).astype(str).str.strip().tolist()
+        )
+        if not sample:
+            continue
+
+        first: str = str(column.iat[0]).strip()
+        last: str = str(column.iat[-1]).strip()
+
+        for frequency in _sniff_frequencies(sample, method):
             # find a right frequency key to create a date range object.
-            freq: str = frequency_map.get(frequency, None)
+            freq: str | None = config.pandas_frequencies.get(frequency, None)
 
             if not freq:
                 raise UndefinedFrequencyException(
-                    f"Returned '{frequency}' is not a defined frequency in {frequency_map}"
+                    f"Returned '{frequency}' is not a defined frequency in "
+                    f"{config.pandas_frequencies}"
                 )
 
-            # start and end dates of the given data
-            first = str(df[name].iat[0])
-            last = str(df[name].iat[-1])
-
-            # For yearly data, just take first and last + 1 to creta a suitable date range.
-            if freq == "Y":
-                start = str(first)
-                end = str(int(last) + 1)
-
-            # for semiyearly data, find first half and create a half more of the last
-            # to include current half
-            if freq == "6M":
-                # check for all possible date separators in case of the API changes
-                # in the future.
-                for separator in config.date_separators:
-                    splitted_first = first.split(separator)
-                    splitted_last = last.split(separator)
-                    if len(splitted_first) == len(splitted_last) == 2:
-                        break
-                else:
-                    continue
-
-                # extract digits from the half identifier.
-                extract_half_pattern: str = r"\d+"
-                # for start
-                extract_half: list[str] = re.findall(extract_half_pattern, splitted_first[1])
-                if len(extract_half):
-                    start = splitted_first[0] + "-" + str(extract_half[0])
-                else:
-                    continue
-                # for end
-                extract_half = re.findall(extract_half_pattern, splitted_last[1])
-                if str(extract_half[0]) in ("01", "1"):
-                    end = str(int(splitted_last[0])) + "-2"
-                elif str(extract_half[0]) in ("02", "2"):
-                    end = str(int(splitted_last[0]) + 1) + "-1"
-                else:
-                    continue
-            # same idea with semiyearly data
-            if freq == "Q":
-                # check for all possible date separators in case of the API changes
-                # in the future.
-                for separator in config.date_separators:
-                    splitted_first = first.split(separator)
-                    splitted_last = last.split(separator)
-                    if len(splitted_first) == len(splitted_last) == 2:
-                        break
-                else:
-                    continue
-
-                extract_half_pattern: str = r"\d+"
-                # for start
-                extract_half: list[str] = re.findall(extract_half_pattern, splitted_first[1])
-                if len(extract_half):
-                    start = splitted_first[0] + "-Q" + str(extract_half[0])
-                else:
-                    continue
-                # for end
-                extract_half = re.findall(extract_half_pattern, splitted_last[1])
-                if str(extract_half[0]) in ("01", "1", "02", "2", "03", "3"):
-                    end = str(int(splitted_last[0])) + "-Q" + str(int(extract_half[0]) + 1)
-                elif str(extract_half[0]) in ("04", "4"):
-                    end = str(int(splitted_last[0]) + 1) + "-Q1"
-                else:
-                    continue
-            # same idea with semiyearly data
-            if freq == "ME":
-                for separator in config.date_separators:
-                    splitted_first = first.split(separator)
-                    splitted_last = last.split(separator)
-                    if len(splitted_first) == len(splitted_last) == 2:
-                        break
-                else:
-                    continue
-
-                extract_half_pattern: str = r"\d+"
-                # for start
-                extract_half: list[str] = re.findall(extract_half_pattern, splitted_first[1])
-                if len(extract_half):
-                    start = splitted_first[0] + "-" + str(extract_half[0])
-                else:
-                    continue
-                # for end
-                extract_half = re.findall(extract_half_pattern, splitted_last[1])
-                if str(extract_half[0]) in (
-                    "01",
-                    "1",
-                    "02",
-                    "2",
-                    "03",
-                    "3",
-                    "04",
-                    "4",
-                    "05",
-                    "5",
-                    "06",
-                    "6",
-                    "07",
-                    "7",
-                    "08",
-                    "8",
-                    "09",
-                    "9",
-                    "10",
-                    "11",
-                ):
-                    end = str(int(splitted_last[0])) + "-" + str(int(extract_half[0]) + 1)
-                elif str(extract_half[0]) in ("12",):
-                    end = str(int(splitted_last[0]) + 1) + "-1"
-                else:
-                    continue
-            # below are all in format dd-mm-yyy. Therefore start and end is created in line
-            # with the same idea but with a little tunning required by the individual periods.
-            if freq in ("SM", "W", "B", "D"):
-                # check for all possible date separators in case of the API changes
-                # in the future.
-                for separator in config.date_separators:
-                    splitted_first = first.split(separator)
-                    splitted_last = last.split(separator)
-                    if len(splitted_first) == len(splitted_last) == 3:
-                        break
-                else:
-                    continue
-
-                # create Timestamps from the string dates.
-                day: int = int(splitted_first[0])
-                month: int = int(splitted_first[1])
-                year: int = int(splitted_first[2])
-                start = Timestamp(year, month, day)
-                day: int = int(splitted_last[0])
-                month: int = int(splitted_last[1])
-                year: int = int(splitted_last[2])
-
-                if freq not in ("D", "B"):
-                    # Add one day to guarantee that it includes the period the last data
-                    # currently in.
-                    end = Timestamp(year, month, day) + timedelta(days=1)
-                else:
-                    # Don't do that if the frequency is daily.
-                    end = Timestamp(year, month, day)
-
-            # start or end can not be set somehow, so, continue for other snifffed frequencies.
-            if not start or not end:
+            try:
+                bounds: tuple[Any, Any] | None = _period_range(first, last, frequency)
+            except ValueError:
+                continue
+            # start or end can not be set somehow, so, continue for other sniffed frequencies.
+            if bounds is None:
                 continue
-            # Weekly series is announced on every Friday
-            freq = "W-FRI" if freq == "W" else freq
-            # pandas argument changes came with newer versions
-            freq = "QE" if freq == "Q" else freq
-            freq = "SME" if freq == "SM" else freq
-            freq = "6ME" if freq == "6M" else freq
-            freq = "YE" if freq == "Y" else freq
+
             # create a date range comprising the determined range start - end
-            test_index: pd.DatetimeIndex = pd.date_range(start, end, freq=freq)
+            test_index: pd.DatetimeIndex = pd.date_range(*bounds, freq=freq)
             # test if given time series exactly fit into the created range.
-            if len(test_index) == len(df[name]):
+            if len(test_index) == len(column):
                 # success.
                 index = test_index
                 break
 
-        start, end = None, None
-
     return index
 
 
+def _unixtime_to_days(unixtimes: Sequence[Any]) -> np.ndarray | None:
+    """Returns the dates of given EVDS UNIXTIME values.
+
+    Args:
+        - unixtimes (Sequence[Any]): UNIXTIME values as numbers, numeric strings or
+        {"$numberLong": "..."} objects.
+
+    Returns:
+        - np.ndarray | None: datetime64[D] dates or None if the values can't be read.
+    """
+
+    try:
+        seconds: np.ndarray = np.fromiter(
+            (
+                int(value["$numberLong"]) if isinstance(value, dict) else int(float(value))
+                for value in unixtimes
+            ),
+            dtype="int64",
+            count=len(unixtimes),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if len(seconds) and np.abs(seconds).max() > 10**11:
+        # milliseconds
+        seconds = seconds // 1000
+
+    # EVDS stamps the observations at midnight in Turkey (UTC+3), take the day at noon so
+    # that the date is correct whatever the time zone of the stamp is.
+    return ((seconds + 12 * 60 * 60) // (24 * 60 * 60)).astype("datetime64[D]")
+
+
+def _to_period_ends(days: np.ndarray, freq: str) -> np.ndarray:
+    """Returns the ends of the periods that given dates are in.
+
+    Args:
+        - days (np.ndarray): datetime64[D] dates.
+        - freq (str): pandas frequency (D, B, W-FRI, SME, ME, QE, 6ME, YE).
+
+    Returns:
+        - np.ndarray: datetime64[D] period ends.
+    """
+
+    if freq in ("D", "B"):
+        return days
+
+    if freq == "W-FRI":
+        # 1970-01-01 is a Thursday (weekday 3).
+        weekdays: np.ndarray = (days.astype("int64") + 3) % 7
+        return days + ((4 - weekdays) % 7).astype("timedelta64[D]")
+
+    months: np.ndarray = days.astype("datetime64[M]")
+    month_ends: np.ndarray = (months + 1).astype("datetime64[D]") - 1
+
+    if freq == "SME":
+        # an observation belongs to the second half of its month if it's stamped after the 15th
+        # or follows another observation of the same month.
+        middles: np.ndarray = months.astype("datetime64[D]") + 14
+        follows: np.ndarray = np.concatenate(([False], months[1:] == months[:-1]))
+        return np.where((days > middles) | follows, month_ends, middles)
+
+    span: int = dict(ME=1, QE=3, YE=12).get(freq, 6 if freq == "6ME" else 0)
+    if not span:
+        raise UndefinedFrequencyException(f"'{freq}' is not a defined frequency")
+
+    month_numbers: np.ndarray = months.astype("int64")
+    last_months: np.ndarray = month_numbers // span * span + span - 1
+
+    return (last_months.astype("datetime64[M]") + 1).astype("datetime64[D]") - 1
+
+
+def _sniff_frequency_candidates(sample: str | None) -> list[str]:
+    """Returns the pandas frequencies that a date string of EVDS could belong to.
+
+    Args:
+        - sample (str | None): a date string like "01-01-2020", "2020-1", "2020-Q1", "2020".
+
+    Returns:
+        - list[str]: possible pandas frequencies in the order of trial.
+    """
+
+    day_frequencies: list[str] = ["D", "B", "W-FRI", "SME"]
+    frequencies: list[str] = day_frequencies + ["ME", "QE", "6ME", "YE"]
+
+    if sample is None:
+        return frequencies
+
+    separators: str = "".join(re.escape(separator) for separator in config.date_separators)
+    separator: str = f"[{separators}]"
+    sample = str(sample).strip()
+
+    if re.fullmatch(rf"\d{{1,2}}{separator}\d{{1,2}}{separator}\d{{4}}", sample):
+        return day_frequencies
+    if re.fullmatch(rf"\d{{4}}{separator}(?:Q|q|Ç|ç)0*[1-4]", sample):
+        return ["QE"]
+    if re.fullmatch(rf"\d{{4}}{separator}(?:S|s|H|h)0*[1-2]", sample):
+        return ["6ME"]
+    if re.fullmatch(rf"\d{{4}}{separator}\d{{1,2}}", sample):
+        return ["ME"]
+    if re.fullmatch(r"\d{4}", sample):
+        return ["YE"]
+
+    return frequencies
+
+
+def create_ts_index_from_unixtime(
+    unixtimes: Sequence[Any],
+    dates: Sequence[Any] | None = None,
+    frequency: str | None = None,
+) -> pd.DatetimeIndex | None:
+    """Returns a time series index built from the UNIXTIME field of the EVDS observations.
+
+    The observations are stamped at the end of their periods like the indexes created by
+    crete_ts_index. The frequency is taken from the request if it's given, otherwise it's
+    sniffed from the date strings and the index itself.
+
+    Args:
+        - unixtimes (Sequence[Any]): UNIXTIME values of the observations in ascending order.
+        - dates (Sequence[Any] | None, optional): date strings (Tarih) of the observations.
+        Defaults to None.
+        - frequency (str | None, optional): requested frequency as an EVDS frequency code
+        ("1" - "8"), name ("daily", "monthly", ...) or symbol ("D", "M", ...). Defaults to None
+        (sniffed).
+
+    Returns:
+        - pd.DatetimeIndex | None: a regular time series index or None if the observations
+        don't fit into one (the caller should fall back to crete_ts_index).
+    """
+
+    if not len(unixtimes):
+        return None
+
+    days: np.ndarray | None = _unixtime_to_days(unixtimes)
+    if days is None:
+        return None
+
+    names: dict[str, str] = {str(alias): keys[0] for keys in config.frequency_map for alias in keys}
+    name: str | None = names.get(str(frequency), None) if frequency else None
+    requested: str | None = config.pandas_frequencies.get(name, None) if name else None
+
+    if requested:
+        candidates: list[str] = [requested]
+    else:
+        candidates = _sniff_frequency_candidates(dates[0] if dates is not None else None)
+
+    for freq in candidates:
+        stamps: np.ndarray = _to_period_ends(days, freq)
+        index: pd.DatetimeIndex = pd.date_range(
+            Timestamp(str(stamps[0])), periods=len(stamps), freq=freq, name="Date"
+        )
+        if np.array_equal(index.values.astype("datetime64[D]"), stamps):
+            return index
+
+    return None
+
+
 def convert_to_time_series(df: pd.DataFrame, method: str = "greedy") -> pd.DataFrame:
     """Tries to convert given DataFrame to time series and returns it.
 
@@ -0,0 +1,87 @@
+from pathlib import Path
+import asyncio
+import json
+import sys
+import warnings
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path.cwd()))
+
+httpx = pytest.importorskip("httpx")
+
+from evdsts.base.async_connecting import AsyncConnector
+from evdsts.configuration.cfg import EVDSTSConfig
+
+CATEGORIES: list[dict[str, Any]] = [
+    {"CATEGORY_ID": 1, "TOPIC_TITLE_TR": "PIYASA", "TOPIC_TITLE_ENG": "MARKET"},
+]
+
+
+def respond(request: "httpx.Request") -> "httpx.Response":
+    """Answers like the EVDS API service, every series has a single observation of 1.0"""
+
+    url: str = str(request.url)
+    if "categories" in url:
+        return httpx.Response(200, content=json.dumps(CATEGORIES).encode())
+
+    query: dict[str, str] = dict(
+        item.split("=", 1) for item in url.rsplit("/", 1)[-1].split("&") if "=" in item
+    )
+    item: dict[str, Any] = {"Tarih": "01-01-2020", "UNIXTIME": {"$numberLong": "1577826000"}}
+    item.update({name.replace(".", "_"): "1.0" for name in query["series"].split("-")})
+    return httpx.Response(200, content=json.dumps({"totalCount": 1, "items": [item]}).encode())
+
+
+@pytest.fixture
+def connector(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncConnector:
+
+    monkeypatch.setattr(EVDSTSConfig, "main_categories_file", str(tmp_path / "categories.json"))
+    monkeypatch.setattr(EVDSTSConfig, "reference_file", str(tmp_path / "references.json"))
+
+    connector: AsyncConnector = AsyncConnector("key")
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+
+    return connector
+
+
+def test_new_names_are_kept_as_references(connector: AsyncConnector) -> None:
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        asyncio.run(connector.get_series("TP.A", new_names=["usd"], keep_references=True))
+
+    assert connector.name_cache == {"usd": "TP.A"}
+    assert Path(EVDSTSConfig.reference_file).is_file()
+
+
+def test_main_categories_file_is_not_read_or_written_on_the_event_loop(
+    connector: AsyncConnector, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    on_loop: list[bool] = []
+    load, save = connector._load_main_categories_response, connector._save_main_categories_response
+
+    def in_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def recorded_load() -> bytes | None:
+        on_loop.append(in_loop())
+        return load()
+
+    def recorded_save(response: bytes) -> None:
+        on_loop.append(in_loop())
+        save(response)
+
+    monkeypatch.setattr(connector, "_load_main_categories_response", recorded_load)
+    monkeypatch.setattr(connector, "_save_main_categories_response", recorded_save)
+    categories = asyncio.run(connector.get_main_categories())
+
+    assert len(categories) == 1
+    assert on_loop == [False, False]
+    assert Path(EVDSTSConfig.main_categories_file).is_file()
@@ -0,0 +1,59 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path.cwd()))
+
+from evdsts.base.caching import DiskResponseCache, MemoryResponseCache, ResponseCache
+
+URL: str = "https://evds3.tcmb.gov.tr/igmevdsms-dis/"
+EXTENSIONS: dict[str, str] = dict(series="TP.DK.USD.A", startDate="01-01-2020", type="json")
+
+
+def test_response_cache_is_abstract() -> None:
+
+    with pytest.raises(TypeError):
+        ResponseCache()
+
+
+@pytest.mark.parametrize("kind", ["memory", "disk"])
+def test_cached_responses_are_returned_and_counted(tmp_path: Path, kind: str) -> None:
+
+    if kind == "memory":
+        cache: ResponseCache = MemoryResponseCache()
+    else:
+        cache = DiskResponseCache(tmp_path / "cache.sqlite")
+
+    assert cache.get(URL, EXTENSIONS) is None
+    cache.set(URL, EXTENSIONS, b"[]")
+
+    assert cache.get(URL, EXTENSIONS) == b"[]"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_api_key_is_not_a_part_of_the_cache_key() -> None:
+
+    assert ResponseCache.make_key(URL, {**EXTENSIONS, "key": "a"}) == ResponseCache.make_key(
+        URL, {**EXTENSIONS, "key": "b"}
+    )
+
+
+def test_expired_responses_are_not_returned() -> None:
+
+    cache = MemoryResponseCache(ttl=-1)
+    cache.set(URL, EXTENSIONS, b"[]")
+
+    assert cache.get(URL, EXTENSIONS) is None
+
+
+def test_least_recently_used_responses_are_evicted() -> None:
+
+    cache = MemoryResponseCache(max_size=8)
+    cache.set(URL, dict(series="A"), b"1234")
+    cache.set(URL, dict(series="B"), b"1234")
+    cache.get(URL, dict(series="A"))
+    cache.set(URL, dict(series="C"), b"1234")
+
+    assert cache.get(URL, dict(series="A")) == b"1234"
+    assert cache.get(URL, dict(series="B")) is None
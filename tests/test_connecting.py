@@ -1,18 +1,231 @@
-import sys
 from pathlib import Path
+import json
+import sys
+import threading
+from collections.abc import Callable
+from time import sleep
+from typing import Any
+
+import pandas as pd
+import pytest
 
 sys.path.insert(0, str(Path.cwd()))
 
 from evdsts.base.connecting import Connector
+from evdsts.base.storing import SeriesStore
+from evdsts.configuration.cfg import EVDSTSConfig
+from evdsts.configuration.exceptions import SeriesNotFoundException, WrongAPIKeyException
+
+CATEGORIES: list[dict[str, Any]] = [
+    {"CATEGORY_ID": 1, "TOPIC_TITLE_TR": "PIYASA", "TOPIC_TITLE_ENG": "MARKET"},
+]
+
+
+class FakeResponse:
+    """A response of the fake EVDS API service"""
+
+    def __init__(self, status_code: int, content: bytes, headers: dict[str, str] | None = None):
+        self.status_code: int = status_code
+        self.content: bytes = content
+        self.headers: dict[str, str] = headers if headers else {}
+
+
+class FakeSession:
+    """A requests session that answers like the EVDS API service without any connection.
+
+    Series are given as {series name: value} and every known series has a single observation.
+    Unknown series and groups are answered with 500 as EVDS does, and so is every request if
+    the API key is wrong.
+    """
+
+    def __init__(self, series: dict[str, float], key_ok: bool = True) -> None:
+        self.series: dict[str, float] = series
+        self.key_ok: bool = key_ok
+        self.urls: list[str] = []
+        self.headers: dict[str, str] = {}
+        self.proxies: dict[str, str] = {}
+        self.verify: bool = True
+        self.delay: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def mount(self, *args: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        with self._lock:
+            self.urls.append(url)
+        sleep(self.delay)
+
+        if not self.key_ok:
+            return FakeResponse(500, b"")
+        if "categories" in url:
+            return FakeResponse(200, json.dumps(CATEGORIES).encode())
+
+        query: dict[str, str] = dict(
+            item.split("=", 1) for item in url.rsplit("/", 1)[-1].split("&") if "=" in item
+        )
+        names: list[str] = query.get("series", "").split("-")
+        if "serieList" in url or not all(name in self.series for name in names):
+            return FakeResponse(500, b"")
+
+        item: dict[str, Any] = {"Tarih": "01-01-2020", "UNIXTIME": {"$numberLong": "1577826000"}}
+        item.update({name.replace(".", "_"): str(self.series[name]) for name in names})
+        return FakeResponse(200, json.dumps({"totalCount": 1, "items": [item]}).encode())
+
+
+@pytest.fixture
+def make_connector(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., tuple[Connector, FakeSession]]:
+
+    monkeypatch.setattr(EVDSTSConfig, "main_categories_file", str(tmp_path / "categories.json"))
+    monkeypatch.setattr(EVDSTSConfig, "reference_file", str(tmp_path / "references.json"))
+
+    def make(series: dict[str, float], key_ok: bool = True, **kwargs: Any):
+        session: FakeSession = FakeSession(series, key_ok=key_ok)
+        monkeypatch.setattr(Connector, "_create_session", lambda self, secure=True: session)
+        return Connector("key", **kwargs), session
+
+    return make
+
+
+def test_batch_keeps_the_last_labelled_result_in_data(make_connector: Callable) -> None:
+
+    connector, _ = make_connector({"TP.A": 1.0, "TP.B": 2.0, "TP.C": 3.0})
+    results: dict[str, pd.DataFrame] = connector.get_series_batch(
+        {"a": "TP.A", "b": "TP.B", "c": "TP.C"}
+    )
+
+    assert list(results) == ["a", "b", "c"]
+    assert connector.data.equals(results["c"])
+
+
+def test_joined_batch_is_kept_in_data(make_connector: Callable) -> None:
+
+    connector, _ = make_connector({"TP.A": 1.0, "TP.B": 2.0})
+    joined: pd.DataFrame = connector.get_series_batch(["TP.A", "TP.B"], join=True)
+
+    assert connector.data is joined
+    assert list(joined.columns) == ["TP.A", "TP.B"]
+
+
+def test_batch_settles_the_first_request_before_fanning_out(make_connector: Callable) -> None:
+
+    connector, session = make_connector({"TP.A": 1.0, "TP.B": 2.0})
+    sent: list[str] = []
+    get: Callable = session.get
+
+    def observe(url: str, **kwargs: Any) -> FakeResponse:
+        # no other request is sent while the first one is not answered yet.
+        sent.append(url)
+        assert connector.first_request is False or len(sent) == 1
+        return get(url, **kwargs)
+
+    session.get = observe
+    connector.get_series_batch(["TP.A", "TP.B"])
+
+    assert len(sent) == 2
+    assert connector.first_request is False
+
+
+def test_missing_series_in_the_first_request_is_not_a_wrong_key(make_connector: Callable) -> None:
+
+    connector, session = make_connector({"TP.A": 1.0})
+
+    with pytest.raises(SeriesNotFoundException):
+        connector.get_series("TP.TYPO")
+
+    assert sum("categories" in url for url in session.urls) == 1
+    assert connector.first_request is False
+    assert connector.get_series("TP.A").iat[0, 0] == 1.0
+
+
+def test_concurrent_first_requests_confirm_the_key_once(make_connector: Callable) -> None:
+
+    connector, session = make_connector({"TP.A": 1.0})
+    session.delay = 0.05
+    results: dict[str, pd.DataFrame] = connector.get_series_batch(
+        ["TP.X1", "TP.X2", "TP.X3", "TP.X4", "TP.A"], raise_errors=False
+    )
+
+    assert list(results) == ["TP.A"]
+    assert sum("categories" in url for url in session.urls) == 1
+
+    connector, session = make_connector({"TP.A": 1.0})
+    session.delay = 0.05
+    with pytest.raises(SeriesNotFoundException):
+        # aggregated series and their originals are requested at the same time.
+        connector.get_series("TP.X5", aggregations="avg", frequency="yearly")
+
+    assert sum("categories" in url for url in session.urls) == 1
+
+
+def test_wrong_key_is_detected_in_the_first_request(make_connector: Callable) -> None:
+
+    connector, _ = make_connector({"TP.A": 1.0}, key_ok=False)
+
+    with pytest.raises(WrongAPIKeyException):
+        connector.get_series("TP.A")
+    with pytest.raises(WrongAPIKeyException):
+        connector.get_main_categories()
+
+    assert connector.first_request is True
+
+
+@pytest.mark.parametrize("formulas", ["0-0-0", "", "0-1-0"])
+def test_transformed_requests_are_not_split_into_date_windows(
+    make_connector: Callable, formulas: str
+) -> None:
+
+    connector, _ = make_connector({}, max_series_per_request=2, max_observations_per_request=24)
+    params: dict[str, str] = dict(
+        series="TP.A-TP.B-TP.C",
+        startDate="01-01-2000",
+        endDate="31-12-2009",
+        type="json",
+        formulas=formulas,
+        aggregationTypes="",
+        frequency="5",
+    )
+    chunks: list[dict[str, str]] = connector._plan_series_chunks(params)
+    windows: set[tuple[str, str]] = {(chunk["startDate"], chunk["endDate"]) for chunk in chunks}
+
+    assert {chunk["series"] for chunk in chunks} == {"TP.A-TP.B", "TP.C"}
+    if formulas == "0-1-0":
+        assert windows == {("01-01-2000", "31-12-2009")}
+        assert {chunk["formulas"] for chunk in chunks} == {"0-1", "0"}
+    else:
+        assert len(windows) == 10
+
+
+def test_transformed_incremental_requests_bypass_the_store(
+    make_connector: Callable, tmp_path: Path
+) -> None:
+
+    connector, session = make_connector({"TP.A": 1.0}, store=SeriesStore(tmp_path / "store"))
+    for _ in range(2):
+        connector.get_series(
+            "TP.A", start_date="01-01-2020", transformations="percent", incremental=True
+        )
+
+    assert len(connector.store) == 0
+    assert sum("TP.A" in url for url in session.urls) == 2
+
+    connector.get_series("TP.A", start_date="01-01-2020", incremental=True)
+    assert len(connector.store) == 1
 
-#! to be impelemented as old tests become too complicated
 
-connector = Connector()
+# live smoke run against the EVDS API service (needs a saved API key).
+if __name__ == "__main__":
+    connector = Connector()
 
-print(connector.get_main_categories(serialize=True))
-# print(connector.get_sub_categories(25, serialize=True))
-# print(connector.get_groups("bie_altingr", serialize=True))
-# print(connector.where("döviz kuru"))
-# print(
-#     connector.get_series("TP.DK.USD.A.YTL", start_date="01.01.2025", serialize=True, frequency="W")
-# )
+    print(connector.get_main_categories(serialize=True))
+    # print(connector.get_sub_categories(25, serialize=True))
+    # print(connector.get_groups("bie_altingr", serialize=True))
+    # print(connector.where("döviz kuru"))
+    # print(
+    #     connector.get_series("TP.DK.USD.A.YTL", start_date="01.01.2025", serialize=True, frequency="W")
+    # )
@@ -0,0 +1,47 @@
+from pathlib import Path
+import json
+import sys
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path.cwd()))
+
+from evdsts.utils.general import load_series_frame
+
+
+def response(items: list[dict[str, Any]]) -> bytes:
+    """A series response of the EVDS API service"""
+
+    return json.dumps({"totalCount": len(items), "items": items}).encode()
+
+
+def test_values_are_parsed_into_float32_columns() -> None:
+
+    items: list[dict[str, Any]] = [
+        {"Tarih": "2020-1", "TP_A": "1.5", "UNIXTIME": {"$numberLong": "1577826000"}},
+        {"Tarih": "2020-2", "TP_A": "ND", "TP_B": "2", "UNIXTIME": {"$numberLong": "1580504400"}},
+        {"Tarih": "2020-3", "TP_A": None, "TP_B": "3", "UNIXTIME": {"$numberLong": "1583010000"}},
+    ]
+    df, numeric = load_series_frame(response(items))
+
+    assert numeric
+    assert list(df.columns) == ["Tarih", "TP_A", "UNIXTIME", "TP_B"]
+    assert df["TP_A"].dtype == df["TP_B"].dtype == np.float32
+    assert df["TP_A"].isna().tolist() == [False, True, True]
+    assert df["TP_B"].tolist()[1:] == [2.0, 3.0] and np.isnan(df["TP_B"].iat[0])
+    assert df["UNIXTIME"].iat[2] == {"$numberLong": "1583010000"}
+
+
+def test_buffers_grow_and_non_numeric_fields_are_kept() -> None:
+
+    items: list[dict[str, Any]] = [
+        {"TP_A": str(n), "TP_B": "x" if n == 7 else n} for n in range(10)
+    ]
+    df, numeric = load_series_frame(response(items), date_fields=())
+
+    assert not numeric
+    assert df["TP_A"].tolist() == list(range(10))
+    assert df["TP_B"].dtype == object and df["TP_B"].iat[7] == "x"
+    assert pd.to_numeric(df["TP_B"], errors="coerce").sum() == 38
@@ -1,8 +1,115 @@
 from pathlib import Path
+import json
 import sys
 
+import pandas as pd
+import pytest
+
 sys.path.insert(0, str(Path.cwd()))
 
 from evdsts.base.indexing import IndexBuilder
+from evdsts.base.limiting import RateLimiter
+from evdsts.base.searching import InvertedIndex
+
+
+class FakeCatalog:
+    """Answers the metadata requests of an index build like a connector.
+
+    Every datagroup has a single series whose name is the version of the datagroup, a new
+    version changes the end date of the datagroup in the sub-categories listing as EVDS does.
+    """
+
+    def __init__(self, versions: dict[str, int]) -> None:
+        self.versions: dict[str, int] = versions
+        self.failing: set[str] = set()
+        self.fetched: list[str] = []
+        self.rate_limiter: RateLimiter = RateLimiter(rate=1000, burst=100)
+        self._all_categories: pd.DataFrame = pd.DataFrame()
+
+    def get_main_categories(self, as_dict: bool = False) -> dict[int, str]:
+        return {1: "PIYASA"}
+
+    def get_sub_categories(self, id_: int, as_dict: bool = False) -> dict[str, list[str]]:
+        return {
+            group: [group, group, "AYLIK", "01-01-2000", f"01-{version:02d}-2020"]
+            for group, version in self.versions.items()
+        }
+
+    def get_groups(self, group: str, as_dict: bool = False) -> dict[str, list[str]]:
+        self.fetched.append(group)
+        if group in self.failing:
+            raise ConnectionError(group)
+        version: int = self.versions[group]
+        return {f"TP.{group}": [f"v{version}", "AYLIK", "01-01-2000", f"01-{version:02d}-2020"]}
+
+
+@pytest.fixture
+def builder(tmp_path: Path) -> IndexBuilder:
+
+    builder: IndexBuilder = IndexBuilder("key", rate_limiter=RateLimiter(rate=1000, burst=100))
+    for name in ("index", "binary_index", "version", "checkpoint", "fingerprint"):
+        setattr(builder, f"{name}_file", str(tmp_path / f"{name}.bin"))
+    builder.connector = FakeCatalog({"A": 1, "B": 1})
+
+    return builder
+
+
+def names(builder: IndexBuilder) -> dict[str, str]:
+    """Returns {series: name} of the written index"""
+
+    with open(builder.index_file, "r", encoding="utf-8") as f:
+        return {code: info[0] for code, info in json.load(f).items()}
+
+
+def test_checkpoint_is_dropped_after_a_partly_failed_build(builder: IndexBuilder) -> None:
+
+    builder.connector.failing.add("B")
+    builder.build_index(confirm=False)
+
+    assert names(builder) == {"TP.A": "v1"}
+    assert not Path(builder.checkpoint_file).exists()
+
+    # the failed datagroup is fetched by the refresh and the changed one is not taken from
+    # the checkpoint of the build.
+    builder.connector.failing.clear()
+    builder.connector.versions["A"] = 2
+    builder.connector.fetched.clear()
+    builder.refresh_index()
+
+    assert names(builder) == {"TP.A": "v2", "TP.B": "v1"}
+    assert sorted(builder.connector.fetched) == ["A", "B"]
+    assert not Path(builder.checkpoint_file).exists()
+
+
+def test_refresh_checks_fingerprints_before_the_checkpoint(builder: IndexBuilder) -> None:
+
+    builder.build_index(confirm=False)
+    catalog: FakeCatalog = builder.connector
+
+    # an unfinished run fetched A before it was changed and B after it was changed.
+    builder._fetch_group(1, "A", ["AYLIK", "01-01-2000", "01-01-2020"])
+    catalog.versions.update(A=2, B=2)
+    builder._fetch_group(1, "B", ["AYLIK", "01-01-2000", "01-02-2020"])
+    catalog.fetched.clear()
+    builder.refresh_index()
+
+    assert names(builder) == {"TP.A": "v2", "TP.B": "v2"}
+    assert catalog.fetched == ["A"]
+
+
+def test_fingerprints_are_not_written_if_the_index_is_not(
+    builder: IndexBuilder, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    builder.build_index(confirm=False)
+    fingerprints: bytes = Path(builder.fingerprint_file).read_bytes()
+
+    def fail(*args) -> None:
+        raise OSError("disk full")
+
+    builder.connector.versions["A"] = 2
+    monkeypatch.setattr(InvertedIndex, "save", fail)
+    with pytest.raises(OSError):
+        builder.refresh_index()
 
-#! to be impelemented as old tests become too complicated
\ No newline at end of file
+    assert Path(builder.fingerprint_file).read_bytes() == fingerprints
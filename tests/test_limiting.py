@@ -0,0 +1,74 @@
+from pathlib import Path
+import asyncio
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, str(Path.cwd()))
+
+from evdsts.base.limiting import FileRateLimiter, RateLimiter
+
+
+def test_bucket_is_refilled_at_the_given_rate() -> None:
+
+    limiter: RateLimiter = RateLimiter(rate=10, burst=2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+@pytest.mark.parametrize("kind", ["memory", "file"])
+def test_penalty_holds_the_following_requests_back(kind: str, tmp_path: Path) -> None:
+
+    limiter: RateLimiter = (
+        RateLimiter(rate=10, burst=5)
+        if kind == "memory"
+        else FileRateLimiter(tmp_path / "limit.bin", rate=10, burst=5)
+    )
+    asyncio.run(limiter.apenalize(2))
+
+    assert limiter.reserve() == pytest.approx(2.1, abs=0.01)
+
+
+def test_zero_penalty_empties_the_bucket() -> None:
+
+    limiter: RateLimiter = RateLimiter(rate=10, burst=5)
+    limiter.penalize(0)
+
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_file_limiter_does_not_block_the_event_loop(tmp_path: Path) -> None:
+
+    limiter: FileRateLimiter = FileRateLimiter(tmp_path / "limit.bin", rate=1000, burst=5)
+    threads: set[int] = set()
+    reserve, penalize = limiter.reserve, limiter.penalize
+
+    def record(method):
+        def recorded(*args):
+            threads.add(threading.get_ident())
+            return method(*args)
+
+        return recorded
+
+    limiter.reserve, limiter.penalize = record(reserve), record(penalize)
+
+    async def run() -> int:
+        await limiter.aacquire()
+        await limiter.apenalize(0.001)
+        return threading.get_ident()
+
+    loop_thread: int = asyncio.run(run())
+
+    assert threads and loop_thread not in threads
+
+
+def test_file_limiter_is_shared_through_its_file(tmp_path: Path) -> None:
+
+    first: FileRateLimiter = FileRateLimiter(tmp_path / "limit.bin", rate=10, burst=1)
+    second: FileRateLimiter = FileRateLimiter(tmp_path / "limit.bin", rate=10, burst=1)
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(0.1, abs=0.01)
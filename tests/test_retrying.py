@@ -0,0 +1,133 @@
+from pathlib import Path
+import sys
+from time import monotonic
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path.cwd()))
+
+from evdsts.base.connecting import Connector
+from evdsts.base.limiting import RateLimiter
+from evdsts.base.retrying import RetryPolicy
+from evdsts.configuration.cfg import EVDSTSConfig
+from evdsts.configuration.exceptions import (
+    APIServiceConnectionException,
+    CircuitOpenException,
+    SeriesNotFoundException,
+)
+
+
+class FakeResponse:
+    """A response of the fake EVDS API service"""
+
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        self.status_code: int = status_code
+        self.content: bytes = b"[]"
+        self.headers: dict[str, str] = headers if headers else {}
+
+
+class FakeSession:
+    """Answers the main categories with 200 and every series request with the given status"""
+
+    def __init__(self, status_code: int, response_headers: dict[str, str] | None = None) -> None:
+        self.status_code: int = status_code
+        self.response_headers: dict[str, str] | None = response_headers
+        self.sent: int = 0
+        self.headers: dict[str, str] = {}
+        self.proxies: dict[str, str] = {}
+        self.verify: bool = True
+
+    def mount(self, *args: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        if "categories" in url:
+            return FakeResponse(200)
+        self.sent += 1
+        return FakeResponse(self.status_code, self.response_headers)
+
+
+@pytest.fixture
+def make_connector(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+
+    monkeypatch.setattr(EVDSTSConfig, "main_categories_file", str(tmp_path / "categories.json"))
+    monkeypatch.setattr(EVDSTSConfig, "reference_file", str(tmp_path / "references.json"))
+
+    def make(status_code: int, response_headers: dict[str, str] | None = None, **kwargs: Any):
+        session: FakeSession = FakeSession(status_code, response_headers)
+        monkeypatch.setattr(Connector, "_create_session", lambda self, secure=True: session)
+        kwargs.setdefault(
+            "retry_policy", RetryPolicy(max_attempts=1, failure_threshold=3, base_delay=0)
+        )
+        return Connector("key", **kwargs)
+
+    return make
+
+
+def test_missing_series_do_not_open_the_circuit(make_connector) -> None:
+
+    connector: Connector = make_connector(500)
+    for _ in range(10):
+        with pytest.raises(SeriesNotFoundException):
+            connector.get_series("TP.TYPO")
+
+    assert connector.retry_policy.state == "closed"
+
+
+def test_unavailable_service_opens_the_circuit(make_connector) -> None:
+
+    connector: Connector = make_connector(503)
+    for _ in range(3):
+        with pytest.raises(APIServiceConnectionException) as raised:
+            connector.get_series("TP.A")
+        assert not isinstance(raised.value, CircuitOpenException)
+
+    assert connector.retry_policy.state == "open"
+    with pytest.raises(CircuitOpenException):
+        connector.get_series("TP.A")
+
+
+def test_retry_after_header() -> None:
+
+    assert RetryPolicy.retry_after({"Retry-After": "7"}) == 7
+    assert RetryPolicy.retry_after({"Retry-After": "soon"}) is None
+    assert RetryPolicy.retry_after({}) is None
+
+
+def test_throttled_request_is_not_retried_past_the_deadline(make_connector) -> None:
+
+    # the penalty of the limiter is checked against the deadline like any other delay.
+    connector: Connector = make_connector(
+        429,
+        {"Retry-After": "60"},
+        retry_policy=RetryPolicy(max_attempts=3, deadline=5, base_delay=0),
+        rate_limiter=RateLimiter(rate=10, burst=5),
+    )
+    started: float = monotonic()
+    with pytest.raises(APIServiceConnectionException):
+        connector.get_series("TP.A")
+
+    assert monotonic() - started < 1
+    assert connector.session.sent == 1
+    assert connector.rate_limiter.reserve() == pytest.approx(60.1, abs=0.1)
+
+
+def test_throttled_request_honours_a_zero_retry_after(make_connector) -> None:
+
+    connector: Connector = make_connector(
+        429,
+        {"Retry-After": "0"},
+        retry_policy=RetryPolicy(max_attempts=3, deadline=5, base_delay=10),
+        rate_limiter=RateLimiter(rate=100, burst=5),
+    )
+    started: float = monotonic()
+    with pytest.raises(APIServiceConnectionException):
+        connector.get_series("TP.A")
+
+    # the attempts are paced by the emptied bucket, not by the backoff or the default penalty.
+    assert monotonic() - started < 1
+    assert connector.session.sent == 3
@@ -1,8 +1,173 @@
 from pathlib import Path
+import json
 import sys
 
+import pytest
+
 sys.path.insert(0, str(Path.cwd()))
 
-from evdsts.base.searching import SearchEngine
+from evdsts.base.searching import InvertedIndex, SearchEngine
+
+ENTRIES: dict[str, list] = {
+    "TP.FG.J0": [
+        "Tüketici Fiyat Endeksi (Genel)",
+        "AYLIK",
+        "01-01-2003",
+        "01-05-2025",
+        14,
+        "bie_tukfiy",
+    ],
+    "TP.FG.J01": [
+        "Tüketici Fiyat Endeksi Gıda",
+        "AYLIK",
+        "01-01-2003",
+        "01-05-2025",
+        14,
+        "bie_tukfiy",
+    ],
+    "TP.UFE.G": ["Üretici Fiyat Endeksi", "AYLIK", "01-01-2003", "01-05-2025", 14, "bie_ufe"],
+    "TP.DK.USD.A": [
+        "ABD Doları Döviz Alış Kuru",
+        "İŞ GÜNÜ",
+        "02-01-1950",
+        "30-05-2025",
+        2,
+        "bie_dkdovytl",
+    ],
+    "TP.DK.EUR.A": [
+        "Euro Döviz Alış Kuru",
+        "İŞ GÜNÜ",
+        "04-01-1999",
+        "30-05-2025",
+        2,
+        "bie_dkdovytl",
+    ],
+    "TP.DK.USD.S.ESKI": [
+        "ABD Doları Döviz Satış Kuru (Arşiv)",
+        "GÜNLÜK",
+        "02-01-1950",
+        "31-12-2001",
+        2,
+        "bie_dkdovarsiv",
+    ],
+    "TP.MEV.FAIZ": ["Mevduat Faiz Oranı", "HAFTALIK", "01-01-2002", "31-12-2012", 5, "bie_mevfaiz"],
+    "TP.KRD.FAIZ": ["Kredi Faiz Oranı", "HAFTALIK", "01-01-2002", "23-05-2025", 5, "bie_krdfaiz"],
+}
+
+
+def write_index(directory: Path, entries: dict[str, list], version: int) -> None:
+    """Writes the JSON, binary and version files of an index like IndexBuilder does"""
+
+    (directory / "index.json").write_text(json.dumps(entries, ensure_ascii=False), "utf-8")
+    InvertedIndex.from_entries(entries).save(directory / "index.bin", entries)
+    (directory / "index.version.json").write_text(json.dumps({"version": version}), "utf-8")
+
+
+def make_engine(directory: Path, scorer: str = "bm25") -> SearchEngine:
+    """Returns a search engine reading the index files in given directory"""
+
+    engine = SearchEngine("TR", scorer=scorer)
+    engine.index_file = str(directory / "index.json")
+    engine.binary_index_file = str(directory / "index.bin")
+    engine.version_file = str(directory / "index.version.json")
+
+    return engine
+
+
+@pytest.fixture
+def index_dir(tmp_path: Path) -> Path:
+
+    write_index(tmp_path, ENTRIES, version=1)
+
+    return tmp_path
+
+
+@pytest.mark.parametrize("scorer", ["bm25", "regex"])
+def test_best_match_is_ranked_first(index_dir: Path, scorer: str) -> None:
+
+    engine = make_engine(index_dir, scorer)
+
+    top: str = list(engine.where("tüketici fiyat endeksi", n=3, verbose=False))[0]
+
+    assert top.startswith("TP.FG.J0")
+    assert list(engine.where("euro döviz kuru", n=3, verbose=False))[0] == "TP.DK.EUR.A"
+
+
+def test_bm25_and_regex_agree_on_the_matches(index_dir: Path) -> None:
+
+    bm25 = make_engine(index_dir, "bm25").where("faiz oranı", n=10, verbose=False)
+    regex = make_engine(index_dir, "regex").where("faiz oranı", n=10, verbose=False)
+
+    assert set(bm25) == set(regex) == {"TP.MEV.FAIZ", "TP.KRD.FAIZ"}
+
+
+def test_binary_index_round_trip(index_dir: Path) -> None:
+
+    entries, mapped = InvertedIndex.load(index_dir / "index.bin")
+    built = InvertedIndex.from_entries(ENTRIES)
+
+    # the binary index keeps every field as a string.
+    assert {key: list(entries[key]) for key in entries} == {
+        key: [str(field) for field in info] for key, info in ENTRIES.items()
+    }
+    assert len(mapped) == len(built) == len(ENTRIES)
+    assert mapped.score("döviz kuru") == built.score("döviz kuru")
+
+
+def test_binary_index_is_used_when_present(index_dir: Path) -> None:
+
+    engine = make_engine(index_dir)
+    engine.where("döviz", verbose=False)
+
+    assert not isinstance(engine.index, dict)
+
+
+def test_index_is_hot_reloaded_when_its_version_changes(index_dir: Path) -> None:
+
+    engine = make_engine(index_dir)
+    assert "TP.ALTIN" not in engine.where("altın", verbose=False)
+
+    updated: dict[str, list] = dict(ENTRIES)
+    updated["TP.ALTIN"] = [
+        "Külçe Altın Satış Fiyatı",
+        "İŞ GÜNÜ",
+        "02-01-1995",
+        "30-05-2025",
+        2,
+        "bie_altin",
+    ]
+    write_index(index_dir, updated, version=2)
+
+    assert list(engine.where("altın", verbose=False)) == ["TP.ALTIN"]
+    assert engine.index_version == ("version", 2)
+
+
+def test_facet_filters(index_dir: Path) -> None:
+
+    engine = make_engine(index_dir)
+
+    assert set(engine.where("faiz", verbose=False, active_after="01-01-2020")) == {"TP.KRD.FAIZ"}
+    assert set(engine.where("fiyat endeksi", verbose=False, category=2) or {}) == set()
+    assert set(engine.where("kuru", verbose=False, frequency="iş günü")) == {
+        "TP.DK.USD.A",
+        "TP.DK.EUR.A",
+    }
+    assert "TP.DK.USD.S.ESKI" not in engine.where("satış kuru", verbose=False)
+    assert "TP.DK.USD.S.ESKI" in engine.where("satış kuru", verbose=False, archived=True)
+
+
+def test_filtered_results_equal_post_filtered_rankings(index_dir: Path) -> None:
+
+    engine = make_engine(index_dir)
+    full = engine.where("döviz kuru", verbose=False, archived=True)
+    filtered = engine.where("döviz kuru", verbose=False, archived=True, frequency="GÜNLÜK")
+
+    assert list(filtered) == [key for key in full if ENTRIES[key][1] == "GÜNLÜK"]
+
+
+def test_typo_tolerant_search(index_dir: Path) -> None:
+
+    engine = make_engine(index_dir)
 
-#! to be impelemented as old tests become too complicated
\ No newline at end of file
+    assert list(engine.where("mevdut faiz", n=1, verbose=False)) == ["TP.MEV.FAIZ"]
+    assert list(engine.where("tüketci", n=2, verbose=False)) == ["TP.FG.J0", "TP.FG.J01"]
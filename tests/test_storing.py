@@ -0,0 +1,39 @@
+from pathlib import Path
+import multiprocessing
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, str(Path.cwd()))
+
+from evdsts.base.storing import SeriesStore
+
+
+def save_series(directory: str, names: list[str]) -> None:
+    """Stores a frame for each name in a separate process"""
+
+    store: SeriesStore = SeriesStore(directory)
+    index: pd.DatetimeIndex = pd.date_range("2020-01-31", periods=12, freq="ME", name="Date")
+    for name in names:
+        df: pd.DataFrame = pd.DataFrame({name: range(12)}, index=index, dtype="float32")
+        store.save(store.make_key(dict(series=name)), df, dict(series=name), "01-01-2020")
+
+
+def test_processes_sharing_a_store_keep_each_others_entries(tmp_path: Path) -> None:
+
+    context = multiprocessing.get_context("spawn")
+    workers: list = [
+        context.Process(
+            target=save_series, args=(str(tmp_path), [f"TP.W{worker}.{n}" for n in range(20)])
+        )
+        for worker in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    store: SeriesStore = SeriesStore(tmp_path)
+    assert len(store) == 80
+    loaded = store.load(store.make_key(dict(series="TP.W3.19")))
+    assert loaded is not None and loaded[0]["TP.W3.19"].iat[-1] == 11
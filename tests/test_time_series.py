@@ -0,0 +1,68 @@
+from pathlib import Path
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path.cwd()))
+
+from evdsts.utils.time_series import create_ts_index_from_unixtime, crete_ts_index
+
+# observation dates (Tarih) as EVDS returns them and the days they are stamped (UNIXTIME) at.
+OBSERVATIONS: dict[str, list[tuple[str, datetime]]] = {
+    "daily": [(f"0{day}-01-2020", datetime(2020, 1, day)) for day in range(1, 8)],
+    "bdaily": [
+        (f"{day:02d}-01-2020", datetime(2020, 1, day)) for day in (2, 3, 6, 7, 8, 9, 10, 13)
+    ],
+    "weekly": [(f"{day:02d}-01-2020", datetime(2020, 1, day)) for day in (3, 10, 17, 24, 31)],
+    "semimonthly": [
+        ("15-01-2020", datetime(2020, 1, 15)),
+        ("31-01-2020", datetime(2020, 1, 31)),
+        ("15-02-2020", datetime(2020, 2, 15)),
+        ("29-02-2020", datetime(2020, 2, 29)),
+    ],
+    "monthly": [(f"2020-{month}", datetime(2020, month, 1)) for month in range(1, 13)],
+    "quarterly": [
+        (f"{year}-Q{quarter}", datetime(year, quarter * 3 - 2, 1))
+        for year in (2020, 2021)
+        for quarter in (1, 2, 3, 4)
+    ],
+    "semiyearly": [
+        ("2019-S2", datetime(2019, 7, 1)),
+        ("2020-S1", datetime(2020, 1, 1)),
+        ("2020-S2", datetime(2020, 7, 1)),
+        ("2021-S1", datetime(2021, 1, 1)),
+    ],
+    "yearly": [(str(year), datetime(year, 1, 1)) for year in range(2015, 2021)],
+}
+
+
+def unixtime(day: datetime) -> dict[str, str]:
+    """EVDS stamps the observations at midnight in Turkey"""
+
+    stamp: datetime = day.replace(tzinfo=timezone(timedelta(hours=3)))
+    return {"$numberLong": str(int(stamp.timestamp()))}
+
+
+@pytest.mark.parametrize("frequency", list(OBSERVATIONS))
+def test_regex_and_unixtime_indexes_are_the_same(frequency: str) -> None:
+
+    dates: list[str] = [date for date, _ in OBSERVATIONS[frequency]]
+    unixtimes: list[dict[str, str]] = [unixtime(day) for _, day in OBSERVATIONS[frequency]]
+
+    from_dates: pd.DatetimeIndex = crete_ts_index(pd.DataFrame({"Tarih": dates}), "greedy")
+    sniffed: pd.DatetimeIndex = create_ts_index_from_unixtime(unixtimes, dates)
+    requested: pd.DatetimeIndex = create_ts_index_from_unixtime(unixtimes, frequency=frequency)
+
+    assert len(from_dates) == len(dates)
+    assert list(from_dates) == list(sniffed) == list(requested)
+    assert from_dates.freqstr == sniffed.freqstr == requested.freqstr
+
+
+def test_semiyearly_observations_are_stamped_at_half_year_ends() -> None:
+
+    dates: list[str] = [date for date, _ in OBSERVATIONS["semiyearly"]]
+    index: pd.DatetimeIndex = crete_ts_index(pd.DataFrame({"Tarih": dates}), "greedy")
+
+    assert [(day.month, day.day) for day in index] == [(12, 31), (6, 30), (12, 31), (6, 30)]